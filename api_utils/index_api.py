@@ -24,7 +24,7 @@ class IndexingRequest(BaseModel):
     init: bool = True
     verbose: bool = False
     resume: Optional[str] = None
-    update_index_id: Optional[str] = False
+    update_index_id: Optional[str] = None
     memprofile: bool = False
     nocache: bool = False
     reporter: Optional[str] = "print"
@@ -117,6 +117,8 @@ class CommandRunner:
             "print",
             "--config" if request.config_filepath else "",
             "--resume" if request.resume else "",
+            "--update-index" if request.update_index_id else "",
+            request.update_index_id or "",
             "--emit" if request.emit else "",
         ]
         command = [arg for arg in command if arg]  # Remove empty strings
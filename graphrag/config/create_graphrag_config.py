@@ -19,6 +19,7 @@ from .enums import (
     InputFileType,
     InputType,
     LLMType,
+    RateLimiterType,
     ReportingType,
     StorageType,
     TextEmbeddingTarget,
@@ -102,6 +103,24 @@ def create_graphrag_config(
             sleep_on_rate_limit = reader.bool(Fragment.sleep_recommendation)
             if sleep_on_rate_limit is None:
                 sleep_on_rate_limit = base.sleep_on_rate_limit_recommendation
+            adaptive_concurrency = reader.bool(Fragment.adaptive_concurrency)
+            if adaptive_concurrency is None:
+                adaptive_concurrency = base.adaptive_concurrency
+            minute_aligned_rate_limits = reader.bool("minute_aligned_rate_limits")
+            if minute_aligned_rate_limits is None:
+                minute_aligned_rate_limits = base.minute_aligned_rate_limits
+            rate_limiter_type = reader.str(Fragment.rate_limiter_type)
+            rate_limiter_type = (
+                RateLimiterType(rate_limiter_type)
+                if rate_limiter_type
+                else base.rate_limiter_type
+            )
+            http2 = reader.bool(Fragment.http2)
+            if http2 is None:
+                http2 = base.http2
+            batch_mode = reader.bool(Fragment.batch_mode)
+            if batch_mode is None:
+                batch_mode = base.batch_mode
 
             return LLMParameters(
                 api_key=api_key,
@@ -131,6 +150,19 @@ def create_graphrag_config(
                 sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
                 concurrent_requests=reader.int(Fragment.concurrent_requests)
                 or base.concurrent_requests,
+                adaptive_concurrency=adaptive_concurrency,
+                minute_aligned_rate_limits=minute_aligned_rate_limits,
+                rate_limiter_type=rate_limiter_type,
+                http2=http2,
+                max_connections=reader.int(Fragment.max_connections)
+                or base.max_connections,
+                batch_mode=batch_mode,
+                batch_max_requests=reader.int(Fragment.batch_max_requests)
+                or base.batch_max_requests,
+                batch_poll_interval=reader.float(Fragment.batch_poll_interval)
+                or base.batch_poll_interval,
+                max_concurrent_requests=reader.int(Fragment.max_concurrent_requests)
+                or base.max_concurrent_requests,
             )
 
     def hydrate_embeddings_params(
@@ -175,6 +207,24 @@ def create_graphrag_config(
             sleep_on_rate_limit = reader.bool(Fragment.sleep_recommendation)
             if sleep_on_rate_limit is None:
                 sleep_on_rate_limit = base.sleep_on_rate_limit_recommendation
+            adaptive_concurrency = reader.bool(Fragment.adaptive_concurrency)
+            if adaptive_concurrency is None:
+                adaptive_concurrency = base.adaptive_concurrency
+            minute_aligned_rate_limits = reader.bool("minute_aligned_rate_limits")
+            if minute_aligned_rate_limits is None:
+                minute_aligned_rate_limits = base.minute_aligned_rate_limits
+            rate_limiter_type = reader.str(Fragment.rate_limiter_type)
+            rate_limiter_type = (
+                RateLimiterType(rate_limiter_type)
+                if rate_limiter_type
+                else base.rate_limiter_type
+            )
+            http2 = reader.bool(Fragment.http2)
+            if http2 is None:
+                http2 = base.http2
+            batch_mode = reader.bool(Fragment.batch_mode)
+            if batch_mode is None:
+                batch_mode = base.batch_mode
 
             return LLMParameters(
                 api_key=api_key,
@@ -198,6 +248,19 @@ def create_graphrag_config(
                 sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
                 concurrent_requests=reader.int(Fragment.concurrent_requests)
                 or defs.LLM_CONCURRENT_REQUESTS,
+                adaptive_concurrency=adaptive_concurrency,
+                minute_aligned_rate_limits=minute_aligned_rate_limits,
+                rate_limiter_type=rate_limiter_type,
+                http2=http2,
+                max_connections=reader.int(Fragment.max_connections)
+                or base.max_connections,
+                batch_mode=batch_mode,
+                batch_max_requests=reader.int(Fragment.batch_max_requests)
+                or base.batch_max_requests,
+                batch_poll_interval=reader.float(Fragment.batch_poll_interval)
+                or base.batch_poll_interval,
+                max_concurrent_requests=reader.int(Fragment.max_concurrent_requests)
+                or base.max_concurrent_requests,
             )
 
     def hydrate_parallelization_params(
@@ -253,6 +316,24 @@ def create_graphrag_config(
                 sleep_on_rate_limit = reader.bool(Fragment.sleep_recommendation)
                 if sleep_on_rate_limit is None:
                     sleep_on_rate_limit = defs.LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION
+                adaptive_concurrency = reader.bool(Fragment.adaptive_concurrency)
+                if adaptive_concurrency is None:
+                    adaptive_concurrency = defs.LLM_ADAPTIVE_CONCURRENCY
+                minute_aligned_rate_limits = reader.bool("minute_aligned_rate_limits")
+                if minute_aligned_rate_limits is None:
+                    minute_aligned_rate_limits = defs.LLM_MINUTE_ALIGNED_RATE_LIMITS
+                rate_limiter_type = reader.str(Fragment.rate_limiter_type)
+                rate_limiter_type = (
+                    RateLimiterType(rate_limiter_type)
+                    if rate_limiter_type
+                    else defs.LLM_RATE_LIMITER_TYPE
+                )
+                http2 = reader.bool(Fragment.http2)
+                if http2 is None:
+                    http2 = defs.LLM_HTTP2
+                batch_mode = reader.bool(Fragment.batch_mode)
+                if batch_mode is None:
+                    batch_mode = defs.LLM_BATCH_MODE
 
                 llm_model = LLMParameters(
                     api_key=api_key,
@@ -283,6 +364,19 @@ def create_graphrag_config(
                     sleep_on_rate_limit_recommendation=sleep_on_rate_limit,
                     concurrent_requests=reader.int(Fragment.concurrent_requests)
                     or defs.LLM_CONCURRENT_REQUESTS,
+                    adaptive_concurrency=adaptive_concurrency,
+                    minute_aligned_rate_limits=minute_aligned_rate_limits,
+                    rate_limiter_type=rate_limiter_type,
+                    http2=http2,
+                    max_connections=reader.int(Fragment.max_connections)
+                    or defs.LLM_MAX_CONNECTIONS,
+                    batch_mode=batch_mode,
+                    batch_max_requests=reader.int(Fragment.batch_max_requests)
+                    or defs.LLM_BATCH_MAX_REQUESTS,
+                    batch_poll_interval=reader.float(Fragment.batch_poll_interval)
+                    or defs.LLM_BATCH_POLL_INTERVAL,
+                    max_concurrent_requests=reader.int(Fragment.max_concurrent_requests)
+                    or defs.LLM_MAX_CONCURRENT_REQUESTS,
                 )
             with reader.use(values.get("parallelization")):
                 llm_parallelization_model = ParallelizationParameters(
@@ -353,12 +447,23 @@ def create_graphrag_config(
             )
         with reader.envvar_prefix(Section.cache), reader.use(values.get("cache")):
             c_type = reader.str(Fragment.type)
+            memory_max_entries = reader.int("memory_max_entries")
+            if memory_max_entries is None:
+                memory_max_entries = defs.CACHE_MEMORY_MAX_ENTRIES
+            memory_max_bytes = reader.int("memory_max_bytes")
+            if memory_max_bytes is None:
+                memory_max_bytes = defs.CACHE_MEMORY_MAX_BYTES
             cache_model = CacheConfig(
                 type=CacheType(c_type) if c_type else defs.CACHE_TYPE,
                 connection_string=reader.str(Fragment.conn_string),
                 storage_account_blob_url=reader.str(Fragment.storage_account_blob_url),
                 container_name=reader.str(Fragment.container_name),
                 base_dir=reader.str(Fragment.base_dir) or defs.CACHE_BASE_DIR,
+                max_bytes=reader.int("max_bytes") or defs.CACHE_MAX_BYTES,
+                ttl=reader.int("ttl") or defs.CACHE_TTL,
+                memory_max_entries=memory_max_entries,
+                memory_max_bytes=memory_max_bytes,
+                write_behind=reader.bool("write_behind") or defs.CACHE_WRITE_BEHIND,
             )
         with (
             reader.envvar_prefix(Section.reporting),
@@ -385,12 +490,19 @@ def create_graphrag_config(
             group_by_columns = reader.list("group_by_columns", "BY_COLUMNS")
             if group_by_columns is None:
                 group_by_columns = defs.CHUNK_GROUP_BY_COLUMNS
+            dedup = reader.bool("dedup")
+            if dedup is None:
+                dedup = defs.CHUNK_DEDUP
 
             chunks_model = ChunkingConfig(
                 size=reader.int("size") or defs.CHUNK_SIZE,
                 overlap=reader.int("overlap") or defs.CHUNK_OVERLAP,
                 group_by_columns=group_by_columns,
                 encoding_model=reader.str(Fragment.encoding_model),
+                num_threads=reader.int("num_threads", Fragment.thread_count),
+                dedup=dedup,
+                dedup_threshold=reader.float("dedup_threshold")
+                or defs.CHUNK_DEDUP_THRESHOLD,
             )
         with (
             reader.envvar_prefix(Section.snapshot),
@@ -418,6 +530,12 @@ def create_graphrag_config(
                 if max_gleanings is not None
                 else defs.ENTITY_EXTRACTION_MAX_GLEANINGS
             )
+            adaptive_gleaning = reader.bool(Fragment.adaptive_gleaning)
+            if adaptive_gleaning is None:
+                adaptive_gleaning = defs.ENTITY_EXTRACTION_ADAPTIVE_GLEANING
+            stream_output = reader.bool("stream_output")
+            if stream_output is None:
+                stream_output = defs.ENTITY_EXTRACTION_STREAM_OUTPUT
 
             entity_extraction_model = EntityExtractionConfig(
                 llm=hydrate_llm_params(entity_extraction_config, llm_model),
@@ -428,6 +546,8 @@ def create_graphrag_config(
                 entity_types=reader.list("entity_types")
                 or defs.ENTITY_EXTRACTION_ENTITY_TYPES,
                 max_gleanings=max_gleanings,
+                adaptive_gleaning=adaptive_gleaning,
+                stream_output=stream_output,
                 prompt=reader.str("prompt", Fragment.prompt_file),
                 strategy=entity_extraction_config.get("strategy"),
                 encoding_model=reader.str(Fragment.encoding_model),
@@ -442,6 +562,9 @@ def create_graphrag_config(
             max_gleanings = (
                 max_gleanings if max_gleanings is not None else defs.CLAIM_MAX_GLEANINGS
             )
+            adaptive_gleaning = reader.bool(Fragment.adaptive_gleaning)
+            if adaptive_gleaning is None:
+                adaptive_gleaning = defs.CLAIM_ADAPTIVE_GLEANING
             claim_extraction_model = ClaimExtractionConfig(
                 enabled=reader.bool(Fragment.enabled) or defs.CLAIM_EXTRACTION_ENABLED,
                 llm=hydrate_llm_params(claim_extraction_config, llm_model),
@@ -452,6 +575,7 @@ def create_graphrag_config(
                 description=reader.str("description") or defs.CLAIM_DESCRIPTION,
                 prompt=reader.str("prompt", Fragment.prompt_file),
                 max_gleanings=max_gleanings,
+                adaptive_gleaning=adaptive_gleaning,
                 encoding_model=reader.str(Fragment.encoding_model),
             )
 
@@ -543,6 +667,12 @@ def create_graphrag_config(
 
         encoding_model = reader.str(Fragment.encoding_model) or defs.ENCODING_MODEL
         skip_workflows = reader.list("skip_workflows") or []
+        max_concurrent_workflows = (
+            reader.int("max_concurrent_workflows") or defs.MAX_CONCURRENT_WORKFLOWS
+        )
+        table_registry_max_bytes = reader.int("table_registry_max_bytes")
+        if table_registry_max_bytes is None:
+            table_registry_max_bytes = defs.TABLE_REGISTRY_MAX_BYTES
 
     return GraphRagConfig(
         root_dir=root_dir,
@@ -565,6 +695,8 @@ def create_graphrag_config(
         cluster_graph=cluster_graph_model,
         encoding_model=encoding_model,
         skip_workflows=skip_workflows,
+        max_concurrent_workflows=max_concurrent_workflows,
+        table_registry_max_bytes=table_registry_max_bytes,
         local_search=local_search_model,
         global_search=global_search_model,
     )
@@ -573,6 +705,7 @@ def create_graphrag_config(
 class Fragment(str, Enum):
     """Configuration Fragments."""
 
+    adaptive_concurrency = "ADAPTIVE_CONCURRENCY"
     api_base = "API_BASE"
     api_key = "API_KEY"
     api_version = "API_VERSION"
@@ -580,6 +713,9 @@ class Fragment(str, Enum):
     api_proxy = "API_PROXY"
     async_mode = "ASYNC_MODE"
     base_dir = "BASE_DIR"
+    batch_max_requests = "BATCH_MAX_REQUESTS"
+    batch_mode = "BATCH_MODE"
+    batch_poll_interval = "BATCH_POLL_INTERVAL"
     cognitive_services_endpoint = "COGNITIVE_SERVICES_ENDPOINT"
     concurrent_requests = "CONCURRENT_REQUESTS"
     conn_string = "CONNECTION_STRING"
@@ -590,7 +726,11 @@ class Fragment(str, Enum):
     encoding = "ENCODING"
     encoding_model = "ENCODING_MODEL"
     file_type = "FILE_TYPE"
+    http2 = "HTTP2"
+    max_concurrent_requests = "MAX_CONCURRENT_REQUESTS"
+    max_connections = "MAX_CONNECTIONS"
     max_gleanings = "MAX_GLEANINGS"
+    adaptive_gleaning = "ADAPTIVE_GLEANING"
     max_length = "MAX_LENGTH"
     max_retries = "MAX_RETRIES"
     max_retry_wait = "MAX_RETRY_WAIT"
@@ -601,6 +741,7 @@ class Fragment(str, Enum):
     model = "MODEL"
     model_supports_json = "MODEL_SUPPORTS_JSON"
     prompt_file = "PROMPT_FILE"
+    rate_limiter_type = "RATE_LIMITER_TYPE"
     request_timeout = "REQUEST_TIMEOUT"
     rpm = "REQUESTS_PER_MINUTE"
     sleep_recommendation = "SLEEP_ON_RATE_LIMIT_RECOMMENDATION"
@@ -10,6 +10,7 @@ from .enums import (
     InputFileType,
     InputType,
     LLMType,
+    RateLimiterType,
     ReportingType,
     StorageType,
     TextEmbeddingTarget,
@@ -17,6 +18,8 @@ from .enums import (
 
 ASYNC_MODE = AsyncType.Threaded
 ENCODING_MODEL = "cl100k_base"
+MAX_CONCURRENT_WORKFLOWS = 1
+TABLE_REGISTRY_MAX_BYTES = 1024 * 1024 * 1024
 #
 # LLM Parameters
 #
@@ -29,10 +32,19 @@ LLM_N = 1
 LLM_REQUEST_TIMEOUT = 180.0
 LLM_TOKENS_PER_MINUTE = 0
 LLM_REQUESTS_PER_MINUTE = 0
+LLM_MINUTE_ALIGNED_RATE_LIMITS = False
+LLM_RATE_LIMITER_TYPE = RateLimiterType.local
+LLM_HTTP2 = False
+LLM_MAX_CONNECTIONS = 100
+LLM_BATCH_MODE = False
+LLM_BATCH_MAX_REQUESTS = 10_000
+LLM_BATCH_POLL_INTERVAL = 30.0
 LLM_MAX_RETRIES = 10
 LLM_MAX_RETRY_WAIT = 10.0
 LLM_SLEEP_ON_RATE_LIMIT_RECOMMENDATION = True
 LLM_CONCURRENT_REQUESTS = 25
+LLM_ADAPTIVE_CONCURRENCY = False
+LLM_MAX_CONCURRENT_REQUESTS = 100
 
 #
 # Text Embedding Parameters
@@ -45,19 +57,29 @@ EMBEDDING_TARGET = TextEmbeddingTarget.required
 
 CACHE_TYPE = CacheType.file
 CACHE_BASE_DIR = "cache"
+CACHE_MAX_BYTES = 0
+CACHE_TTL = 0
+CACHE_MEMORY_MAX_ENTRIES = 10_000
+CACHE_MEMORY_MAX_BYTES = 256 * 1024 * 1024
+CACHE_WRITE_BEHIND = False
 CHUNK_SIZE = 1200
 CHUNK_OVERLAP = 100
 CHUNK_GROUP_BY_COLUMNS = ["id"]
+CHUNK_DEDUP = False
+CHUNK_DEDUP_THRESHOLD = 0.9
 CLAIM_DESCRIPTION = (
     "Any claims or facts that could be relevant to information discovery."
 )
 CLAIM_MAX_GLEANINGS = 1
+CLAIM_ADAPTIVE_GLEANING = False
 CLAIM_EXTRACTION_ENABLED = False
 MAX_CLUSTER_SIZE = 10
 COMMUNITY_REPORT_MAX_LENGTH = 2000
 COMMUNITY_REPORT_MAX_INPUT_LENGTH = 8000
 ENTITY_EXTRACTION_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 ENTITY_EXTRACTION_MAX_GLEANINGS = 1
+ENTITY_EXTRACTION_ADAPTIVE_GLEANING = False
+ENTITY_EXTRACTION_STREAM_OUTPUT = False
 INPUT_FILE_TYPE = InputFileType.text
 INPUT_TYPE = InputType.file
 INPUT_BASE_DIR = "input"
@@ -19,6 +19,8 @@ class CacheType(str, Enum):
     """The none cache configuration type."""
     blob = "blob"
     """The blob cache configuration type."""
+    sqlite = "sqlite"
+    """The sqlite cache configuration type."""
 
     def __repr__(self):
         """Get a string representation."""
@@ -81,6 +83,19 @@ class ReportingType(str, Enum):
         return f'"{self.value}"'
 
 
+class RateLimiterType(str, Enum):
+    """The rate limiter type of an LLM."""
+
+    local = "local"
+    """The limiter of each process enforces the rate limits on its own."""
+    shared = "shared"
+    """The processes on a host share the rate limits through shared memory."""
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
 class TextEmbeddingTarget(str, Enum):
     """The target to use for text embeddings."""
 
@@ -16,3 +16,8 @@ class CacheConfigInput(TypedDict):
     connection_string: NotRequired[str | None]
     container_name: NotRequired[str | None]
     storage_account_blob_url: NotRequired[str | None]
+    max_bytes: NotRequired[int | str | None]
+    ttl: NotRequired[int | str | None]
+    memory_max_entries: NotRequired[int | str | None]
+    memory_max_bytes: NotRequired[int | str | None]
+    write_behind: NotRequired[bool | str | None]
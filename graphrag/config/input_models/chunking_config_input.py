@@ -13,3 +13,6 @@ class ChunkingConfigInput(TypedDict):
     overlap: NotRequired[int | str | None]
     group_by_columns: NotRequired[list[str] | str | None]
     strategy: NotRequired[dict | None]
+    num_threads: NotRequired[int | str | None]
+    dedup: NotRequired[bool | str | None]
+    dedup_threshold: NotRequired[float | str | None]
@@ -15,5 +15,6 @@ class ClaimExtractionConfigInput(LLMConfigInput):
     prompt: NotRequired[str | None]
     description: NotRequired[str | None]
     max_gleanings: NotRequired[int | str | None]
+    adaptive_gleaning: NotRequired[bool | str | None]
     strategy: NotRequired[dict | None]
     encoding_model: NotRequired[str | None]
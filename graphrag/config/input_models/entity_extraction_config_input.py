@@ -14,5 +14,7 @@ class EntityExtractionConfigInput(LLMConfigInput):
     prompt: NotRequired[str | None]
     entity_types: NotRequired[list[str] | str | None]
     max_gleanings: NotRequired[int | str | None]
+    adaptive_gleaning: NotRequired[bool | str | None]
+    stream_output: NotRequired[bool | str | None]
     strategy: NotRequired[dict | None]
     encoding_model: NotRequired[str | None]
@@ -45,5 +45,7 @@ class GraphRagConfigInput(LLMConfigInput):
     umap: NotRequired[UmapConfigInput | None]
     encoding_model: NotRequired[str | None]
     skip_workflows: NotRequired[list[str] | str | None]
+    max_concurrent_workflows: NotRequired[int | str | None]
+    table_registry_max_bytes: NotRequired[int | str | None]
     local_search: NotRequired[LocalSearchConfigInput | None]
     global_search: NotRequired[GlobalSearchConfigInput | None]
@@ -5,7 +5,7 @@
 
 from typing_extensions import NotRequired, TypedDict
 
-from graphrag.config.enums import LLMType
+from graphrag.config.enums import LLMType, RateLimiterType
 
 
 class LLMParametersInput(TypedDict):
@@ -25,7 +25,16 @@ class LLMParametersInput(TypedDict):
     model_supports_json: NotRequired[bool | str | None]
     tokens_per_minute: NotRequired[int | str | None]
     requests_per_minute: NotRequired[int | str | None]
+    minute_aligned_rate_limits: NotRequired[bool | str | None]
+    rate_limiter_type: NotRequired[RateLimiterType | str | None]
+    http2: NotRequired[bool | str | None]
+    max_connections: NotRequired[int | str | None]
+    batch_mode: NotRequired[bool | str | None]
+    batch_max_requests: NotRequired[int | str | None]
+    batch_poll_interval: NotRequired[float | str | None]
     max_retries: NotRequired[int | str | None]
     max_retry_wait: NotRequired[float | str | None]
     sleep_on_rate_limit_recommendation: NotRequired[bool | str | None]
     concurrent_requests: NotRequired[int | str | None]
+    adaptive_concurrency: NotRequired[bool | str | None]
+    max_concurrent_requests: NotRequired[int | str | None]
@@ -27,3 +27,23 @@ class CacheConfig(BaseModel):
     storage_account_blob_url: str | None = Field(
         description="The storage account blob url to use.", default=None
     )
+    max_bytes: int = Field(
+        description="The maximum size of the sqlite cache in bytes, 0 for no limit.",
+        default=defs.CACHE_MAX_BYTES,
+    )
+    ttl: int = Field(
+        description="The number of seconds sqlite cache entries are kept, 0 for no expiry.",
+        default=defs.CACHE_TTL,
+    )
+    memory_max_entries: int = Field(
+        description="The number of entries kept in an in-memory tier in front of a persistent cache, 0 to disable the tier.",
+        default=defs.CACHE_MEMORY_MAX_ENTRIES,
+    )
+    memory_max_bytes: int = Field(
+        description="The maximum size of the in-memory tier in bytes, 0 for no limit.",
+        default=defs.CACHE_MEMORY_MAX_BYTES,
+    )
+    write_behind: bool = Field(
+        description="Whether writes to a persistent cache are buffered and written in batches.",
+        default=defs.CACHE_WRITE_BEHIND,
+    )
@@ -26,6 +26,18 @@ class ChunkingConfig(BaseModel):
     encoding_model: str | None = Field(
         default=None, description="The encoding model to use."
     )
+    dedup: bool = Field(
+        description="Whether to extract only one chunk of each set of near-duplicate chunks.",
+        default=defs.CHUNK_DEDUP,
+    )
+    dedup_threshold: float = Field(
+        description="The Jaccard similarity above which two chunks are near-duplicates.",
+        default=defs.CHUNK_DEDUP_THRESHOLD,
+    )
+    num_threads: int | None = Field(
+        default=None,
+        description="The number of threads chunking the documents, defaults to the number of CPUs.",
+    )
 
     def resolved_strategy(self, encoding_model: str) -> dict:
         """Get the resolved chunking strategy."""
@@ -29,6 +29,10 @@ class ClaimExtractionConfig(LLMConfig):
         description="The maximum number of entity gleanings to use.",
         default=defs.CLAIM_MAX_GLEANINGS,
     )
+    adaptive_gleaning: bool = Field(
+        description="Whether to decide per chunk whether to glean, from the yield of the earlier gleanings.",
+        default=defs.CLAIM_ADAPTIVE_GLEANING,
+    )
     strategy: dict | None = Field(
         description="The override strategy to use.", default=None
     )
@@ -53,5 +57,6 @@ class ClaimExtractionConfig(LLMConfig):
             else None,
             "claim_description": self.description,
             "max_gleanings": self.max_gleanings,
+            "adaptive_gleaning": self.adaptive_gleaning,
             "encoding_name": self.encoding_model or encoding_model,
         }
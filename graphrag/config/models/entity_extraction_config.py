@@ -26,6 +26,14 @@ class EntityExtractionConfig(LLMConfig):
         description="The maximum number of entity gleanings to use.",
         default=defs.ENTITY_EXTRACTION_MAX_GLEANINGS,
     )
+    adaptive_gleaning: bool = Field(
+        description="Whether to decide per chunk whether to glean, from the yield of the earlier gleanings.",
+        default=defs.ENTITY_EXTRACTION_ADAPTIVE_GLEANING,
+    )
+    stream_output: bool = Field(
+        description="Whether to stream the extraction output and parse its records as they are generated.",
+        default=defs.ENTITY_EXTRACTION_STREAM_OUTPUT,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy", default=None
     )
@@ -47,6 +55,8 @@ class EntityExtractionConfig(LLMConfig):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "adaptive_gleaning": self.adaptive_gleaning,
+            "stream_output": self.stream_output,
             # It's prechunked in create_base_text_units
             "encoding_name": self.encoding_model or encoding_model,
             "prechunked": True,
@@ -144,3 +144,15 @@ class GraphRagConfig(LLMConfig):
         description="The workflows to skip, usually for testing reasons.", default=[]
     )
     """The workflows to skip, usually for testing reasons."""
+
+    max_concurrent_workflows: int = Field(
+        description="The maximum number of independent workflows to run concurrently. A value of 1 runs the workflows sequentially.",
+        default=defs.MAX_CONCURRENT_WORKFLOWS,
+    )
+    """The maximum number of independent workflows to run concurrently. A value of 1 runs the workflows sequentially."""
+
+    table_registry_max_bytes: int = Field(
+        description="The number of bytes of recent workflow outputs to keep in memory for downstream workflows. 0 reads every upstream table back from storage.",
+        default=defs.TABLE_REGISTRY_MAX_BYTES,
+    )
+    """The number of bytes of recent workflow outputs to keep in memory for downstream workflows. 0 reads every upstream table back from storage."""
@@ -6,7 +6,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
 import graphrag.config.defaults as defs
-from graphrag.config.enums import LLMType
+from graphrag.config.enums import LLMType, RateLimiterType
 
 
 class LLMParameters(BaseModel):
@@ -69,6 +69,34 @@ class LLMParameters(BaseModel):
         description="The number of requests per minute to use for the LLM service.",
         default=defs.LLM_REQUESTS_PER_MINUTE,
     )
+    minute_aligned_rate_limits: bool = Field(
+        description="Whether the tokens and requests per minute budgets reset at the start of each minute, instead of refilling continuously.",
+        default=defs.LLM_MINUTE_ALIGNED_RATE_LIMITS,
+    )
+    rate_limiter_type: RateLimiterType = Field(
+        description="The rate limiter type, shared limiters coordinate the tokens and requests per minute of all the processes on the host.",
+        default=defs.LLM_RATE_LIMITER_TYPE,
+    )
+    http2: bool = Field(
+        description="Whether to use HTTP/2 for the LLM service, requires the h2 package.",
+        default=defs.LLM_HTTP2,
+    )
+    max_connections: int = Field(
+        description="The maximum number of pooled connections to the LLM service, shared by all the LLMs of the same endpoint.",
+        default=defs.LLM_MAX_CONNECTIONS,
+    )
+    batch_mode: bool = Field(
+        description="Whether to submit the chat requests of the indexing verbs to the batch API instead of sending them one by one.",
+        default=defs.LLM_BATCH_MODE,
+    )
+    batch_max_requests: int = Field(
+        description="The maximum number of requests in a batch.",
+        default=defs.LLM_BATCH_MAX_REQUESTS,
+    )
+    batch_poll_interval: float = Field(
+        description="The number of seconds between two status checks of a batch.",
+        default=defs.LLM_BATCH_POLL_INTERVAL,
+    )
     max_retries: int = Field(
         description="The maximum number of retries to use for the LLM service.",
         default=defs.LLM_MAX_RETRIES,
@@ -85,3 +113,11 @@ class LLMParameters(BaseModel):
         description="Whether to use concurrent requests for the LLM service.",
         default=defs.LLM_CONCURRENT_REQUESTS,
     )
+    adaptive_concurrency: bool = Field(
+        description="Whether to adapt the number of concurrent requests to the latency and rate limit errors of the LLM service, starting from concurrent_requests.",
+        default=defs.LLM_ADAPTIVE_CONCURRENCY,
+    )
+    max_concurrent_requests: int = Field(
+        description="The maximum number of concurrent requests when the concurrency is adaptive.",
+        default=defs.LLM_MAX_CONCURRENT_REQUESTS,
+    )
@@ -88,6 +88,11 @@ if __name__ == "__main__":
         default=None,
         type=str,
     )
+    parser.add_argument(
+        "--compact-cache",
+        help="Evict expired and over-budget entries from the sqlite cache and shrink its file, then exit",
+        action="store_true",
+    )
     args = parser.parse_args()
 
     if args.resume and args.update_index:
@@ -107,4 +112,5 @@ if __name__ == "__main__":
         dryrun=args.dryrun,
         init=args.init,
         skip_validations=args.skip_validations,
+        compact_cache=args.compact_cache,
     )
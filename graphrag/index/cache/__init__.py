@@ -8,11 +8,16 @@ from .load_cache import load_cache
 from .memory_pipeline_cache import InMemoryCache
 from .noop_pipeline_cache import NoopPipelineCache
 from .pipeline_cache import PipelineCache
+from .sqlite_pipeline_cache import SqlitePipelineCache
+from .tiered_pipeline_cache import CacheStats, TieredPipelineCache
 
 __all__ = [
+    "CacheStats",
     "InMemoryCache",
     "JsonPipelineCache",
     "NoopPipelineCache",
     "PipelineCache",
+    "SqlitePipelineCache",
+    "TieredPipelineCache",
     "load_cache",
 ]
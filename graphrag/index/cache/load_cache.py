@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from graphrag.config.enums import CacheType
 from graphrag.index.config.cache import (
     PipelineBlobCacheConfig,
     PipelineFileCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.storage import BlobPipelineStorage, FilePipelineStorage
 
@@ -22,10 +24,17 @@ if TYPE_CHECKING:
 from .json_pipeline_cache import JsonPipelineCache
 from .memory_pipeline_cache import create_memory_cache
 from .noop_pipeline_cache import NoopPipelineCache
+from .pipeline_cache import PipelineCache
+from .sqlite_pipeline_cache import SQLITE_CACHE_FILENAME, create_sqlite_cache
+from .tiered_pipeline_cache import TieredPipelineCache
 
 
 def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
-    """Load the cache from the given config."""
+    """Load the cache from the given config.
+
+    File, blob and sqlite caches are wrapped in an in-memory tier when
+    memory_max_entries is set.
+    """
     if config is None:
         return NoopPipelineCache()
 
@@ -37,7 +46,7 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
         case CacheType.file:
             config = cast(PipelineFileCacheConfig, config)
             storage = FilePipelineStorage(root_dir).child(config.base_dir)
-            return JsonPipelineCache(storage)
+            return _with_memory_tier(JsonPipelineCache(storage), config)
         case CacheType.blob:
             config = cast(PipelineBlobCacheConfig, config)
             storage = BlobPipelineStorage(
@@ -45,7 +54,31 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
                 config.container_name,
                 storage_account_blob_url=config.storage_account_blob_url,
             ).child(config.base_dir)
-            return JsonPipelineCache(storage)
+            return _with_memory_tier(JsonPipelineCache(storage), config)
+        case CacheType.sqlite:
+            config = cast(PipelineSqliteCacheConfig, config)
+            # entries of a previous file cache in the same directory are imported
+            cache_dir = Path(root_dir or "") / (config.base_dir or "")
+            cache = create_sqlite_cache(
+                cache_dir / SQLITE_CACHE_FILENAME,
+                max_bytes=config.max_bytes,
+                ttl=config.ttl,
+                import_dir=cache_dir,
+            )
+            return _with_memory_tier(cache, config)
         case _:
             msg = f"Unknown cache type: {config.type}"
             raise ValueError(msg)
+
+
+def _with_memory_tier(
+    cache: PipelineCache, config: PipelineCacheConfig
+) -> PipelineCache:
+    if config.memory_max_entries <= 0:
+        return cache
+    return TieredPipelineCache(
+        cache,
+        max_entries=config.memory_max_entries,
+        max_bytes=config.memory_max_bytes,
+        write_behind=config.write_behind,
+    )
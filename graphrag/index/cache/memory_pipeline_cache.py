@@ -3,21 +3,33 @@
 
 """A module containing 'InMemoryCache' model."""
 
+from collections import OrderedDict
 from typing import Any
 
 from .pipeline_cache import PipelineCache
 
 
 class InMemoryCache(PipelineCache):
-    """In memory cache class definition."""
+    """In memory cache class definition.
 
-    _cache: dict[str, Any]
-    _name: str
+    Children share the entries of their parent under a prefixed key. When
+    max_entries is set, the least recently used entries are evicted.
+    """
 
-    def __init__(self, name: str | None = None):
+    _cache: OrderedDict[str, Any]
+    _name: str
+    _max_entries: int
+
+    def __init__(
+        self,
+        name: str | None = None,
+        max_entries: int = 0,
+        _cache: OrderedDict[str, Any] | None = None,
+    ):
         """Init method definition."""
-        self._cache = {}
+        self._cache = _cache if _cache is not None else OrderedDict()
         self._name = name or ""
+        self._max_entries = max_entries
 
     async def get(self, key: str) -> Any:
         """Get the value for the given key.
@@ -31,6 +43,8 @@ class InMemoryCache(PipelineCache):
             - output - The value for the given key.
         """
         key = self._create_cache_key(key)
+        if key in self._cache:
+            self._cache.move_to_end(key)
         return self._cache.get(key)
 
     async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
@@ -42,6 +56,9 @@ class InMemoryCache(PipelineCache):
         """
         key = self._create_cache_key(key)
         self._cache[key] = value
+        self._cache.move_to_end(key)
+        while self._max_entries > 0 and len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
 
     async def has(self, key: str) -> bool:
         """Return True if the given key exists in the storage.
@@ -63,21 +80,27 @@ class InMemoryCache(PipelineCache):
             - key - The key to delete.
         """
         key = self._create_cache_key(key)
-        del self._cache[key]
+        self._cache.pop(key, None)
 
     async def clear(self) -> None:
         """Clear the storage."""
-        self._cache.clear()
+        if self._name == "":
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key.startswith(self._name)]:
+            del self._cache[key]
 
     def child(self, name: str) -> PipelineCache:
         """Create a sub cache with the given name."""
-        return InMemoryCache(name)
+        return InMemoryCache(
+            f"{self._name}{name}/", max_entries=self._max_entries, _cache=self._cache
+        )
 
     def _create_cache_key(self, key: str) -> str:
         """Create a cache key for the given key."""
         return f"{self._name}{key}"
 
 
-def create_memory_cache() -> PipelineCache:
+def create_memory_cache(max_entries: int = 0) -> PipelineCache:
     """Create a memory cache."""
-    return InMemoryCache()
+    return InMemoryCache(max_entries=max_entries)
@@ -65,3 +65,6 @@ class PipelineCache(metaclass=ABCMeta):
         Args:
             - name - The name to create the sub cache with.
         """
+
+    async def flush(self) -> None:
+        """Write any buffered entries to the underlying store."""
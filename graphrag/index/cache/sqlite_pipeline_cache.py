@@ -0,0 +1,408 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'SqlitePipelineCache' model."""
+
+import asyncio
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+SQLITE_CACHE_FILENAME = "cache.sqlite"
+DEFAULT_WRITE_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+_CacheKey = tuple[str, str]
+
+
+class SqliteCacheStore:
+    """A single-file key-value store shared by a sqlite cache and its children.
+
+    Writes, deletes and access times are buffered and written in one transaction
+    once the buffer is full, the flush interval has passed, or the process exits.
+    The total size of the values is kept up to date by the writes, so that the
+    eviction does not scan the table.
+    """
+
+    _path: Path
+    _max_bytes: int
+    _ttl: int
+    _write_batch_size: int
+    _connection: sqlite3.Connection
+    _lock: threading.RLock
+    _pending: dict[_CacheKey, tuple[str, float] | None]
+    _accessed: dict[_CacheKey, float]
+    _last_flush: float
+    _total_bytes: int
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = 0,
+        ttl: int = 0,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ):
+        """Open or create a cache store.
+
+        Args:
+            - path - The path of the database file.
+            - max_bytes - The maximum size of the cached values. 0 disables the cap.
+            - ttl - The number of seconds after which entries expire. 0 disables expiry.
+            - write_batch_size - The number of buffered changes that triggers a write.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self.is_new = not self._path.exists()
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._write_batch_size = write_batch_size
+        self._connection = sqlite3.connect(
+            self._path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_created_at ON cache (created_at)"
+        )
+        self._lock = threading.RLock()
+        self._pending = {}
+        self._accessed = {}
+        self._last_flush = time.monotonic()
+        self._total_bytes = self._sum_sizes()
+        atexit.register(self.flush)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self._ttl > 0 and created_at < time.time() - self._ttl
+
+    def get(self, key: _CacheKey) -> str | None:
+        """Get a value, or None if it is missing or expired."""
+        with self._lock:
+            if key in self._pending:
+                pending = self._pending[key]
+                return pending[0] if pending is not None else None
+
+            row = self._connection.execute(
+                "SELECT value, created_at FROM cache WHERE namespace = ? AND key = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            if self._is_expired(row[1]):
+                self._change(key, None)
+                return None
+
+            self._accessed[key] = time.time()
+            return row[0]
+
+    def set(self, key: _CacheKey, value: str) -> None:
+        """Set a value."""
+        with self._lock:
+            self._change(key, (value, time.time()))
+
+    def set_many(self, items: Iterable[tuple[_CacheKey, str]]) -> int:
+        """Set many values, and write them.
+
+        Returns
+        -------
+            - output - The number of values set.
+        """
+        num_items = 0
+        with self._lock:
+            for key, value in items:
+                self._change(key, (value, time.time()))
+                num_items += 1
+            self._flush()
+        return num_items
+
+    def delete(self, key: _CacheKey) -> None:
+        """Delete a value."""
+        with self._lock:
+            self._change(key, None)
+
+    def clear(self, namespace: str) -> None:
+        """Delete all the values of a namespace and its children."""
+        with self._lock:
+            self._flush()
+            self._connection.execute(
+                "DELETE FROM cache WHERE namespace = ? OR substr(namespace, 1, ?) = ?",
+                (namespace, len(namespace) + 1, f"{namespace}/"),
+            )
+            self._total_bytes = self._sum_sizes()
+
+    def flush(self) -> None:
+        """Write the buffered changes."""
+        with self._lock:
+            self._flush()
+
+    def compact(self) -> tuple[int, int]:
+        """Evict expired and over-budget entries and shrink the database file.
+
+        Returns
+        -------
+            - output - The file size in bytes before and after compaction.
+        """
+        with self._lock:
+            self._flush()
+            size_before = self._file_size()
+            self._connection.execute("BEGIN")
+            self._evict()
+            self._connection.execute("COMMIT")
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._connection.execute("VACUUM")
+            return size_before, self._file_size()
+
+    def _file_size(self) -> int:
+        return sum(
+            path.stat().st_size
+            for path in [
+                self._path,
+                self._path.with_name(f"{self._path.name}-wal"),
+            ]
+            if path.exists()
+        )
+
+    def _sum_sizes(self) -> int:
+        (total_bytes,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+        return total_bytes
+
+    def _stored_size(self, key: _CacheKey) -> int:
+        row = self._connection.execute(
+            "SELECT size FROM cache WHERE namespace = ? AND key = ?", key
+        ).fetchone()
+        return row[0] if row is not None else 0
+
+    def _change(self, key: _CacheKey, value: tuple[str, float] | None) -> None:
+        self._pending[key] = value
+        self._accessed.pop(key, None)
+        if (
+            len(self._pending) >= self._write_batch_size
+            or time.monotonic() - self._last_flush > DEFAULT_FLUSH_INTERVAL
+        ):
+            self._flush()
+
+    def _flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if len(self._pending) == 0 and len(self._accessed) == 0:
+            return
+
+        pending, self._pending = self._pending, {}
+        accessed, self._accessed = self._accessed, {}
+        total_bytes = self._total_bytes
+        self._connection.execute("BEGIN")
+        try:
+            for key, entry in pending.items():
+                self._total_bytes -= self._stored_size(key)
+                if entry is not None:
+                    self._total_bytes += len(entry[0].encode("utf-8"))
+            self._connection.executemany(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                [key for key, value in pending.items() if value is None],
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (*key, value, len(value.encode("utf-8")), timestamp, timestamp)
+                    for key, (value, timestamp) in (
+                        (key, entry)
+                        for key, entry in pending.items()
+                        if entry is not None
+                    )
+                ],
+            )
+            self._connection.executemany(
+                "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                [(timestamp, *key) for key, timestamp in accessed.items()],
+            )
+            self._evict()
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            self._total_bytes = total_bytes
+            raise
+        self._connection.execute("COMMIT")
+
+    def _evict(self) -> None:
+        if self._ttl > 0:
+            expired_before = time.time() - self._ttl
+            (expired_bytes,) = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache WHERE created_at < ?",
+                (expired_before,),
+            ).fetchone()
+            if expired_bytes > 0:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE created_at < ?", (expired_before,)
+                )
+                self._total_bytes -= expired_bytes
+        if self._max_bytes <= 0:
+            return
+
+        excess_bytes = self._total_bytes - self._max_bytes
+        if excess_bytes <= 0:
+            return
+
+        # Evict the least recently used entries until the cache is under budget
+        evicted = []
+        for rowid, size in self._connection.execute(
+            "SELECT rowid, size FROM cache ORDER BY accessed_at"
+        ):
+            evicted.append((rowid,))
+            excess_bytes -= size
+            self._total_bytes -= size
+            if excess_bytes <= 0:
+                break
+        self._connection.executemany("DELETE FROM cache WHERE rowid = ?", evicted)
+        log.info("evicted %d entries from the sqlite cache", len(evicted))
+
+
+class SqlitePipelineCache(PipelineCache):
+    """Sqlite pipeline cache class definition.
+
+    Entries are stored in a single database file, with child caches as namespaces.
+    Values use the same JSON format as the JsonPipelineCache files. The store is
+    called from a worker thread, so that its reads and writes don't block the
+    event loop.
+    """
+
+    _store: SqliteCacheStore
+    _namespace: str
+
+    def __init__(self, store: SqliteCacheStore, namespace: str = ""):
+        """Init method definition."""
+        self._store = store
+        self._namespace = namespace
+
+    async def get(self, key: str) -> str | None:
+        """Get method definition."""
+        data = await asyncio.to_thread(self._store.get, (self._namespace, key))
+        if data is None:
+            return None
+        try:
+            return json.loads(data).get("result")
+        except json.decoder.JSONDecodeError:
+            await asyncio.to_thread(self._store.delete, (self._namespace, key))
+            return None
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        data = {"result": value, **(debug_data or {})}
+        await asyncio.to_thread(
+            self._store.set,
+            (self._namespace, key),
+            json.dumps(data, ensure_ascii=False),
+        )
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        data = await asyncio.to_thread(self._store.get, (self._namespace, key))
+        return data is not None
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await asyncio.to_thread(self._store.delete, (self._namespace, key))
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await asyncio.to_thread(self._store.clear, self._namespace)
+
+    def child(self, name: str) -> "SqlitePipelineCache":
+        """Child method definition."""
+        namespace = f"{self._namespace}/{name}" if self._namespace else name
+        return SqlitePipelineCache(self._store, namespace)
+
+    async def flush(self) -> None:
+        """Write the buffered changes to the database."""
+        await asyncio.to_thread(self._store.flush)
+
+    def compact(self) -> tuple[int, int]:
+        """Evict expired and over-budget entries and shrink the database file."""
+        return self._store.compact()
+
+    def import_entries(self, entries: Iterable[tuple[str, str, str]]) -> int:
+        """Import serialized entries into this cache and its children.
+
+        Args:
+            - entries - The (child path, key, serialized value) of the entries, the child path is "" for this cache.
+
+        Returns
+        -------
+            - output - The number of imported entries.
+        """
+        return self._store.set_many(
+            (
+                (
+                    "/".join(part for part in [self._namespace, child] if part),
+                    key,
+                ),
+                data,
+            )
+            for child, key, data in entries
+        )
+
+
+def create_sqlite_cache(
+    path: str | Path,
+    max_bytes: int = 0,
+    ttl: int = 0,
+    import_dir: str | Path | None = None,
+) -> SqlitePipelineCache:
+    """Create a sqlite cache.
+
+    If the database is new and an import directory is given, the entries of a
+    file cache in that directory are imported.
+    """
+    store = SqliteCacheStore(path, max_bytes=max_bytes, ttl=ttl)
+    cache = SqlitePipelineCache(store)
+    if store.is_new and import_dir is not None:
+        import_json_cache(import_dir, cache)
+    return cache
+
+
+def import_json_cache(cache_dir: str | Path, cache: SqlitePipelineCache) -> int:
+    """Import the entries of a file cache directory, keeping its child layout.
+
+    Returns
+    -------
+        - output - The number of imported entries.
+    """
+    cache_dir = Path(cache_dir)
+    num_imported = cache.import_entries(_read_json_cache(cache_dir))
+    if num_imported > 0:
+        log.info("imported %d entries from %s", num_imported, cache_dir)
+    return num_imported
+
+
+def _read_json_cache(cache_dir: Path) -> Iterable[tuple[str, str, str]]:
+    for path in sorted(cache_dir.rglob("*")):
+        if not path.is_file() or path.name.startswith(SQLITE_CACHE_FILENAME):
+            continue
+        try:
+            data = path.read_text(encoding="utf-8")
+            json.loads(data)
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+            log.warning("skipping invalid cache entry %s", path)
+            continue
+
+        relative = path.relative_to(cache_dir)
+        yield "/".join(relative.parent.parts), relative.name, data
@@ -0,0 +1,267 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'TieredPipelineCache' model."""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .pipeline_cache import PipelineCache
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WRITE_BATCH_SIZE = 100
+
+_CacheKey = tuple[str, str]
+
+
+@dataclass
+class CacheStats:
+    """Lookup counts of a tiered cache and its children."""
+
+    memory_hits: int = field(default=0)
+    """Lookups served from the memory tier."""
+
+    backing_hits: int = field(default=0)
+    """Lookups served from the backing cache."""
+
+    misses: int = field(default=0)
+    """Lookups found in neither tier."""
+
+    evictions: int = field(default=0)
+    """Entries evicted from the memory tier."""
+
+    @property
+    def lookups(self) -> int:
+        """Return the number of lookups."""
+        return self.memory_hits + self.backing_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served by either tier."""
+        return (self.memory_hits + self.backing_hits) / max(self.lookups, 1)
+
+    @property
+    def memory_hit_rate(self) -> float:
+        """Return the fraction of lookups served by the memory tier."""
+        return self.memory_hits / max(self.lookups, 1)
+
+    def to_dict(self) -> dict[str, float]:
+        """Return the counts and rates as a dictionary."""
+        return {
+            "memory_hits": self.memory_hits,
+            "backing_hits": self.backing_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "memory_hit_rate": self.memory_hit_rate,
+        }
+
+
+class _MemoryTier:
+    """An LRU of cache values bounded by a number of entries and of bytes."""
+
+    _entries: OrderedDict[_CacheKey, tuple[Any, int]]
+    _max_entries: int
+    _max_bytes: int
+    _num_bytes: int
+    _stats: CacheStats
+
+    def __init__(self, max_entries: int, max_bytes: int, stats: CacheStats):
+        self._entries = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._num_bytes = 0
+        self._stats = stats
+
+    def get(self, key: _CacheKey) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def has(self, key: _CacheKey) -> bool:
+        return key in self._entries
+
+    def set(self, key: _CacheKey, value: Any) -> None:
+        self.delete(key)
+        size = _estimate_size(value)
+        if self._max_entries <= 0 or (self._max_bytes > 0 and size > self._max_bytes):
+            return
+
+        self._entries[key] = (value, size)
+        self._num_bytes += size
+        while len(self._entries) > self._max_entries or (
+            self._max_bytes > 0 and self._num_bytes > self._max_bytes
+        ):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._num_bytes -= evicted_size
+            self._stats.evictions += 1
+
+    def delete(self, key: _CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._num_bytes -= entry[1]
+
+    def clear(self, namespace: str) -> None:
+        for key in [key for key in self._entries if _in_namespace(key, namespace)]:
+            self.delete(key)
+
+
+@dataclass
+class _TierState:
+    """The state shared by a tiered cache and its children."""
+
+    memory: _MemoryTier
+    stats: CacheStats
+    write_behind: bool
+    write_batch_size: int
+    pending: dict[_CacheKey, tuple[PipelineCache, Any, dict | None]] = field(
+        default_factory=dict
+    )
+
+
+class TieredPipelineCache(PipelineCache):
+    """A bounded in-memory LRU in front of a persistent pipeline cache.
+
+    Lookups are served from memory when possible, and values read from or written
+    to the backing cache are kept in memory. Writes go to the backing cache at once
+    (write-through), or are buffered and written in batches (write-behind), in which
+    case flush must be called before the process exits. Children share the memory
+    tier, the buffered writes and the stats of their parent.
+    """
+
+    _backing: PipelineCache
+    _state: _TierState
+    _namespace: str
+
+    def __init__(
+        self,
+        backing: PipelineCache,
+        max_entries: int,
+        max_bytes: int = 0,
+        write_behind: bool = False,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ):
+        """Create a tiered cache.
+
+        Args:
+            - backing - The persistent cache.
+            - max_entries - The maximum number of entries kept in memory.
+            - max_bytes - The maximum size of the entries kept in memory. 0 disables the cap.
+            - write_behind - Whether to buffer writes to the backing cache.
+            - write_batch_size - The number of buffered writes that triggers a flush.
+        """
+        stats = CacheStats()
+        self._backing = backing
+        self._state = _TierState(
+            memory=_MemoryTier(max_entries, max_bytes, stats),
+            stats=stats,
+            write_behind=write_behind,
+            write_batch_size=write_batch_size,
+        )
+        self._namespace = ""
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the lookup counts of this cache and its children."""
+        return self._state.stats
+
+    def _key(self, key: str) -> _CacheKey:
+        return (self._namespace, key)
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        cache_key = self._key(key)
+        value = self._state.memory.get(cache_key)
+        if value is None and cache_key in self._state.pending:
+            value = self._state.pending[cache_key][1]
+        if value is not None:
+            self._state.stats.memory_hits += 1
+            return value
+
+        value = await self._backing.get(key)
+        if value is None:
+            self._state.stats.misses += 1
+            return None
+
+        self._state.stats.backing_hits += 1
+        self._state.memory.set(cache_key, value)
+        return value
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+
+        cache_key = self._key(key)
+        self._state.memory.set(cache_key, value)
+        if not self._state.write_behind:
+            await self._backing.set(key, value, debug_data)
+            return
+
+        self._state.pending[cache_key] = (self._backing, value, debug_data)
+        if len(self._state.pending) >= self._state.write_batch_size:
+            await self.flush()
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        cache_key = self._key(key)
+        if self._state.memory.has(cache_key) or cache_key in self._state.pending:
+            return True
+        return await self._backing.has(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        cache_key = self._key(key)
+        self._state.memory.delete(cache_key)
+        self._state.pending.pop(cache_key, None)
+        await self._backing.delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._state.memory.clear(self._namespace)
+        for key in [
+            key for key in self._state.pending if _in_namespace(key, self._namespace)
+        ]:
+            del self._state.pending[key]
+        await self._backing.clear()
+
+    def child(self, name: str) -> "TieredPipelineCache":
+        """Child method definition."""
+        child = TieredPipelineCache.__new__(TieredPipelineCache)
+        child._backing = self._backing.child(name)
+        child._state = self._state
+        child._namespace = f"{self._namespace}/{name}" if self._namespace else name
+        return child
+
+    async def flush(self) -> None:
+        """Write the buffered entries of this cache and its children."""
+        pending, self._state.pending = self._state.pending, {}
+        if len(pending) == 0:
+            return
+
+        await asyncio.gather(
+            *(
+                backing.set(key, value, debug_data)
+                for (_, key), (backing, value, debug_data) in pending.items()
+            )
+        )
+        backings = {id(backing): backing for backing, _, _ in pending.values()}
+        await asyncio.gather(*(backing.flush() for backing in backings.values()))
+        log.debug("flushed %d cache entries", len(pending))
+
+
+def _in_namespace(key: _CacheKey, namespace: str) -> bool:
+    return namespace == "" or key[0] == namespace or key[0].startswith(f"{namespace}/")
+
+
+def _estimate_size(value: Any) -> int:
+    if isinstance(value, str | bytes):
+        return len(value)
+    return len(json.dumps(value, default=str))
@@ -11,9 +11,15 @@ import time
 import warnings
 from pathlib import Path
 
-from graphrag.config import CacheType, enable_logging_with_config, load_config
+from graphrag.config import (
+    CacheType,
+    GraphRagConfig,
+    enable_logging_with_config,
+    load_config,
+)
 
 from .api import build_index
+from .cache.sqlite_pipeline_cache import SQLITE_CACHE_FILENAME, SqliteCacheStore
 from .emit.types import TableEmitterType
 from .graph.extractors.claims.prompts import CLAIM_EXTRACTION_PROMPT
 from .graph.extractors.community_reports.prompts import COMMUNITY_REPORT_PROMPT
@@ -110,6 +116,7 @@ def index_cli(
     emit: list[TableEmitterType],
     dryrun: bool,
     skip_validations: bool,
+    compact_cache: bool = False,
 ):
     """Run the pipeline with the given config."""
     progress_reporter = load_progress_reporter(reporter)
@@ -123,6 +130,10 @@ def index_cli(
     root = Path(root_dir).resolve()
     config = load_config(root, config_filepath, run_id)
 
+    if compact_cache:
+        _compact_cache(root, config, progress_reporter)
+        sys.exit(0)
+
     if nocache:
         config.cache.type = CacheType.none
 
@@ -176,6 +187,26 @@ def index_cli(
     sys.exit(1 if encountered_errors else 0)
 
 
+def _compact_cache(
+    root: Path, config: GraphRagConfig, reporter: ProgressReporter
+) -> None:
+    """Compact the sqlite cache of the project."""
+    if config.cache.type != CacheType.sqlite:
+        msg = f"Only the sqlite cache can be compacted, the cache type is {config.cache.type.value}"
+        raise ValueError(msg)
+
+    path = root / config.cache.base_dir / SQLITE_CACHE_FILENAME
+    if not path.exists():
+        reporter.info(f"No sqlite cache found at {path}")
+        return
+
+    store = SqliteCacheStore(
+        path, max_bytes=config.cache.max_bytes, ttl=config.cache.ttl
+    )
+    size_before, size_after = store.compact()
+    reporter.success(f"Compacted {path} from {size_before} to {size_after} bytes")
+
+
 def _initialize_project_at(path: str, reporter: ProgressReporter) -> None:
     """Initialize the project at the given path."""
     reporter.info(f"Initializing project at {path}")
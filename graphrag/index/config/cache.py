@@ -20,6 +20,24 @@ class PipelineCacheConfig(BaseModel, Generic[T]):
 
     type: T
 
+    memory_max_entries: int = pydantic_Field(
+        description="The number of entries kept in an in-memory tier in front of a persistent cache, 0 to disable the tier.",
+        default=0,
+    )
+    """The number of entries kept in an in-memory tier in front of a persistent cache, 0 to disable the tier."""
+
+    memory_max_bytes: int = pydantic_Field(
+        description="The maximum size of the in-memory tier in bytes, 0 for no limit.",
+        default=0,
+    )
+    """The maximum size of the in-memory tier in bytes, 0 for no limit."""
+
+    write_behind: bool = pydantic_Field(
+        description="Whether writes to a persistent cache are buffered and written in batches.",
+        default=False,
+    )
+    """Whether writes to a persistent cache are buffered and written in batches."""
+
 
 class PipelineFileCacheConfig(PipelineCacheConfig[Literal[CacheType.file]]):
     """Represent the file cache configuration for the pipeline."""
@@ -74,9 +92,34 @@ class PipelineBlobCacheConfig(PipelineCacheConfig[Literal[CacheType.blob]]):
     """The storage account blob url for cache"""
 
 
+class PipelineSqliteCacheConfig(PipelineCacheConfig[Literal[CacheType.sqlite]]):
+    """Represent the sqlite cache configuration for the pipeline."""
+
+    type: Literal[CacheType.sqlite] = CacheType.sqlite
+    """The type of cache."""
+
+    base_dir: str | None = pydantic_Field(
+        description="The base directory for the cache.", default=None
+    )
+    """The base directory for the cache."""
+
+    max_bytes: int = pydantic_Field(
+        description="The maximum size of the cache in bytes, 0 for no limit.",
+        default=0,
+    )
+    """The maximum size of the cache in bytes, 0 for no limit."""
+
+    ttl: int = pydantic_Field(
+        description="The number of seconds entries are kept, 0 for no expiry.",
+        default=0,
+    )
+    """The number of seconds entries are kept, 0 for no expiry."""
+
+
 PipelineCacheConfigTypes = (
     PipelineFileCacheConfig
     | PipelineMemoryCacheConfig
     | PipelineBlobCacheConfig
     | PipelineNoneCacheConfig
+    | PipelineSqliteCacheConfig
 )
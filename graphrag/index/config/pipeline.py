@@ -62,3 +62,15 @@ class PipelineConfig(BaseModel):
         description="The workflows for the pipeline.", default_factory=list
     )
     """The workflows for the pipeline."""
+
+    max_concurrent_workflows: int | None = pydantic_Field(
+        description="The maximum number of independent workflows to run concurrently.",
+        default=None,
+    )
+    """The maximum number of independent workflows to run concurrently."""
+
+    table_registry_max_bytes: int | None = pydantic_Field(
+        description="The number of bytes of recent workflow outputs to keep in memory for downstream workflows.",
+        default=None,
+    )
+    """The number of bytes of recent workflow outputs to keep in memory for downstream workflows."""
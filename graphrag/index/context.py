@@ -4,6 +4,7 @@
 # isort: skip_file
 """A module containing the 'PipelineRunStats' and 'PipelineRunContext' models."""
 
+import asyncio
 from dataclasses import dataclass as dc_dataclass
 from dataclasses import field
 
@@ -27,6 +28,12 @@ class PipelineRunStats:
     workflows: dict[str, dict[str, float]] = field(default_factory=dict)
     """A dictionary of workflows."""
 
+    cache: dict[str, float] = field(default_factory=dict)
+    """The lookup counts and hit rates of the in-memory cache tier."""
+
+    llm: dict[str, dict[str, int]] = field(default_factory=dict)
+    """The counts of the LLM calls by LLM name, e.g. the calls served by an identical in-flight call."""
+
 
 @dc_dataclass
 class PipelineRunContext:
@@ -35,6 +42,8 @@ class PipelineRunContext:
     stats: PipelineRunStats
     storage: PipelineStorage
     cache: PipelineCache
+    stats_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    """Serializes the writes of the stats, the workflows may run concurrently."""
 
 
 # TODO: For now, just has the same props available to it
@@ -16,6 +16,7 @@ from graphrag.config.enums import (
 )
 from graphrag.config.models import (
     GraphRagConfig,
+    LLMConfig,
     TextEmbeddingConfig,
 )
 from graphrag.index.config.cache import (
@@ -24,6 +25,7 @@ from graphrag.index.config.cache import (
     PipelineFileCacheConfig,
     PipelineMemoryCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.config.input import (
     PipelineCSVInputConfig,
@@ -123,6 +125,8 @@ def create_pipeline_config(settings: GraphRagConfig, verbose=False) -> PipelineC
         reporting=_get_reporting_config(settings),
         storage=_get_storage_config(settings),
         cache=_get_cache_config(settings),
+        max_concurrent_workflows=settings.max_concurrent_workflows,
+        table_registry_max_bytes=settings.table_registry_max_bytes,
         workflows=[
             *_document_workflows(settings, embedded_fields),
             *_text_unit_workflows(settings, covariates_enabled, embedded_fields),
@@ -210,10 +214,16 @@ def _text_unit_workflows(
             config={
                 "chunk_by": settings.chunks.group_by_columns,
                 "text_chunk": {
+                    "num_threads": settings.chunks.num_threads,
                     "strategy": settings.chunks.resolved_strategy(
                         settings.encoding_model
-                    )
+                    ),
                 },
+                "text_dedup": (
+                    {"threshold": settings.chunks.dedup_threshold}
+                    if settings.chunks.dedup
+                    else None
+                ),
             },
         ),
         PipelineWorkflowReference(
@@ -255,6 +265,21 @@ def _get_embedding_settings(
     }
 
 
+def _get_parallelization_settings(settings: LLMConfig) -> dict:
+    result = settings.parallelization.model_dump()
+    if settings.llm.batch_mode:
+        # let all the prompts of a verb join the same batch
+        result["num_threads"] = max(
+            result["num_threads"], settings.llm.batch_max_requests
+        )
+    return result
+
+
+def _get_canonical_id_column(settings: GraphRagConfig) -> str | None:
+    # the near-duplicate chunks reuse the extraction results of their canonical chunk
+    return "canonical_chunk_id" if settings.chunks.dedup else None
+
+
 def _graph_workflows(
     settings: GraphRagConfig, embedded_fields: set[str]
 ) -> list[PipelineWorkflowReference]:
@@ -272,12 +297,13 @@ def _graph_workflows(
                 "graphml_snapshot": settings.snapshots.graphml,
                 "raw_entity_snapshot": settings.snapshots.raw_entities,
                 "entity_extract": {
-                    **settings.entity_extraction.parallelization.model_dump(),
+                    **_get_parallelization_settings(settings.entity_extraction),
                     "async_mode": settings.entity_extraction.async_mode,
                     "strategy": settings.entity_extraction.resolved_strategy(
                         settings.root_dir, settings.encoding_model
                     ),
                     "entity_types": settings.entity_extraction.entity_types,
+                    "canonical_id_column": _get_canonical_id_column(settings),
                 },
             },
         ),
@@ -286,7 +312,7 @@ def _graph_workflows(
             config={
                 "graphml_snapshot": settings.snapshots.graphml,
                 "summarize_descriptions": {
-                    **settings.summarize_descriptions.parallelization.model_dump(),
+                    **_get_parallelization_settings(settings.summarize_descriptions),
                     "async_mode": settings.summarize_descriptions.async_mode,
                     "strategy": settings.summarize_descriptions.resolved_strategy(
                         settings.root_dir,
@@ -372,7 +398,7 @@ def _community_workflows(
                 "skip_summary_embedding": skip_community_summary_embedding,
                 "skip_full_content_embedding": skip_community_full_content_embedding,
                 "create_community_reports": {
-                    **settings.community_reports.parallelization.model_dump(),
+                    **_get_parallelization_settings(settings.community_reports),
                     "async_mode": settings.community_reports.async_mode,
                     "strategy": settings.community_reports.resolved_strategy(
                         settings.root_dir
@@ -412,10 +438,11 @@ def _covariate_workflows(
             name=create_final_covariates,
             config={
                 "claim_extract": {
-                    **settings.claim_extraction.parallelization.model_dump(),
+                    **_get_parallelization_settings(settings.claim_extraction),
                     "strategy": settings.claim_extraction.resolved_strategy(
                         settings.root_dir, settings.encoding_model
                     ),
+                    "canonical_id_column": _get_canonical_id_column(settings),
                 },
             },
         )
@@ -532,12 +559,20 @@ def _get_cache_config(
     settings: GraphRagConfig,
 ) -> PipelineCacheConfigTypes:
     """Get the cache type from the settings."""
+    # persistent caches get an in-memory tier in front of them
+    memory_tier = {
+        "memory_max_entries": settings.cache.memory_max_entries,
+        "memory_max_bytes": settings.cache.memory_max_bytes,
+        "write_behind": settings.cache.write_behind,
+    }
     match settings.cache.type:
         case CacheType.memory:
             return PipelineMemoryCacheConfig()
         case CacheType.file:
             # relative to root dir
-            return PipelineFileCacheConfig(base_dir=settings.cache.base_dir)
+            return PipelineFileCacheConfig(
+                base_dir=settings.cache.base_dir, **memory_tier
+            )
         case CacheType.none:
             return PipelineNoneCacheConfig()
         case CacheType.blob:
@@ -555,6 +590,15 @@ def _get_cache_config(
                 container_name=container_name,
                 base_dir=settings.cache.base_dir,
                 storage_account_blob_url=storage_account_blob_url,
+                **memory_tier,
+            )
+        case CacheType.sqlite:
+            # relative to root dir
+            return PipelineSqliteCacheConfig(
+                base_dir=settings.cache.base_dir,
+                max_bytes=settings.cache.max_bytes,
+                ttl=settings.cache.ttl,
+                **memory_tier,
             )
         case _:
             # relative to root dir
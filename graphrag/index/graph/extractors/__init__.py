@@ -8,6 +8,7 @@ from .community_reports import (
     COMMUNITY_REPORT_PROMPT,
     CommunityReportsExtractor,
 )
+from .gleaning_policy import GleaningPolicy, get_gleaning_policy, pop_gleaning_policy
 from .graph import GraphExtractionResult, GraphExtractor
 
 __all__ = [
@@ -15,6 +16,9 @@ __all__ = [
     "COMMUNITY_REPORT_PROMPT",
     "ClaimExtractor",
     "CommunityReportsExtractor",
+    "GleaningPolicy",
     "GraphExtractionResult",
     "GraphExtractor",
+    "get_gleaning_policy",
+    "pop_gleaning_policy",
 ]
@@ -13,7 +13,9 @@ import tiktoken
 import graphrag.config.defaults as defs
 from graphrag.index.typing import ErrorHandlerFn
 from graphrag.llm import CompletionLLM
+from graphrag.utils.tokens import get_encoding
 
+from ..gleaning_policy import GleaningPolicy
 from .prompts import (
     CLAIM_EXTRACTION_PROMPT,
     CONTINUE_PROMPT,
@@ -48,6 +50,8 @@ class ClaimExtractor:
     _record_delimiter_key: str
     _completion_delimiter_key: str
     _max_gleanings: int
+    _gleaning_policy: GleaningPolicy | None
+    _encoding: tiktoken.Encoding
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -63,6 +67,7 @@ class ClaimExtractor:
         completion_delimiter_key: str | None = None,
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
+        gleaning_policy: GleaningPolicy | None = None,
         on_error: ErrorHandlerFn | None = None,
     ):
         """Init method definition."""
@@ -84,12 +89,13 @@ class ClaimExtractor:
         self._max_gleanings = (
             max_gleanings if max_gleanings is not None else defs.CLAIM_MAX_GLEANINGS
         )
+        self._gleaning_policy = gleaning_policy
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
-        encoding = tiktoken.get_encoding(encoding_model or "cl100k_base")
-        yes = encoding.encode("YES")
-        no = encoding.encode("NO")
+        self._encoding = get_encoding(encoding_model)
+        yes = self._encoding.encode("YES")
+        no = self._encoding.encode("NO")
         self._loop_args = {"logit_bias": {yes[0]: 100, no[0]: 100}, "max_tokens": 1}
 
     async def __call__(
@@ -175,36 +181,67 @@ class ClaimExtractor:
         results = response.output or ""
         claims = results.strip().removesuffix(completion_delimiter)
 
+        policy = self._gleaning_policy
+        tokens = len(self._encoding.encode(doc)) if policy is not None else 0
+        seen = self._claim_keys(claims, prompt_args)
+        dense = (
+            policy.observe_first_pass(len(seen), tokens)
+            if policy is not None
+            else False
+        )
+        new_records = None
+
         # Repeat to ensure we maximize entity count
         for i in range(self._max_gleanings):
+            if policy is not None and not policy.should_glean(
+                i, dense, tokens, new_records
+            ):
+                # skip this round and the later ones, with their loop checks
+                skipped = self._max_gleanings - i
+                policy.skip(skipped, 2 * skipped - (1 if i == 0 else 0))
+                break
+
+            # If this isn't the first loop, check to see if we should continue
+            if i > 0:
+                response = await self._llm(
+                    LOOP_PROMPT,
+                    name=f"extract-loopcheck-{i - 1}",
+                    history=response.history,
+                    model_parameters=self._loop_args,
+                )
+                if response.output != "YES":
+                    break
+
             response = await self._llm(
                 CONTINUE_PROMPT,
                 name=f"extract-continuation-{i}",
                 history=response.history,
             )
-            extension = response.output or ""
-            claims += record_delimiter + extension.strip().removesuffix(
-                completion_delimiter
+            extension = (
+                (response.output or "").strip().removesuffix(completion_delimiter)
             )
+            if extension:
+                claims += record_delimiter + extension
 
-            # If this isn't the last loop, check to see if we should continue
-            if i >= self._max_gleanings - 1:
-                break
-
-            response = await self._llm(
-                LOOP_PROMPT,
-                name=f"extract-loopcheck-{i}",
-                history=response.history,
-                model_parameters=self._loop_args,
-            )
-            if response.output != "YES":
-                break
+            if policy is not None:
+                found = self._claim_keys(extension, prompt_args)
+                new_records = len(found - seen)
+                seen |= found
+                policy.observe_glean(i, dense, tokens, new_records)
 
-        result = self._parse_claim_tuples(results, prompt_args)
+        result = self._parse_claim_tuples(claims, prompt_args)
         for r in result:
             r["doc_id"] = f"{doc_index}"
         return result
 
+    def _claim_keys(self, claims: str, prompt_variables: dict) -> set[tuple]:
+        """Return the distinct claims of an output."""
+        return {
+            tuple(claim.values())
+            for claim in self._parse_claim_tuples(claims, prompt_variables)
+            if claim["object_id"] is not None
+        }
+
     def _parse_claim_tuples(
         self, claims: str, prompt_variables: dict
     ) -> list[dict[str, Any]]:
@@ -2,6 +2,10 @@
 # Licensed under the MIT License
 """Sort context by degree in descending order."""
 
+import csv
+import io
+import math
+
 import pandas as pd
 
 import graphrag.index.graph.extractors.community_reports.schemas as schemas
@@ -130,7 +134,8 @@ def sort_context(
     sorted_edges = []
     sorted_nodes = []
     sorted_claims = []
-    context_string = ""
+    # the number of nodes, edges and claims in the context after adding each edge
+    prefix_sizes: list[tuple[int, int, int]] = []
     for edge in edges:
         source_details = node_details.get(edge[edge_source_column], {})
         target_details = node_details.get(edge[edge_target_column], {})
@@ -140,17 +145,105 @@ def sort_context(
         target_claims = claim_details.get(edge[edge_target_column], [])
         sorted_claims.extend(source_claims if source_claims else [])
         sorted_claims.extend(target_claims if source_claims else [])
-        if max_tokens:
-            new_context_string = _get_context_string(
-                sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
-            )
-            if num_tokens(new_context_string) > max_tokens:
-                break
-            context_string = new_context_string
+        prefix_sizes.append((len(sorted_nodes), len(sorted_edges), len(sorted_claims)))
 
-    if context_string == "":
+    def _get_prefix_context_string(num_edges: int) -> str:
+        """Get the context string of the first num_edges edges."""
+        num_nodes, _, num_claims = (
+            prefix_sizes[num_edges - 1] if num_edges > 0 else (0, 0, 0)
+        )
         return _get_context_string(
-            sorted_nodes, sorted_edges, sorted_claims, sub_community_reports
+            sorted_nodes[:num_nodes],
+            sorted_edges[:num_edges],
+            sorted_claims[:num_claims],
+            sub_community_reports,
+        )
+
+    if not max_tokens or len(edges) == 0:
+        return _get_prefix_context_string(len(edges))
+
+    # Estimate the number of edges that fit from the token counts of the individual
+    # rows, each row is rendered and counted once
+    reports_tokens = num_tokens(_get_context_string([], [], [], sub_community_reports))
+    entity_tokens = _SectionTokens("-----Entities-----", node_id_column, sorted_nodes)
+    claim_tokens = _SectionTokens("-----Claims-----", claim_id_column, sorted_claims)
+    edge_tokens = _SectionTokens(
+        "-----Relationships-----", edge_id_column, sorted_edges
+    )
+    num_edges = len(edges)
+    for index, (num_nodes, _, num_claims) in enumerate(prefix_sizes):
+        entity_tokens.add_until(num_nodes)
+        claim_tokens.add_until(num_claims)
+        edge_tokens.add_until(index + 1)
+        estimated_tokens = (
+            reports_tokens
+            + entity_tokens.tokens
+            + claim_tokens.tokens
+            + edge_tokens.tokens
         )
+        if estimated_tokens > max_tokens:
+            num_edges = index
+            break
+
+    # Correct the estimate with the exact token count of the rendered context, so
+    # that the result is the same as adding one edge at a time
+    context_string = _get_prefix_context_string(num_edges)
+    while num_edges > 0 and num_tokens(context_string) > max_tokens:
+        num_edges -= 1
+        context_string = _get_prefix_context_string(num_edges)
+    while num_edges < len(edges):
+        new_context_string = _get_prefix_context_string(num_edges + 1)
+        if num_tokens(new_context_string) > max_tokens:
+            break
+        num_edges += 1
+        context_string = new_context_string
+
+    if num_edges == 0 or context_string == "":
+        return _get_prefix_context_string(min(num_edges + 1, len(edges)))
 
     return context_string
+
+
+class _SectionTokens:
+    """Estimated token count of a context section, built one row at a time."""
+
+    def __init__(self, title: str, id_column: str, records: list[dict]):
+        self._title = title
+        self._id_column = id_column
+        self._records = records
+        self._columns = list(
+            dict.fromkeys(column for record in records for column in record)
+        )
+        self._num_added = 0
+        self._rows: set[str] = set()
+        self.tokens = 0
+
+    def add_until(self, num_records: int) -> None:
+        """Add the rows of the records up to num_records."""
+        for record in self._records[self._num_added : num_records]:
+            if not (
+                self._id_column in record
+                and record[self._id_column]
+                and str(record[self._id_column]).strip() != ""
+            ):
+                continue
+            row = _csv_row([record.get(column) for column in self._columns])
+            if row in self._rows:
+                continue
+            if len(self._rows) == 0:
+                self.tokens += num_tokens(f"{self._title}\n{_csv_row(self._columns)}")
+            self._rows.add(row)
+            self.tokens += num_tokens(row)
+        self._num_added = max(self._num_added, num_records)
+
+
+def _csv_row(values: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow([
+        "" if _is_missing(value) else value for value in values
+    ])
+    return buffer.getvalue()
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
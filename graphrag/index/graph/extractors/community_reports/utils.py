@@ -8,12 +8,12 @@ from typing import cast
 import pandas as pd
 
 import graphrag.index.graph.extractors.community_reports.schemas as schemas
-from graphrag.query.llm.text_utils import num_tokens
+from graphrag.utils.tokens import count_tokens_batch
 
 
 def set_context_size(df: pd.DataFrame) -> None:
     """Measure the number of tokens in the context."""
-    df[schemas.CONTEXT_SIZE] = df[schemas.CONTEXT_STRING].apply(lambda x: num_tokens(x))
+    df[schemas.CONTEXT_SIZE] = count_tokens_batch(df[schemas.CONTEXT_STRING].tolist())
 
 
 def set_context_exceeds_flag(df: pd.DataFrame, max_tokens: int) -> None:
@@ -0,0 +1,175 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'GleaningPolicy' model, deciding whether to glean a chunk."""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_CHUNKS = 20
+DEFAULT_MIN_EXPECTED_RECORDS = 1.0
+DEFAULT_EXPLORE_INTERVAL = 10
+REPORT_INTERVAL = 100
+
+# the prior yield of a glean, one new record per this many tokens
+_PRIOR_TOKENS = 300
+
+
+@dataclass
+class _GleanStats:
+    """The yield of the gleans made after first passes of one kind."""
+
+    gleans: int = 0
+    new_records: int = 0
+    tokens: int = 0
+
+    @property
+    def rate(self) -> float:
+        """Return the smoothed number of new records per token of a glean."""
+        return (self.new_records + 1) / (self.tokens + _PRIOR_TOKENS)
+
+
+class GleaningPolicy:
+    """Decide per chunk whether a gleaning round is worth its LLM calls.
+
+    The expected yield of a glean is estimated from the gleans made earlier in the
+    corpus, and scaled by the number of tokens of the chunk. Gleans are tracked
+    separately after dense and sparse first passes, that is above or below the
+    records per token of the corpus, and for the first and the later rounds. A round
+    is skipped when its expected number of new records is too low, and so is the
+    loop check before it. The first chunks are always gleaned, and one skipped round
+    out of every explore_interval is gleaned anyway, so that the estimates follow
+    the corpus.
+    """
+
+    _name: str
+    _warmup_chunks: int
+    _min_expected_records: float
+    _explore_interval: int
+    _lock: threading.Lock
+    _chunks: int
+    _records: int
+    _tokens: int
+    _stats: dict[tuple[bool, bool], _GleanStats]
+    _declined: int
+    skipped_gleanings: int
+    skipped_calls: int
+
+    def __init__(
+        self,
+        name: str,
+        warmup_chunks: int = DEFAULT_WARMUP_CHUNKS,
+        min_expected_records: float = DEFAULT_MIN_EXPECTED_RECORDS,
+        explore_interval: int = DEFAULT_EXPLORE_INTERVAL,
+    ):
+        """Create a policy.
+
+        Args:
+            - name - The name of the extraction, used in the reports.
+            - warmup_chunks - The number of chunks that are always gleaned.
+            - min_expected_records - The expected number of new records below which a round is skipped.
+            - explore_interval - Glean one round out of this many skipped rounds.
+        """
+        self._name = name
+        self._warmup_chunks = warmup_chunks
+        self._min_expected_records = min_expected_records
+        self._explore_interval = explore_interval
+        self._lock = threading.Lock()
+        self._chunks = 0
+        self._records = 0
+        self._tokens = 0
+        self._stats = {}
+        self._declined = 0
+        self.skipped_gleanings = 0
+        self.skipped_calls = 0
+
+    def observe_first_pass(self, records: int, tokens: int) -> bool:
+        """Record the yield of the first pass over a chunk, return whether it was dense."""
+        with self._lock:
+            dense = self._records * tokens < records * self._tokens
+            self._chunks += 1
+            self._records += records
+            self._tokens += tokens
+            if self._chunks % REPORT_INTERVAL == 0:
+                log.info(self._summary())
+            return dense
+
+    def should_glean(
+        self, round: int, dense: bool, tokens: int, new_records: int | None = None
+    ) -> bool:
+        """Return whether to run a gleaning round over a chunk.
+
+        Args:
+            - round - The index of the gleaning round.
+            - dense - Whether the first pass over the chunk was dense.
+            - tokens - The number of tokens of the chunk.
+            - new_records - The number of new records found by the previous round, if any.
+        """
+        if new_records == 0:
+            # the model has nothing left to add
+            return False
+        with self._lock:
+            if self._chunks <= self._warmup_chunks:
+                return True
+
+            stats = self._stats.get((dense, round > 0), _GleanStats())
+            if stats.rate * tokens >= self._min_expected_records:
+                return True
+
+            self._declined += 1
+            return self._declined % self._explore_interval == 0
+
+    def observe_glean(
+        self, round: int, dense: bool, tokens: int, new_records: int
+    ) -> None:
+        """Record the number of new records found by a gleaning round."""
+        with self._lock:
+            stats = self._stats.setdefault((dense, round > 0), _GleanStats())
+            stats.gleans += 1
+            stats.new_records += new_records
+            stats.tokens += tokens
+
+    def skip(self, gleanings: int, calls: int) -> None:
+        """Record gleaning rounds skipped for a chunk, and the most LLM calls they would have made."""
+        with self._lock:
+            self.skipped_gleanings += gleanings
+            self.skipped_calls += calls
+
+    def report(self) -> tuple[str, dict[str, int]]:
+        """Return a summary of the skipped gleanings and its details."""
+        with self._lock:
+            return self._summary(), {
+                "chunks": self._chunks,
+                "skipped_gleanings": self.skipped_gleanings,
+                "skipped_calls": self.skipped_calls,
+            }
+
+    def _summary(self) -> str:
+        return (
+            f"{self._name} gleaning skipped {self.skipped_gleanings} rounds and up to"
+            f" {self.skipped_calls} calls over {self._chunks} chunks"
+        )
+
+
+_policies: dict[str, GleaningPolicy] = {}
+_policies_lock = threading.Lock()
+
+
+def get_gleaning_policy(name: str) -> GleaningPolicy:
+    """Get the gleaning policy of an extraction, shared by the chunks of the corpus."""
+    with _policies_lock:
+        if name not in _policies:
+            _policies[name] = GleaningPolicy(name)
+        return _policies[name]
+
+
+def pop_gleaning_policy(name: str) -> GleaningPolicy | None:
+    """Remove the gleaning policy of a finished extraction, if it was used.
+
+    The next extraction with the same name starts from a new policy.
+    """
+    with _policies_lock:
+        return _policies.pop(name, None)
@@ -17,7 +17,9 @@ import graphrag.config.defaults as defs
 from graphrag.index.typing import ErrorHandlerFn
 from graphrag.index.utils import clean_str
 from graphrag.llm import CompletionLLM
+from graphrag.utils.tokens import get_encoding
 
+from ..gleaning_policy import GleaningPolicy
 from .prompts import CONTINUE_PROMPT, GRAPH_EXTRACTION_PROMPT, LOOP_PROMPT
 
 DEFAULT_TUPLE_DELIMITER = "<|>"
@@ -26,6 +28,60 @@ DEFAULT_COMPLETION_DELIMITER = "<|COMPLETE|>"
 DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 
 
+class _RecordParser:
+    """Split the extraction output into records, as it is generated."""
+
+    _tuple_delimiter: str
+    _record_delimiter: str
+    _completion_delimiter: str
+    _text: str
+    _buffer: str
+    _is_complete: bool
+    records: list[list[str]]
+
+    def __init__(
+        self, tuple_delimiter: str, record_delimiter: str, completion_delimiter: str
+    ):
+        self._tuple_delimiter = tuple_delimiter
+        self._record_delimiter = record_delimiter
+        self._completion_delimiter = completion_delimiter
+        self._text = ""
+        self._buffer = ""
+        self._is_complete = False
+        self.records = []
+
+    def feed(self, chunk: str) -> bool:
+        """Parse the records completed by a chunk, return True once the output is complete."""
+        self._text += chunk
+        if not self._is_complete:
+            self._consume(chunk)
+        return self._is_complete
+
+    def finish(self, output: str) -> list[list[str]]:
+        """Parse the last record, or the whole output if it was not streamed."""
+        if output != self._text:
+            # the output came from the cache, or was streamed again by a retry
+            self._buffer = ""
+            self._is_complete = False
+            self.records = []
+            self._consume(output)
+        self.records.append(self._parse(self._buffer))
+        self._buffer = ""
+        return self.records
+
+    def _consume(self, text: str) -> None:
+        self._buffer += text
+        if self._completion_delimiter in self._buffer:
+            self._buffer = self._buffer.split(self._completion_delimiter)[0]
+            self._is_complete = True
+        *records, self._buffer = self._buffer.split(self._record_delimiter)
+        self.records.extend(self._parse(record) for record in records)
+
+    def _parse(self, record: str) -> list[str]:
+        record = re.sub(r"^\(|\)$", "", record.strip())
+        return record.split(self._tuple_delimiter)
+
+
 @dataclass
 class GraphExtractionResult:
     """Unipartite graph extraction result class definition."""
@@ -50,6 +106,9 @@ class GraphExtractor:
     _summarization_prompt: str
     _loop_args: dict[str, Any]
     _max_gleanings: int
+    _stream_output: bool
+    _gleaning_policy: GleaningPolicy | None
+    _encoding: tiktoken.Encoding
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -64,6 +123,8 @@ class GraphExtractor:
         join_descriptions=True,
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
+        stream_output: bool = False,
+        gleaning_policy: GleaningPolicy | None = None,
         on_error: ErrorHandlerFn | None = None,
     ):
         """Init method definition."""
@@ -83,12 +144,14 @@ class GraphExtractor:
             if max_gleanings is not None
             else defs.ENTITY_EXTRACTION_MAX_GLEANINGS
         )
+        self._stream_output = stream_output
+        self._gleaning_policy = gleaning_policy
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
-        encoding = tiktoken.get_encoding(encoding_model or "cl100k_base")
-        yes = encoding.encode("YES")
-        no = encoding.encode("NO")
+        self._encoding = get_encoding(encoding_model)
+        yes = self._encoding.encode("YES")
+        no = self._encoding.encode("NO")
         self._loop_args = {"logit_bias": {yes[0]: 100, no[0]: 100}, "max_tokens": 1}
 
     async def __call__(
@@ -97,7 +160,7 @@ class GraphExtractor:
         """Call method definition."""
         if prompt_variables is None:
             prompt_variables = {}
-        all_records: dict[int, str] = {}
+        all_records: dict[int, list[list[str]]] = {}
         source_doc_map: dict[int, str] = {}
 
         # Wire defaults into the prompt variables
@@ -133,11 +196,7 @@ class GraphExtractor:
                     },
                 )
 
-        output = await self._process_results(
-            all_records,
-            prompt_variables.get(self._tuple_delimiter_key, DEFAULT_TUPLE_DELIMITER),
-            prompt_variables.get(self._record_delimiter_key, DEFAULT_RECORD_DELIMITER),
-        )
+        output = await self._process_results(all_records)
 
         return GraphExtractionResult(
             output=output,
@@ -146,63 +205,97 @@ class GraphExtractor:
 
     async def _process_document(
         self, text: str, prompt_variables: dict[str, str]
-    ) -> str:
+    ) -> list[list[str]]:
+        completion_delimiter = prompt_variables[self._completion_delimiter_key]
+        # stop generating at the end of the records
+        model_parameters = {"stop": [completion_delimiter]}
+
+        def create_parser() -> _RecordParser:
+            return _RecordParser(
+                prompt_variables[self._tuple_delimiter_key],
+                prompt_variables[self._record_delimiter_key],
+                completion_delimiter,
+            )
+
+        parser = create_parser()
         response = await self._llm(
             self._extraction_prompt,
             variables={
                 **prompt_variables,
                 self._input_text_key: text,
             },
+            model_parameters=model_parameters,
+            **self._streaming_args(parser),
         )
-        results = response.output or ""
+        results = parser.finish(response.output or "")
+
+        policy = self._gleaning_policy
+        tokens = len(self._encoding.encode(text)) if policy is not None else 0
+        seen = {tuple(record) for record in results if len(record) > 1}
+        dense = (
+            policy.observe_first_pass(len(seen), tokens)
+            if policy is not None
+            else False
+        )
+        new_records = None
 
         # Repeat to ensure we maximize entity count
         for i in range(self._max_gleanings):
+            if policy is not None and not policy.should_glean(
+                i, dense, tokens, new_records
+            ):
+                # skip this round and the later ones, with their loop checks
+                skipped = self._max_gleanings - i
+                policy.skip(skipped, 2 * skipped - (1 if i == 0 else 0))
+                break
+
+            # check whether the previous glean left anything out
+            if i > 0:
+                response = await self._llm(
+                    LOOP_PROMPT,
+                    name=f"extract-loopcheck-{i - 1}",
+                    history=response.history,
+                    model_parameters=self._loop_args,
+                )
+                if response.output != "YES":
+                    break
+
+            parser = create_parser()
             response = await self._llm(
                 CONTINUE_PROMPT,
                 name=f"extract-continuation-{i}",
                 history=response.history,
+                model_parameters=model_parameters,
+                **self._streaming_args(parser),
             )
-            results += response.output or ""
+            records = parser.finish(response.output or "")
+            results += records
 
-            # if this is the final glean, don't bother updating the continuation flag
-            if i >= self._max_gleanings - 1:
-                break
-
-            response = await self._llm(
-                LOOP_PROMPT,
-                name=f"extract-loopcheck-{i}",
-                history=response.history,
-                model_parameters=self._loop_args,
-            )
-            if response.output != "YES":
-                break
+            if policy is not None:
+                found = {tuple(record) for record in records if len(record) > 1}
+                new_records = len(found - seen)
+                seen |= found
+                policy.observe_glean(i, dense, tokens, new_records)
 
         return results
 
+    def _streaming_args(self, parser: _RecordParser) -> dict[str, Any]:
+        return {"on_output_chunk": parser.feed} if self._stream_output else {}
+
     async def _process_results(
         self,
-        results: dict[int, str],
-        tuple_delimiter: str,
-        record_delimiter: str,
+        results: dict[int, list[list[str]]],
     ) -> nx.Graph:
-        """Parse the result string to create an undirected unipartite graph.
+        """Create an undirected unipartite graph from the extracted records.
 
         Args:
-            - results - dict of results from the extraction chain
-            - tuple_delimiter - delimiter between tuples in an output record, default is '<|>'
-            - record_delimiter - delimiter between records, default is '##'
+            - results - dict of the records of each document, split into their attributes
         Returns:
             - output - unipartite graph in graphML format
         """
         graph = nx.Graph()
-        for source_doc_id, extracted_data in results.items():
-            records = [r.strip() for r in extracted_data.split(record_delimiter)]
-
-            for record in records:
-                record = re.sub(r"^\(|\)$", "", record.strip())
-                record_attributes = record.split(tuple_delimiter)
-
+        for source_doc_id, records in results.items():
+            for record_attributes in records:
                 if record_attributes[0] == '"entity"' and len(record_attributes) >= 4:
                     # add this record as a node in the G
                     entity_name = clean_str(record_attributes[1].upper())
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from graphrag.index.typing import ErrorHandlerFn
 from graphrag.index.utils.tokens import num_tokens_from_string
 from graphrag.llm import CompletionLLM
+from graphrag.utils.tokens import count_tokens_batch
 
 from .prompts import SUMMARIZE_PROMPT
 
@@ -98,8 +99,9 @@ class SummarizeExtractor:
         descriptions_collected = []
         result = ""
 
+        description_tokens = count_tokens_batch(descriptions)
         for i, description in enumerate(descriptions):
-            usable_tokens -= num_tokens_from_string(description)
+            usable_tokens -= description_tokens[i]
             descriptions_collected.append(description)
 
             # If buffer is full, or all descriptions have been added, summarize
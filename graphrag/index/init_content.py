@@ -7,6 +7,8 @@ import graphrag.config.defaults as defs
 INIT_YAML = f"""
 encoding_model: cl100k_base
 skip_workflows: []
+# max_concurrent_workflows: {defs.MAX_CONCURRENT_WORKFLOWS} # run independent workflows concurrently when > 1
+# table_registry_max_bytes: {defs.TABLE_REGISTRY_MAX_BYTES} # in-memory budget for handing tables between workflows, 0 to disable
 llm:
   api_key: ${{GRAPHRAG_API_KEY}}
   type: {defs.LLM_TYPE.value} # or azure_openai_chat
@@ -20,10 +22,19 @@ llm:
   # deployment_name: <azure_model_deployment_name>
   # tokens_per_minute: 150_000 # set a leaky bucket throttle
   # requests_per_minute: 10_000 # set a leaky bucket throttle
+  # minute_aligned_rate_limits: {str(defs.LLM_MINUTE_ALIGNED_RATE_LIMITS).lower()} # reset the throttles at the start of each minute instead of refilling continuously
+  # rate_limiter_type: {defs.LLM_RATE_LIMITER_TYPE.value} # or shared, to share the throttles with the other indexing processes on this machine
   # max_retries: {defs.LLM_MAX_RETRIES}
   # max_retry_wait: {defs.LLM_MAX_RETRY_WAIT}
   # sleep_on_rate_limit_recommendation: true # whether to sleep when azure suggests wait-times
   # concurrent_requests: {defs.LLM_CONCURRENT_REQUESTS} # the number of parallel inflight requests that may be made
+  # max_connections: {defs.LLM_MAX_CONNECTIONS} # the number of pooled connections, shared by the llms of the same api_base
+  # http2: {str(defs.LLM_HTTP2).lower()} # requires the h2 package
+  # batch_mode: {str(defs.LLM_BATCH_MODE).lower()} # submit the indexing prompts to the batch API, cheaper but slower
+  # batch_max_requests: {defs.LLM_BATCH_MAX_REQUESTS}
+  # batch_poll_interval: {defs.LLM_BATCH_POLL_INTERVAL}
+  # adaptive_concurrency: {str(defs.LLM_ADAPTIVE_CONCURRENCY).lower()} # grow concurrent_requests while the service is healthy, cut it on rate limits and timeouts
+  # max_concurrent_requests: {defs.LLM_MAX_CONCURRENT_REQUESTS} # the upper bound of adaptive concurrency
   # temperature: {defs.LLM_TEMPERATURE} # temperature for sampling
   # top_p: {defs.LLM_TOP_P} # top-p sampling
   # n: {defs.LLM_N} # Number of completions to generate
@@ -50,10 +61,16 @@ embeddings:
     # deployment_name: <azure_model_deployment_name>
     # tokens_per_minute: 150_000 # set a leaky bucket throttle
     # requests_per_minute: 10_000 # set a leaky bucket throttle
+    # minute_aligned_rate_limits: {str(defs.LLM_MINUTE_ALIGNED_RATE_LIMITS).lower()} # reset the throttles at the start of each minute instead of refilling continuously
+    # rate_limiter_type: {defs.LLM_RATE_LIMITER_TYPE.value} # or shared, to share the throttles with the other indexing processes on this machine
     # max_retries: {defs.LLM_MAX_RETRIES}
     # max_retry_wait: {defs.LLM_MAX_RETRY_WAIT}
     # sleep_on_rate_limit_recommendation: true # whether to sleep when azure suggests wait-times
     # concurrent_requests: {defs.LLM_CONCURRENT_REQUESTS} # the number of parallel inflight requests that may be made
+    # max_connections: {defs.LLM_MAX_CONNECTIONS} # the number of pooled connections, shared by the llms of the same api_base
+    # http2: {str(defs.LLM_HTTP2).lower()} # requires the h2 package
+    # adaptive_concurrency: {str(defs.LLM_ADAPTIVE_CONCURRENCY).lower()} # grow concurrent_requests while the service is healthy, cut it on rate limits and timeouts
+    # max_concurrent_requests: {defs.LLM_MAX_CONCURRENT_REQUESTS} # the upper bound of adaptive concurrency
     
   
 
@@ -62,6 +79,9 @@ chunks:
   size: {defs.CHUNK_SIZE}
   overlap: {defs.CHUNK_OVERLAP}
   group_by_columns: [{",".join(defs.CHUNK_GROUP_BY_COLUMNS)}] # by default, we don't allow chunks to cross documents
+  # num_threads: 4 # the number of threads chunking the documents, defaults to the number of CPUs
+  # dedup: {str(defs.CHUNK_DEDUP).lower()} # extract only one chunk of each set of near-duplicate chunks
+  # dedup_threshold: {defs.CHUNK_DEDUP_THRESHOLD}
     
 input:
   type: {defs.INPUT_TYPE.value} # or blob
@@ -71,8 +91,13 @@ input:
   file_pattern: ".*\\\\.txt$"
 
 cache:
-  type: {defs.CACHE_TYPE.value} # or blob
+  type: {defs.CACHE_TYPE.value} # or blob, sqlite
   base_dir: "{defs.CACHE_BASE_DIR}"
+  # max_bytes: {defs.CACHE_MAX_BYTES} # sqlite only, 0 for no limit
+  # ttl: {defs.CACHE_TTL} # sqlite only, in seconds, 0 for no expiry
+  # memory_max_entries: {defs.CACHE_MEMORY_MAX_ENTRIES} # in-memory tier in front of a file, blob or sqlite cache, 0 to disable
+  # memory_max_bytes: {defs.CACHE_MEMORY_MAX_BYTES}
+  # write_behind: {str(defs.CACHE_WRITE_BEHIND).lower()} # buffer writes to the cache and write them in batches
   # connection_string: <azure_blob_storage_connection_string>
   # container_name: <azure_blob_storage_container_name>
 
@@ -97,6 +122,8 @@ entity_extraction:
   prompt: "prompts/entity_extraction.txt"
   entity_types: [{",".join(defs.ENTITY_EXTRACTION_ENTITY_TYPES)}]
   max_gleanings: {defs.ENTITY_EXTRACTION_MAX_GLEANINGS}
+  # adaptive_gleaning: {str(defs.ENTITY_EXTRACTION_ADAPTIVE_GLEANING).lower()} # skip the gleanings unlikely to find new records
+  # stream_output: {str(defs.ENTITY_EXTRACTION_STREAM_OUTPUT).lower()} # parse the extracted records while they are generated
 
 summarize_descriptions:
   ## llm: override the global llm settings for this task
@@ -113,6 +140,7 @@ claim_extraction:
   prompt: "prompts/claim_extraction.txt"
   description: "{defs.CLAIM_DESCRIPTION}"
   max_gleanings: {defs.CLAIM_MAX_GLEANINGS}
+  # adaptive_gleaning: {str(defs.CLAIM_ADAPTIVE_GLEANING).lower()} # skip the gleanings unlikely to find new claims
 
 community_reports:
   ## llm: override the global llm settings for this task
@@ -3,12 +3,13 @@
 
 """The Indexing Engine LLM package root."""
 
-from .load_llm import load_llm, load_llm_embeddings
+from .load_llm import collect_llm_stats, load_llm, load_llm_embeddings
 from .types import TextListSplitter, TextSplitter
 
 __all__ = [
     "TextListSplitter",
     "TextSplitter",
+    "collect_llm_stats",
     "load_llm",
     "load_llm_embeddings",
 ]
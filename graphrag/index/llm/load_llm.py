@@ -7,15 +7,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from typing import TYPE_CHECKING, Any
 
+import graphrag.config.defaults as defs
 from graphrag.config.enums import LLMType
 from graphrag.llm import (
+    AdaptiveConcurrencyLimiter,
     CompletionLLM,
     EmbeddingLLM,
     LLMCache,
     LLMLimiter,
     MockCompletionLLM,
+    OnCacheActionFn,
+    OpenAIBatcher,
+    OpenAIClientTypes,
     OpenAIConfiguration,
     create_openai_chat_llm,
     create_openai_client,
@@ -32,8 +38,11 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
-_semaphores: dict[str, asyncio.Semaphore] = {}
+_semaphores: dict[str, asyncio.Semaphore | AdaptiveConcurrencyLimiter] = {}
 _rate_limiters: dict[str, LLMLimiter] = {}
+_batchers: dict[tuple[str | None, str], OpenAIBatcher] = {}
+_coalesced_calls: dict[str, int] = {}
+_coalesced_calls_lock = threading.Lock()
 
 
 def load_llm(
@@ -55,7 +64,7 @@ def load_llm(
             cache = cache.child(name)
 
         loader = loaders[llm_type]
-        return loader["load"](on_error, cache, llm_config or {})
+        return loader["load"](on_error, cache, llm_config or {}, name)
 
     msg = f"Unknown LLM type {llm_type}"
     raise ValueError(msg)
@@ -78,12 +87,30 @@ def load_llm_embeddings(
         if cache is not None:
             cache = cache.child(name)
 
-        return loaders[llm_type]["load"](on_error, cache, llm_config or {})
+        return loaders[llm_type]["load"](on_error, cache, llm_config or {}, name)
 
     msg = f"Unknown LLM type {llm_type}"
     raise ValueError(msg)
 
 
+def collect_llm_stats() -> dict[str, dict[str, int]]:
+    """Return the counts of the LLM calls made since the last collection, by LLM name."""
+    with _coalesced_calls_lock:
+        stats = {
+            name: {"coalesced_calls": count} for name, count in _coalesced_calls.items()
+        }
+        _coalesced_calls.clear()
+    return stats
+
+
+def _create_coalesced_handler(name: str) -> OnCacheActionFn:
+    def on_cache_coalesced(_key: str, _name: str | None) -> None:
+        with _coalesced_calls_lock:
+            _coalesced_calls[name] = _coalesced_calls.get(name, 0) + 1
+
+    return on_cache_coalesced
+
+
 def _create_error_handler(callbacks: VerbCallbacks) -> ErrorHandlerFn:
     def on_error(
         error: BaseException | None = None,
@@ -99,6 +126,7 @@ def _load_openai_completion_llm(
     on_error: ErrorHandlerFn,
     cache: LLMCache,
     config: dict[str, Any],
+    name: str,
     azure=False,
 ):
     return _create_openai_completion_llm(
@@ -115,6 +143,7 @@ def _load_openai_completion_llm(
         }),
         on_error,
         cache,
+        name,
         azure,
     )
 
@@ -123,6 +152,7 @@ def _load_openai_chat_llm(
     on_error: ErrorHandlerFn,
     cache: LLMCache,
     config: dict[str, Any],
+    name: str,
     azure=False,
 ):
     return _create_openai_chat_llm(
@@ -140,6 +170,7 @@ def _load_openai_chat_llm(
         }),
         on_error,
         cache,
+        name,
         azure,
     )
 
@@ -148,6 +179,7 @@ def _load_openai_embeddings_llm(
     on_error: ErrorHandlerFn,
     cache: LLMCache,
     config: dict[str, Any],
+    name: str,
     azure=False,
 ):
     # TODO: Inject Cache
@@ -161,26 +193,27 @@ def _load_openai_embeddings_llm(
         }),
         on_error,
         cache,
+        name,
         azure,
     )
 
 
 def _load_azure_openai_completion_llm(
-    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any]
+    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any], name: str
 ):
-    return _load_openai_completion_llm(on_error, cache, config, True)
+    return _load_openai_completion_llm(on_error, cache, config, name, True)
 
 
 def _load_azure_openai_chat_llm(
-    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any]
+    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any], name: str
 ):
-    return _load_openai_chat_llm(on_error, cache, config, True)
+    return _load_openai_chat_llm(on_error, cache, config, name, True)
 
 
 def _load_azure_openai_embeddings_llm(
-    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any]
+    on_error: ErrorHandlerFn, cache: LLMCache, config: dict[str, Any], name: str
 ):
-    return _load_openai_embeddings_llm(on_error, cache, config, True)
+    return _load_openai_embeddings_llm(on_error, cache, config, name, True)
 
 
 def _get_base_config(config: dict[str, Any]) -> dict[str, Any]:
@@ -205,7 +238,10 @@ def _get_base_config(config: dict[str, Any]) -> dict[str, Any]:
 
 
 def _load_static_response(
-    _on_error: ErrorHandlerFn, _cache: PipelineCache, config: dict[str, Any]
+    _on_error: ErrorHandlerFn,
+    _cache: PipelineCache,
+    config: dict[str, Any],
+    _name: str,
 ) -> CompletionLLM:
     return MockCompletionLLM(config.get("responses", []))
 
@@ -246,6 +282,7 @@ def _create_openai_chat_llm(
     configuration: OpenAIConfiguration,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    name: str,
     azure=False,
 ) -> CompletionLLM:
     """Create an openAI chat llm."""
@@ -253,7 +290,15 @@ def _create_openai_chat_llm(
     limiter = _create_limiter(configuration)
     semaphore = _create_semaphore(configuration)
     return create_openai_chat_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_error=on_error,
+        on_cache_coalesced=_create_coalesced_handler(name),
+        cache_namespace=name,
+        batcher=_create_batcher(configuration, client),
     )
 
 
@@ -261,6 +306,7 @@ def _create_openai_completion_llm(
     configuration: OpenAIConfiguration,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    name: str,
     azure=False,
 ) -> CompletionLLM:
     """Create an openAI completion llm."""
@@ -268,7 +314,14 @@ def _create_openai_completion_llm(
     limiter = _create_limiter(configuration)
     semaphore = _create_semaphore(configuration)
     return create_openai_completion_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_error=on_error,
+        on_cache_coalesced=_create_coalesced_handler(name),
+        cache_namespace=name,
     )
 
 
@@ -276,6 +329,7 @@ def _create_openai_embeddings_llm(
     configuration: OpenAIConfiguration,
     on_error: ErrorHandlerFn,
     cache: LLMCache,
+    name: str,
     azure=False,
 ) -> EmbeddingLLM:
     """Create an openAI embeddings llm."""
@@ -283,7 +337,14 @@ def _create_openai_embeddings_llm(
     limiter = _create_limiter(configuration)
     semaphore = _create_semaphore(configuration)
     return create_openai_embedding_llm(
-        client, configuration, cache, limiter, semaphore, on_error=on_error
+        client,
+        configuration,
+        cache,
+        limiter,
+        semaphore,
+        on_error=on_error,
+        on_cache_coalesced=_create_coalesced_handler(name),
+        cache_namespace=name,
     )
 
 
@@ -292,12 +353,42 @@ def _create_limiter(configuration: OpenAIConfiguration) -> LLMLimiter:
     if limit_name not in _rate_limiters:
         tpm = configuration.tokens_per_minute
         rpm = configuration.requests_per_minute
-        log.info("create TPM/RPM limiter for %s: TPM=%s, RPM=%s", limit_name, tpm, rpm)
-        _rate_limiters[limit_name] = create_tpm_rpm_limiters(configuration)
+        log.info(
+            "create %s TPM/RPM limiter for %s: TPM=%s, RPM=%s",
+            configuration.rate_limiter_type or "local",
+            limit_name,
+            tpm,
+            rpm,
+        )
+        # processes calling the same endpoint and model share their limits
+        shared_name = f"{configuration.api_base or 'openai'}/{limit_name}"
+        _rate_limiters[limit_name] = create_tpm_rpm_limiters(configuration, shared_name)
     return _rate_limiters[limit_name]
 
 
-def _create_semaphore(configuration: OpenAIConfiguration) -> asyncio.Semaphore | None:
+def _create_batcher(
+    configuration: OpenAIConfiguration, client: OpenAIClientTypes
+) -> OpenAIBatcher | None:
+    if not configuration.batch_mode:
+        return None
+
+    # the verbs load an llm per row, the batcher gathers the requests of all of them
+    # to the same endpoint, it submits them with the client of the first one
+    limit_name = configuration.model or configuration.deployment_name or "default"
+    batcher_key = (configuration.api_base, limit_name)
+    if batcher_key not in _batchers:
+        log.info("create batcher for %s at %s", limit_name, configuration.api_base)
+        _batchers[batcher_key] = OpenAIBatcher(
+            client,
+            configuration.batch_max_requests or defs.LLM_BATCH_MAX_REQUESTS,
+            configuration.batch_poll_interval or defs.LLM_BATCH_POLL_INTERVAL,
+        )
+    return _batchers[batcher_key]
+
+
+def _create_semaphore(
+    configuration: OpenAIConfiguration,
+) -> asyncio.Semaphore | AdaptiveConcurrencyLimiter | None:
     limit_name = configuration.model or configuration.deployment_name or "default"
     concurrency = configuration.concurrent_requests
 
@@ -307,7 +398,19 @@ def _create_semaphore(configuration: OpenAIConfiguration) -> asyncio.Semaphore |
         return None
 
     if limit_name not in _semaphores:
-        log.info("create concurrency limiter for %s: %s", limit_name, concurrency)
-        _semaphores[limit_name] = asyncio.Semaphore(concurrency)
+        if configuration.adaptive_concurrency:
+            max_concurrency = configuration.max_concurrent_requests or concurrency
+            log.info(
+                "create adaptive concurrency limiter for %s: %s, up to %s",
+                limit_name,
+                concurrency,
+                max_concurrency,
+            )
+            _semaphores[limit_name] = AdaptiveConcurrencyLimiter(
+                concurrency, max_concurrency
+            )
+        else:
+            log.info("create concurrency limiter for %s: %s", limit_name, concurrency)
+            _semaphores[limit_name] = asyncio.Semaphore(concurrency)
 
     return _semaphores[limit_name]
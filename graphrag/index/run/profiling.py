@@ -10,7 +10,7 @@ from dataclasses import asdict
 
 from datashaper import MemoryProfile, Workflow, WorkflowRunResult
 
-from graphrag.index.context import PipelineRunStats
+from graphrag.index.context import PipelineRunContext
 from graphrag.index.storage.typing import PipelineStorage
 
 log = logging.getLogger(__name__)
@@ -41,11 +41,13 @@ async def _save_profiler_stats(
     )
 
 
-async def _dump_stats(stats: PipelineRunStats, storage: PipelineStorage) -> None:
+async def _dump_stats(context: PipelineRunContext) -> None:
     """Dump the stats to the storage."""
-    await storage.set(
-        "stats.json", json.dumps(asdict(stats), indent=4, ensure_ascii=False)
-    )
+    async with context.stats_lock:
+        await context.storage.set(
+            "stats.json",
+            json.dumps(asdict(context.stats), indent=4, ensure_ascii=False),
+        )
 
 
 async def _write_workflow_stats(
@@ -53,21 +55,21 @@ async def _write_workflow_stats(
     workflow_result: WorkflowRunResult,
     workflow_start_time: float,
     start_time: float,
-    stats: PipelineRunStats,
-    storage: PipelineStorage,
+    context: PipelineRunContext,
 ) -> None:
     """Write the workflow stats to the storage."""
+    stats = context.stats
     for vt in workflow_result.verb_timings:
         stats.workflows[workflow.name][f"{vt.index}_{vt.verb}"] = vt.timing
 
     workflow_end_time = time.time()
     stats.workflows[workflow.name]["overall"] = workflow_end_time - workflow_start_time
     stats.total_runtime = time.time() - start_time
-    await _dump_stats(stats, storage)
+    await _dump_stats(context)
 
     if workflow_result.memory_profile is not None:
         await _save_profiler_stats(
-            storage, workflow.name, workflow_result.memory_profile
+            context.storage, workflow.name, workflow_result.memory_profile
         )
 
     log.debug(
@@ -11,15 +11,17 @@ from collections.abc import AsyncIterable
 from typing import cast
 
 import pandas as pd
-from datashaper import WorkflowCallbacks
+from datashaper import Workflow, WorkflowCallbacks
 
-from graphrag.index.cache import PipelineCache
+import graphrag.config.defaults as defs
+from graphrag.index.cache import PipelineCache, TieredPipelineCache
 from graphrag.index.config import (
     PipelineConfig,
     PipelineWorkflowReference,
     PipelineWorkflowStep,
 )
 from graphrag.index.emit import TableEmitterType, create_table_emitters
+from graphrag.index.llm import collect_llm_stats
 from graphrag.index.load_pipeline_config import load_pipeline_config
 from graphrag.index.progress import NullProgressReporter, ProgressReporter
 from graphrag.index.reporting import (
@@ -31,6 +33,7 @@ from graphrag.index.run.postprocess import (
     _run_post_process_steps,
 )
 from graphrag.index.run.profiling import _dump_stats
+from graphrag.index.run.table_registry import PipelineTableRegistry
 from graphrag.index.run.utils import (
     _apply_substitutions,
     _create_input,
@@ -41,9 +44,22 @@ from graphrag.index.run.utils import (
 from graphrag.index.run.workflow import (
     _create_callback_chain,
     _process_workflow,
+    _process_workflows_concurrently,
 )
 from graphrag.index.storage import PipelineStorage
 from graphrag.index.typing import PipelineRunResult
+from graphrag.index.update import (
+    DELTA_STORAGE_NAME,
+    DELTA_WORKFLOWS,
+    PREVIOUS_STORAGE_NAME,
+    UPDATE_STORAGE_NAME,
+    get_delta_docs,
+    get_graph_merge_operations,
+    invalidate_outputs,
+    merge_delta_outputs,
+    snapshot_previous_outputs,
+    swap_update_outputs,
+)
 
 # Register all verbs
 from graphrag.index.verbs import *  # noqa
@@ -52,6 +68,10 @@ from graphrag.index.workflows import (
     WorkflowDefinitions,
     load_workflows,
 )
+from graphrag.index.workflows.v1 import (
+    create_base_extracted_entities,
+    create_final_community_reports,
+)
 from graphrag.utils.storage import _create_storage
 
 log = logging.getLogger(__name__)
@@ -90,6 +110,8 @@ async def run_pipeline_with_config(
         - emit - The table emitters to use for the pipeline.
         - memory_profile - Whether or not to profile the memory.
         - run_id - The run id to start or resume from.
+        - is_resume_run - Whether to skip the workflows whose outputs already exist.
+        - is_update_run - Whether to update the index of `run_id` with the new, changed and removed documents only.
     """
     if isinstance(config_or_path, str):
         log.info("Running pipeline with config %s", config_or_path)
@@ -111,9 +133,6 @@ async def run_pipeline_with_config(
         else await _create_input(config.input, progress_reporter, root_dir)
     )
 
-    if is_update_run:
-        # TODO: Filter dataset to only include new data (this should be done in the input module)
-        pass
     post_process_steps = input_post_process_steps or _create_postprocess_steps(
         config.input
     )
@@ -123,10 +142,71 @@ async def run_pipeline_with_config(
         msg = "No dataset provided!"
         raise ValueError(msg)
 
+    update_storage = None
+    if is_update_run:
+        delta = await get_delta_docs(dataset, storage)
+        if delta.is_empty:
+            log.info("No new, changed or removed documents, the index is up to date")
+            return
+
+        if delta.has_previous_index:
+            # The update is staged, it replaces the index once all its workflows succeed
+            update_storage = storage.child(UPDATE_STORAGE_NAME)
+            await invalidate_outputs(update_storage, [w.name for w in workflows])
+            previous_storage = await snapshot_previous_outputs(storage, update_storage)
+            delta_storage = None
+            if len(delta.new_inputs) > 0:
+                delta_storage = update_storage.child(DELTA_STORAGE_NAME)
+                async for result in run_pipeline(
+                    workflows=[w for w in workflows if w.name in DELTA_WORKFLOWS],
+                    dataset=delta.new_inputs,
+                    storage=delta_storage,
+                    cache=cache,
+                    callbacks=callbacks,
+                    input_post_process_steps=post_process_steps,
+                    additional_verbs=additional_verbs,
+                    additional_workflows=additional_workflows,
+                    progress_reporter=progress_reporter,
+                    max_concurrent_workflows=config.max_concurrent_workflows or 1,
+                ):
+                    if result.errors:
+                        yield result
+                        return
+
+            extraction_config = next(
+                (
+                    w.config or {}
+                    for w in workflows
+                    if w.name == create_base_extracted_entities.workflow_name
+                ),
+                {},
+            )
+            await merge_delta_outputs(
+                update_storage,
+                previous_storage,
+                delta_storage,
+                delta.removed_document_ids,
+                get_graph_merge_operations(extraction_config),
+            )
+            for workflow in workflows:
+                if workflow.name == create_final_community_reports.workflow_name:
+                    workflow.config = {
+                        **(workflow.config or {}),
+                        "create_community_reports": {
+                            **(workflow.config or {}).get(
+                                "create_community_reports", {}
+                            ),
+                            "reuse_reports_from": PREVIOUS_STORAGE_NAME,
+                        },
+                    }
+            # The merged base tables are in place, recompute everything downstream
+            is_resume_run = True
+
+    failed = False
     async for table in run_pipeline(
         workflows=workflows,
         dataset=dataset,
-        storage=storage,
+        storage=update_storage or storage,
         cache=cache,
         callbacks=callbacks,
         input_post_process_steps=post_process_steps,
@@ -136,9 +216,24 @@ async def run_pipeline_with_config(
         progress_reporter=progress_reporter,
         emit=emit,
         is_resume_run=is_resume_run,
+        max_concurrent_workflows=config.max_concurrent_workflows or 1,
+        table_registry_max_bytes=(
+            config.table_registry_max_bytes
+            if config.table_registry_max_bytes is not None
+            else defs.TABLE_REGISTRY_MAX_BYTES
+        ),
     ):
+        failed = failed or bool(table.errors)
         yield table
 
+    if update_storage is not None:
+        if failed:
+            log.error("The update failed, the index is left unchanged")
+        else:
+            await swap_update_outputs(
+                storage, update_storage, [w.name for w in workflows]
+            )
+
 
 async def run_pipeline(
     workflows: list[PipelineWorkflowReference],
@@ -153,6 +248,8 @@ async def run_pipeline(
     emit: list[TableEmitterType] | None = None,
     memory_profile: bool = False,
     is_resume_run: bool = False,
+    max_concurrent_workflows: int = 1,
+    table_registry_max_bytes: int = defs.TABLE_REGISTRY_MAX_BYTES,
     **_kwargs: dict,
 ) -> AsyncIterable[PipelineRunResult]:
     """Run the pipeline.
@@ -171,10 +268,14 @@ async def run_pipeline(
         - additional_verbs - The custom verbs to use for the pipeline
         - additional_workflows - The custom workflows to use for the pipeline
         - debug - Whether or not to run in debug mode
+        - max_concurrent_workflows - The maximum number of independent workflows to run at once. When greater than 1, each workflow starts as soon as its upstream workflows complete.
+        - table_registry_max_bytes - The number of bytes of recent workflow outputs to keep in memory for downstream workflows. 0 reads every upstream table back from storage.
     Returns:
         - output - An iterable of workflow results as they complete running, as well as any errors that occur
     """
     start_time = time.time()
+    # drop the LLM call counts of the earlier runs of the process
+    collect_llm_stats()
 
     context = _create_run_context(storage=storage, cache=cache, stats=None)
 
@@ -199,6 +300,7 @@ async def run_pipeline(
     )
     workflows_to_run = loaded_workflows.workflows
     workflow_dependencies = loaded_workflows.dependencies
+    table_registry = PipelineTableRegistry(context.storage, table_registry_max_bytes)
 
     if len(emitters) == 0:
         log.info(
@@ -217,30 +319,70 @@ async def run_pipeline(
     last_workflow = "input"
 
     try:
-        await _dump_stats(context.stats, context.storage)
-
-        for workflow_to_run in workflows_to_run:
-            # Try to flush out any intermediate dataframes
-            gc.collect()
-
-            last_workflow = workflow_to_run.workflow.name
-            result = await _process_workflow(
-                workflow_to_run.workflow,
-                context,
-                callbacks,
-                emitters,
+        await _dump_stats(context)
+
+        if max_concurrent_workflows > 1:
+
+            async def process(workflow: Workflow) -> PipelineRunResult | None:
+                nonlocal last_workflow
+                try:
+                    return await _process_workflow(
+                        workflow,
+                        context,
+                        callbacks,
+                        emitters,
+                        workflow_dependencies,
+                        dataset,
+                        start_time,
+                        is_resume_run,
+                        table_registry,
+                    )
+                except Exception:
+                    last_workflow = workflow.name
+                    raise
+
+            async for workflow_name, result in _process_workflows_concurrently(
+                workflows_to_run,
                 workflow_dependencies,
-                dataset,
-                start_time,
-                is_resume_run,
-            )
-            if result:
-                yield result
+                max_concurrent_workflows,
+                process,
+            ):
+                # Try to flush out any intermediate dataframes
+                gc.collect()
+
+                last_workflow = workflow_name
+                if result:
+                    yield result
+        else:
+            for workflow_to_run in workflows_to_run:
+                # Try to flush out any intermediate dataframes
+                gc.collect()
+
+                last_workflow = workflow_to_run.workflow.name
+                result = await _process_workflow(
+                    workflow_to_run.workflow,
+                    context,
+                    callbacks,
+                    emitters,
+                    workflow_dependencies,
+                    dataset,
+                    start_time,
+                    is_resume_run,
+                    table_registry,
+                )
+                if result:
+                    yield result
 
+        await context.cache.flush()
+        if isinstance(context.cache, TieredPipelineCache):
+            context.stats.cache = context.cache.stats.to_dict()
+        context.stats.llm = collect_llm_stats()
         context.stats.total_runtime = time.time() - start_time
-        await _dump_stats(context.stats, context.storage)
+        await _dump_stats(context)
     except Exception as e:
         log.exception("error running workflow %s", last_workflow)
+        # keep the results of the completed calls for a resumed run
+        await context.cache.flush()
         cast(WorkflowCallbacks, callbacks).on_error(
             "Error running pipeline!", e, traceback.format_exc()
         )
@@ -0,0 +1,111 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'PipelineTableRegistry' model."""
+
+import logging
+from collections import OrderedDict
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.storage.typing import PipelineStorage
+from graphrag.utils.storage import _load_table_from_storage
+
+log = logging.getLogger(__name__)
+
+
+def table_size(table: pd.DataFrame) -> int:
+    """Get the in-memory size of a table in bytes."""
+    return int(table.memory_usage(index=True, deep=True).sum())
+
+
+class PipelineTableRegistry:
+    """A run-scoped registry of recent workflow outputs.
+
+    Tables are kept in memory, up to a byte budget, with least-recently-used
+    eviction. Lookups that miss the registry fall back to reading the emitted
+    parquet table from storage.
+    """
+
+    _storage: PipelineStorage
+    _max_bytes: int
+    _tables: OrderedDict[str, tuple[pd.DataFrame, int]]
+    _total_bytes: int
+
+    def __init__(self, storage: PipelineStorage, max_bytes: int):
+        """Create a new table registry.
+
+        Args:
+            - storage - The storage to fall back to on a miss.
+            - max_bytes - The maximum number of bytes to keep in memory. 0 disables the registry.
+        """
+        self._storage = storage
+        self._max_bytes = max_bytes
+        self._tables = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, name: str, table: pd.DataFrame, size: int | None = None) -> None:
+        """Register the output table of a workflow.
+
+        The size is measured from the table unless given, e.g. for tables holding
+        objects whose footprint pandas cannot measure.
+        """
+        self.discard(name)
+        if size is None:
+            size = table_size(table)
+        if size > self._max_bytes:
+            log.info(
+                "table %s (%d bytes) exceeds the registry budget, not retained",
+                name,
+                size,
+            )
+            return
+
+        self._tables[name] = (table, size)
+        self._total_bytes += size
+        while self._total_bytes > self._max_bytes:
+            evicted, (_, evicted_size) = self._tables.popitem(last=False)
+            self._total_bytes -= evicted_size
+            log.info("evicted table %s from the registry", evicted)
+
+    def discard(self, name: str) -> None:
+        """Remove a table from the registry, if present."""
+        entry = self._tables.pop(name, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    async def get(self, name: str) -> pd.DataFrame:
+        """Get the output table of a workflow.
+
+        A copy is returned on a hit, since verbs may modify their inputs in place.
+        The graphs held in its cells are copied too, the verbs annotate them in place.
+        """
+        entry = self._tables.get(name)
+        if entry is None:
+            self.misses += 1
+            return await _load_table_from_storage(f"{name}.parquet", self._storage)
+
+        self.hits += 1
+        self._tables.move_to_end(name)
+        log.info("read table from registry: %s", name)
+        return _copy_table(entry[0])
+
+    @property
+    def total_bytes(self) -> int:
+        """Get the number of bytes currently held in memory."""
+        return self._total_bytes
+
+
+def _copy_table(table: pd.DataFrame) -> pd.DataFrame:
+    """Copy a table, and the graphs of its graph columns."""
+    result = table.copy()
+    for column in result.select_dtypes(include="object").columns:
+        first = result[column].first_valid_index()
+        if first is not None and isinstance(result[column][first], nx.Graph):
+            result[column] = result[column].map(
+                lambda value: value.copy() if isinstance(value, nx.Graph) else value
+            )
+    return result
@@ -3,10 +3,13 @@
 
 """Workflow functions for the GraphRAG update module."""
 
+import asyncio
 import logging
 import time
+from collections.abc import AsyncIterable, Awaitable, Callable
 from typing import cast
 
+import networkx as nx
 import pandas as pd
 from datashaper import (
     DEFAULT_INPUT_NAME,
@@ -22,9 +25,10 @@ from graphrag.index.reporting.progress_workflow_callbacks import (
     ProgressWorkflowCallbacks,
 )
 from graphrag.index.run.profiling import _write_workflow_stats
-from graphrag.index.storage.typing import PipelineStorage
+from graphrag.index.run.table_registry import PipelineTableRegistry, table_size
 from graphrag.index.typing import PipelineRunResult
-from graphrag.utils.storage import _load_table_from_storage
+from graphrag.index.utils import graph_to_graphml
+from graphrag.index.workflows import WorkflowToRun
 
 log = logging.getLogger(__name__)
 
@@ -33,7 +37,7 @@ async def _inject_workflow_data_dependencies(
     workflow: Workflow,
     workflow_dependencies: dict[str, list[str]],
     dataset: pd.DataFrame,
-    storage: PipelineStorage,
+    table_registry: PipelineTableRegistry,
 ) -> None:
     """Inject the data dependencies into the workflow."""
     workflow.add_table(DEFAULT_INPUT_NAME, dataset)
@@ -41,18 +45,42 @@ async def _inject_workflow_data_dependencies(
     log.info("dependencies for %s: %s", workflow.name, deps)
     for id in deps:
         workflow_id = f"workflow:{id}"
-        table = await _load_table_from_storage(f"{id}.parquet", storage)
+        table = await table_registry.get(id)
         workflow.add_table(workflow_id, table)
 
 
+def _serialize_graph_columns(output: pd.DataFrame) -> pd.DataFrame:
+    """Convert columns holding networkx graphs to graphml strings for emitting."""
+    graph_columns = [
+        column
+        for column in output.columns
+        if output[column].dtype == object
+        and any(isinstance(value, nx.Graph) for value in output[column].dropna()[:1])
+    ]
+    if len(graph_columns) == 0:
+        return output
+
+    output = output.copy()
+    for column in graph_columns:
+        output[column] = output[column].apply(
+            lambda graph: graph_to_graphml(graph) if graph is not None else None
+        )
+    return output
+
+
 async def _emit_workflow_output(
     workflow: Workflow, emitters: list[TableEmitter]
-) -> pd.DataFrame:
-    """Emit the workflow output."""
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Emit the workflow output.
+
+    Graphs are passed between workflows as networkx objects, and only serialized
+    to graphml when emitted. Returns the in-memory and the emitted output.
+    """
     output = cast(pd.DataFrame, workflow.output())
+    emitted = _serialize_graph_columns(output)
     for emitter in emitters:
-        await emitter.emit(workflow.name, output)
-    return output
+        await emitter.emit(workflow.name, emitted)
+    return output, emitted
 
 
 def _create_callback_chain(
@@ -76,6 +104,7 @@ async def _process_workflow(
     dataset: pd.DataFrame,
     start_time: float,
     is_resume_run: bool,
+    table_registry: PipelineTableRegistry,
 ):
     workflow_name = workflow.name
     if is_resume_run and await context.storage.has(f"{workflow_name}.parquet"):
@@ -84,7 +113,7 @@ async def _process_workflow(
 
     context.stats.workflows[workflow_name] = {"overall": 0.0}
     await _inject_workflow_data_dependencies(
-        workflow, workflow_dependencies, dataset, context.storage
+        workflow, workflow_dependencies, dataset, table_registry
     )
 
     workflow_start_time = time.time()
@@ -94,11 +123,59 @@ async def _process_workflow(
         result,
         workflow_start_time,
         start_time,
-        context.stats,
-        context.storage,
+        context,
     )
 
     # Save the output from the workflow
-    output = await _emit_workflow_output(workflow, emitters)
+    output, emitted = await _emit_workflow_output(workflow, emitters)
+    table_registry.put(workflow_name, output, size=table_size(emitted))
     workflow.dispose()
-    return PipelineRunResult(workflow_name, output, None)
+    return PipelineRunResult(workflow_name, emitted, None)
+
+
+async def _process_workflows_concurrently(
+    workflows_to_run: list[WorkflowToRun],
+    workflow_dependencies: dict[str, list[str]],
+    max_concurrent_workflows: int,
+    process: Callable[[Workflow], Awaitable[PipelineRunResult | None]],
+) -> AsyncIterable[tuple[str, PipelineRunResult | None]]:
+    """Run each workflow as soon as all of its upstream workflows have completed.
+
+    Ready workflows are started in topological order, with at most
+    `max_concurrent_workflows` running at once. Results are yielded in completion
+    order. If a workflow fails, the remaining running workflows are cancelled and
+    the error is raised.
+    """
+    pending = [workflow_to_run.workflow for workflow_to_run in workflows_to_run]
+    waiting_on = {
+        workflow.name: set(workflow_dependencies.get(workflow.name, []))
+        for workflow in pending
+    }
+    running: dict[asyncio.Task, str] = {}
+
+    try:
+        while pending or running:
+            ready = [workflow for workflow in pending if not waiting_on[workflow.name]]
+            for workflow in ready[: max(max_concurrent_workflows - len(running), 0)]:
+                pending.remove(workflow)
+                log.info("Scheduling workflow %s", workflow.name)
+                running[asyncio.create_task(process(workflow))] = workflow.name
+
+            if not running:
+                msg = f"Unable to schedule workflows: {[w.name for w in pending]}"
+                raise ValueError(msg)
+
+            done, _ = await asyncio.wait(
+                running.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                workflow_name = running.pop(task)
+                result = task.result()
+                for dependencies in waiting_on.values():
+                    dependencies.discard(workflow_name)
+                yield workflow_name, result
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running.keys(), return_exceptions=True)
@@ -12,9 +12,14 @@ from enum import Enum
 from typing import Any, Literal, cast
 
 import pandas as pd
-import tiktoken
 
-from graphrag.index.utils import num_tokens_from_string
+from graphrag.utils.tokens import (
+    DEFAULT_ENCODING_NAME,
+    count_tokens,
+    count_tokens_batch,
+    get_encoding,
+    get_encoding_for_model,
+)
 
 EncodedText = list[int]
 DecodeFn = Callable[[EncodedText], str]
@@ -97,13 +102,9 @@ class TokenTextSplitter(TextSplitter):
         """Init method definition."""
         super().__init__(**kwargs)
         if model_name is not None:
-            try:
-                enc = tiktoken.encoding_for_model(model_name)
-            except KeyError:
-                log.exception("Model %s not found, using %s", model_name, encoding_name)
-                enc = tiktoken.get_encoding(encoding_name)
+            enc = get_encoding_for_model(model_name, encoding_name)
         else:
-            enc = tiktoken.get_encoding(encoding_name)
+            enc = get_encoding(encoding_name)
         self._tokenizer = enc
         self._allowed_special = allowed_special or set()
         self._disallowed_special = disallowed_special
@@ -165,9 +166,12 @@ class TextListSplitter(TextSplitter):
         self._type = splitter_type
         self._input_delimiter = input_delimiter
         self._output_delimiter = output_delimiter or "\n"
-        self._length_function = lambda x: num_tokens_from_string(
-            x, model=model_name, encoding_name=encoding_name
+        self._encoding = (
+            get_encoding_for_model(model_name, encoding_name or DEFAULT_ENCODING_NAME)
+            if model_name is not None
+            else get_encoding(encoding_name)
         )
+        self._length_function = lambda x: count_tokens(x, self._encoding)
 
     def split_text(self, text: str | list[str]) -> Iterable[str]:
         """Split a string list into a list of strings for a given chunk size."""
@@ -186,9 +190,11 @@ class TextListSplitter(TextSplitter):
         if len(string_list) == 1:
             return string_list
 
-        for item in string_list:
-            # Count the length of the item and add comma
-            item_length = self._length_function(f"{item},")
+        # Count the length of the items and add comma
+        item_lengths = count_tokens_batch(
+            [f"{item}," for item in string_list], self._encoding
+        )
+        for item, item_length in zip(string_list, item_lengths, strict=True):
 
             if current_length + item_length > self._chunk_size:
                 if current_chunk and len(current_chunk) > 0:
@@ -0,0 +1,37 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The Indexing Engine update package root."""
+
+from .community_reports import load_previous_reports, reuse_previous_reports
+from .incremental_index import (
+    DELTA_STORAGE_NAME,
+    DELTA_WORKFLOWS,
+    PREVIOUS_STORAGE_NAME,
+    UPDATE_STORAGE_NAME,
+    InputDelta,
+    get_delta_docs,
+    get_graph_merge_operations,
+    invalidate_outputs,
+    merge_delta_outputs,
+    prune_graph,
+    snapshot_previous_outputs,
+    swap_update_outputs,
+)
+
+__all__ = [
+    "DELTA_STORAGE_NAME",
+    "DELTA_WORKFLOWS",
+    "PREVIOUS_STORAGE_NAME",
+    "UPDATE_STORAGE_NAME",
+    "InputDelta",
+    "get_delta_docs",
+    "get_graph_merge_operations",
+    "invalidate_outputs",
+    "load_previous_reports",
+    "merge_delta_outputs",
+    "prune_graph",
+    "reuse_previous_reports",
+    "snapshot_previous_outputs",
+    "swap_update_outputs",
+]
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Community report reuse functions for the GraphRAG update module."""
+
+import logging
+from typing import Any
+
+import pandas as pd
+
+from graphrag.index.graph.extractors.community_reports import schemas
+from graphrag.index.storage.typing import PipelineStorage
+from graphrag.utils.storage import _load_table_from_storage
+
+log = logging.getLogger(__name__)
+
+_REPORT_COLUMNS = [
+    "title",
+    "summary",
+    "full_content",
+    "full_content_json",
+    "rank",
+    "rank_explanation",
+    "findings",
+]
+
+
+def _community_members(nodes: pd.DataFrame) -> dict[tuple[int, str], frozenset]:
+    """Get the titles of the nodes in each (level, community)."""
+    nodes = nodes[nodes[schemas.NODE_COMMUNITY].notna()]
+    return {
+        (int(level), str(community)): frozenset(group[schemas.NODE_NAME])
+        for (level, community), group in nodes.groupby([
+            schemas.NODE_LEVEL,
+            schemas.NODE_COMMUNITY,
+        ])
+    }
+
+
+async def load_previous_reports(
+    storage: PipelineStorage,
+) -> dict[tuple[int, frozenset], dict[str, Any]]:
+    """Load the previous community reports, keyed by level and community membership."""
+    if not await storage.has(
+        "create_final_community_reports.parquet"
+    ) or not await storage.has("create_final_nodes.parquet"):
+        return {}
+
+    nodes = await _load_table_from_storage("create_final_nodes.parquet", storage)
+    reports = await _load_table_from_storage(
+        "create_final_community_reports.parquet", storage
+    )
+    members = _community_members(nodes)
+    previous_reports = {}
+    for report in reports.to_dict("records"):
+        key = (int(report["level"]), str(report["community"]))
+        if key in members:
+            previous_reports[key[0], members[key]] = {
+                column: report[column] for column in _REPORT_COLUMNS
+            }
+    return previous_reports
+
+
+def reuse_previous_reports(
+    level_contexts: pd.DataFrame,
+    nodes: pd.DataFrame,
+    previous_reports: dict[tuple[int, frozenset], dict[str, Any]],
+) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
+    """Reuse the previous reports of the communities whose membership is unchanged.
+
+    Returns
+    -------
+        - output[0] - The contexts of the communities that need a new report.
+        - output[1] - The reused reports.
+    """
+    if len(level_contexts) == 0 or len(previous_reports) == 0:
+        return level_contexts, []
+
+    members = _community_members(nodes)
+    reused = []
+    is_reused = []
+    for community, level in zip(
+        level_contexts[schemas.NODE_COMMUNITY],
+        level_contexts[schemas.COMMUNITY_LEVEL],
+        strict=True,
+    ):
+        key = (int(level), members.get((int(level), str(community)), frozenset()))
+        report = previous_reports.get(key)
+        is_reused.append(report is not None)
+        if report is not None:
+            reused.append({**report, "community": community, "level": level})
+
+    if len(reused) > 0:
+        log.info("reusing %d previous community reports", len(reused))
+    return level_contexts[[not r for r in is_reused]], reused
@@ -0,0 +1,328 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Incremental indexing functions for the GraphRAG update module."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, cast
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.index.config import PipelineWorkflowConfig
+from graphrag.index.storage.typing import PipelineStorage
+from graphrag.index.utils import gen_md5_hash, load_graph
+from graphrag.index.verbs.graph.merge.merge_graphs import (
+    _get_detailed_attribute_merge_operation,
+    merge_graph_list,
+)
+from graphrag.index.workflows.v1 import create_base_extracted_entities
+from graphrag.utils.storage import _load_table_from_storage
+
+log = logging.getLogger(__name__)
+
+PREVIOUS_STORAGE_NAME = "previous"
+"""The child storage holding the outputs of the index being updated."""
+
+UPDATE_STORAGE_NAME = "update"
+"""The child storage an update is staged in, until it replaces the index."""
+
+DELTA_STORAGE_NAME = "delta"
+"""The child storage holding the outputs extracted from new and changed documents."""
+
+DELTA_WORKFLOWS = [
+    "create_base_text_units",
+    "create_base_extracted_entities",
+    "create_final_covariates",
+]
+"""The workflows that are run on new and changed documents only."""
+
+PREVIOUS_TABLES = [
+    "create_final_documents",
+    "create_base_text_units",
+    "create_base_extracted_entities",
+    "create_final_covariates",
+    "create_final_nodes",
+    "create_final_community_reports",
+]
+"""The tables of the previous index that an update reads."""
+
+
+@dataclass
+class InputDelta:
+    """The difference between the input documents and a previous index."""
+
+    new_inputs: pd.DataFrame
+    """The documents that are new or whose content changed."""
+
+    removed_document_ids: set[str]
+    """The previous document ids that were changed or deleted."""
+
+    has_previous_index: bool
+    """Whether a previous index was found."""
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if there is nothing to update."""
+        return (
+            self.has_previous_index
+            and len(self.new_inputs) == 0
+            and len(self.removed_document_ids) == 0
+        )
+
+
+def _content_hash(text: Any) -> str:
+    return gen_md5_hash({"text": text}, ["text"])
+
+
+async def get_delta_docs(
+    input_dataset: pd.DataFrame, storage: PipelineStorage
+) -> InputDelta:
+    """Compare the input documents with the documents of a previous index.
+
+    Documents are matched by title and compared by a hash of their text.
+
+    Args:
+        - input_dataset - The input documents.
+        - storage - The storage holding the previous index.
+
+    Returns
+    -------
+        - output - The new and changed documents, and the previous document ids to remove.
+    """
+    if not await storage.has("create_final_documents.parquet"):
+        log.warning("No previous index found, all documents will be indexed")
+        return InputDelta(input_dataset, set(), has_previous_index=False)
+
+    previous_docs = await _load_table_from_storage(
+        "create_final_documents.parquet", storage
+    )
+    previous_hashes = {
+        (title, _content_hash(text)): str(doc_id)
+        for title, text, doc_id in zip(
+            previous_docs["title"],
+            previous_docs["raw_content"],
+            previous_docs["id"],
+            strict=True,
+        )
+    }
+    input_keys = [
+        (title, _content_hash(text))
+        for title, text in zip(
+            input_dataset["title"], input_dataset["text"], strict=True
+        )
+    ]
+
+    is_new = [key not in previous_hashes for key in input_keys]
+    kept_keys = set(input_keys)
+    removed_document_ids = {
+        doc_id for key, doc_id in previous_hashes.items() if key not in kept_keys
+    }
+    new_inputs = input_dataset[is_new].reset_index(drop=True)
+    log.info(
+        "update found %d new or changed documents and %d removed documents",
+        len(new_inputs),
+        len(removed_document_ids),
+    )
+    return InputDelta(new_inputs, removed_document_ids, has_previous_index=True)
+
+
+async def snapshot_previous_outputs(
+    storage: PipelineStorage, update_storage: PipelineStorage
+) -> PipelineStorage:
+    """Copy the tables of the previous index that an update reads into the update storage."""
+    previous_storage = update_storage.child(PREVIOUS_STORAGE_NAME)
+    for name in PREVIOUS_TABLES:
+        filename = f"{name}.parquet"
+        if await storage.has(filename):
+            await previous_storage.set(
+                filename, await storage.get(filename, as_bytes=True)
+            )
+    return previous_storage
+
+
+def get_graph_merge_operations(config: PipelineWorkflowConfig) -> dict[str, Any]:
+    """Get the node and edge merge operations used by create_base_extracted_entities."""
+    steps = create_base_extracted_entities.build_steps(config)
+    merge_step = next(step for step in steps if step["verb"] == "merge_graphs")
+    args = merge_step.get("args", {})
+    return {"nodes": args.get("nodes", {}), "edges": args.get("edges", {})}
+
+
+def prune_graph(
+    graph: nx.Graph, removed_text_unit_ids: set[str], separator: str = ","
+) -> nx.Graph:
+    """Remove the provenance of the given text units from the graph.
+
+    Nodes and edges that were only extracted from the removed text units are dropped.
+    Descriptions cannot be attributed to a text unit, so the descriptions of the
+    remaining nodes and edges are kept as they are.
+    """
+    if len(removed_text_unit_ids) == 0:
+        return graph
+
+    def prune(data: dict[str, Any]) -> bool:
+        source_ids = [
+            source_id
+            for source_id in str(data.get("source_id", "")).split(separator)
+            if source_id.strip() and source_id.strip() not in removed_text_unit_ids
+        ]
+        data["source_id"] = separator.join(source_ids)
+        return len(source_ids) == 0
+
+    graph.remove_edges_from([
+        (source, target)
+        for source, target, data in graph.edges(data=True)
+        if prune(data)
+    ])
+    graph.remove_nodes_from([
+        node for node, data in graph.nodes(data=True) if prune(data)
+    ])
+    return graph
+
+
+async def merge_delta_outputs(
+    storage: PipelineStorage,
+    previous_storage: PipelineStorage,
+    delta_storage: PipelineStorage | None,
+    removed_document_ids: set[str],
+    graph_merge_operations: dict[str, Any],
+) -> None:
+    """Merge the outputs extracted from the delta documents into the previous index.
+
+    Writes the merged create_base_text_units, create_base_extracted_entities and
+    create_final_covariates tables to the storage.
+    """
+    previous_text_units = await _load_table_from_storage(
+        "create_base_text_units.parquet", previous_storage
+    )
+    delta_text_units = (
+        await _load_table_from_storage("create_base_text_units.parquet", delta_storage)
+        if delta_storage is not None
+        else None
+    )
+    # a text unit shared with a kept document stays, without the removed documents
+    previous_text_units["document_ids"] = [
+        [
+            document_id
+            for document_id in document_ids
+            if str(document_id) not in removed_document_ids
+        ]
+        for document_ids in previous_text_units["document_ids"]
+    ]
+    # unless the delta extracted it again, from a new or changed document
+    is_redone = previous_text_units["id"].isin(
+        delta_text_units["id"] if delta_text_units is not None else []
+    )
+    is_removed = (previous_text_units["document_ids"].apply(len) == 0) | is_redone
+    removed_text_unit_ids = set(previous_text_units.loc[is_removed, "id"])
+    text_units = [previous_text_units[~is_removed]]
+
+    if delta_text_units is not None:
+        # the redone text units keep their other documents
+        carried_document_ids = dict(
+            zip(
+                previous_text_units.loc[is_redone, "id"],
+                previous_text_units.loc[is_redone, "document_ids"],
+                strict=True,
+            )
+        )
+        delta_text_units["document_ids"] = [
+            [*carried_document_ids.get(text_unit_id, []), *document_ids]
+            for text_unit_id, document_ids in zip(
+                delta_text_units["id"], delta_text_units["document_ids"], strict=True
+            )
+        ]
+        text_units.append(delta_text_units)
+
+    previous_entities = await _load_table_from_storage(
+        "create_base_extracted_entities.parquet", previous_storage
+    )
+    graph = prune_graph(
+        load_graph(previous_entities["entity_graph"].iloc[0]), removed_text_unit_ids
+    )
+
+    covariates = []
+    if await previous_storage.has("create_final_covariates.parquet"):
+        previous_covariates = await _load_table_from_storage(
+            "create_final_covariates.parquet", previous_storage
+        )
+        covariates.append(
+            previous_covariates[
+                ~previous_covariates["text_unit_id"].isin(removed_text_unit_ids)
+            ]
+        )
+
+    if delta_storage is not None:
+        delta_entities = await _load_table_from_storage(
+            "create_base_extracted_entities.parquet", delta_storage
+        )
+        node_ops = {
+            attrib: _get_detailed_attribute_merge_operation(value)
+            for attrib, value in graph_merge_operations["nodes"].items()
+        }
+        edge_ops = {
+            attrib: _get_detailed_attribute_merge_operation(value)
+            for attrib, value in graph_merge_operations["edges"].items()
+        }
+        delta_graphs = [
+            load_graph(cast(str | nx.Graph, graphml))
+            for graphml in delta_entities["entity_graph"]
+        ]
+        graph = merge_graph_list([graph, *delta_graphs], node_ops, edge_ops)
+        if await delta_storage.has("create_final_covariates.parquet"):
+            covariates.append(
+                await _load_table_from_storage(
+                    "create_final_covariates.parquet", delta_storage
+                )
+            )
+
+    log.info(
+        "merged delta outputs, removed %d text units from the previous index",
+        len(removed_text_unit_ids),
+    )
+    merged_text_units = pd.concat(text_units, ignore_index=True)
+    await storage.set("create_base_text_units.parquet", merged_text_units.to_parquet())
+    merged_entities = pd.DataFrame({
+        "entity_graph": ["\n".join(nx.generate_graphml(graph))]
+    })
+    await storage.set(
+        "create_base_extracted_entities.parquet", merged_entities.to_parquet()
+    )
+    if len(covariates) > 0:
+        merged_covariates = pd.concat(covariates, ignore_index=True)
+        merged_covariates["human_readable_id"] = [
+            str(i) for i in range(1, len(merged_covariates) + 1)
+        ]
+        await storage.set(
+            "create_final_covariates.parquet", merged_covariates.to_parquet()
+        )
+
+
+async def invalidate_outputs(storage: PipelineStorage, workflows: list[str]) -> None:
+    """Delete the outputs of the given workflows so that they are recomputed."""
+    for workflow in workflows:
+        filename = f"{workflow}.parquet"
+        if await storage.has(filename):
+            await storage.delete(filename)
+
+
+async def swap_update_outputs(
+    storage: PipelineStorage, update_storage: PipelineStorage, workflows: list[str]
+) -> None:
+    """Replace the outputs of the index with the outputs of a successful update."""
+    filenames = [
+        *(
+            f"{workflow}.{extension}"
+            for workflow in workflows
+            for extension in ["parquet", "csv", "json"]
+        ),
+        "stats.json",
+    ]
+    for filename in filenames:
+        if await update_storage.has(filename):
+            await storage.set(
+                filename, await update_storage.get(filename, as_bytes=True)
+            )
+    log.info("replaced the index with the outputs of the update")
@@ -6,7 +6,7 @@
 from .dicts import dict_has_keys_with_types
 from .hashing import gen_md5_hash
 from .is_null import is_null
-from .load_graph import load_graph
+from .load_graph import graph_to_graphml, load_graph
 from .string import clean_str
 from .tokens import num_tokens_from_string, string_from_tokens
 from .topological_sort import topological_sort
@@ -17,6 +17,7 @@ __all__ = [
     "dict_has_keys_with_types",
     "gen_md5_hash",
     "gen_uuid",
+    "graph_to_graphml",
     "is_null",
     "load_graph",
     "num_tokens_from_string",
@@ -6,6 +6,17 @@
 import networkx as nx
 
 
-def load_graph(graphml: str | nx.Graph) -> nx.Graph:
-    """Load a graph from a graphml file or a networkx graph."""
-    return nx.parse_graphml(graphml) if isinstance(graphml, str) else graphml
+def load_graph(graphml: str | nx.Graph, copy: bool = False) -> nx.Graph:
+    """Load a graph from a graphml file or a networkx graph.
+
+    Graphs are passed between verbs as networkx graphs, and may be shared by several
+    tables. Set `copy` when the caller modifies the graph.
+    """
+    if isinstance(graphml, str):
+        return nx.parse_graphml(graphml)
+    return graphml.copy() if copy else graphml
+
+
+def graph_to_graphml(graph: str | nx.Graph) -> str:
+    """Serialize a networkx graph to a graphml string, for export and snapshots."""
+    return graph if isinstance(graph, str) else "\n".join(nx.generate_graphml(graph))
@@ -0,0 +1,111 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Near-duplicate detection with MinHash signatures and locality-sensitive hashing."""
+
+import re
+import zlib
+from collections import defaultdict
+from functools import cache
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SEED = 1
+
+
+def find_near_duplicates(
+    texts: list[str],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+) -> list[int]:
+    """Map each text to the index of its canonical text.
+
+    Texts are compared by the Jaccard similarity of their word shingles, estimated
+    from MinHash signatures. Candidate pairs are found with LSH bands. A text whose
+    similarity to an earlier canonical text reaches the threshold maps to the first
+    such text, every other text is canonical and maps to itself. Each duplicate is
+    similar to its own canonical text, duplicates are not chained.
+
+    Args:
+        - texts - The texts to compare.
+        - threshold - The Jaccard similarity above which two texts are near-duplicates.
+        - num_perm - The number of hash functions of the signatures.
+        - shingle_size - The number of words of a shingle.
+    Returns:
+        - output - The index of the canonical text of each text.
+    """
+    signatures = (
+        np.stack([_minhash(_shingles(text, shingle_size), num_perm) for text in texts])
+        if texts
+        else np.empty((0, num_perm), dtype=np.uint64)
+    )
+    bands, rows = _lsh_params(threshold, num_perm)
+
+    canonical = list(range(len(texts)))
+    buckets: list[dict[bytes, list[int]]] = [defaultdict(list) for _ in range(bands)]
+    for index, signature in enumerate(signatures):
+        keys = [
+            signature[band * rows : (band + 1) * rows].tobytes()
+            for band in range(bands)
+        ]
+        candidates = sorted({
+            other for band, key in enumerate(keys) for other in buckets[band][key]
+        })
+        for other in candidates:
+            if np.mean(signatures[other] == signature) >= threshold:
+                canonical[index] = other
+                break
+        else:
+            # only canonical texts are candidates, so that duplicates are not chained
+            for band, key in enumerate(keys):
+                buckets[band][key].append(index)
+    return canonical
+
+
+def _shingles(text: str, shingle_size: int) -> set[bytes]:
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= shingle_size:
+        return {" ".join(words).encode("utf-8")}
+    return {
+        " ".join(words[i : i + shingle_size]).encode("utf-8")
+        for i in range(len(words) - shingle_size + 1)
+    }
+
+
+@cache
+def _permutations(num_perm: int) -> tuple[np.ndarray, np.ndarray]:
+    generator = np.random.default_rng(_SEED)
+    a = generator.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    b = generator.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def _minhash(shingles: set[bytes], num_perm: int) -> np.ndarray:
+    hashes = np.fromiter(
+        (zlib.crc32(shingle) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    a, b = _permutations(num_perm)
+    # the products wrap around, which keeps them pseudo-random
+    permuted = (np.outer(hashes, a) + b) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=0)
+
+
+def _lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Return the number of bands and of rows per band whose S-curve crosses the threshold."""
+    return min(
+        (
+            (bands, num_perm // bands)
+            for bands in range(1, num_perm + 1)
+            if num_perm % bands == 0
+        ),
+        key=lambda params: abs((1 / params[0]) ** (1 / params[1]) - threshold),
+    )
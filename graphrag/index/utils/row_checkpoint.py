@@ -0,0 +1,145 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'RowCheckpoint' model."""
+
+import json
+import logging
+from hashlib import md5
+from io import BytesIO
+from typing import Any
+
+import pyarrow as pa
+
+from graphrag.index.storage.typing import PipelineStorage
+
+log = logging.getLogger(__name__)
+
+CHECKPOINT_STORAGE_NAME = "checkpoints"
+DEFAULT_CHECKPOINT_BATCH_SIZE = 50
+
+_SCHEMA = pa.schema([("key", pa.string()), ("value", pa.string())])
+
+
+class RowCheckpoint:
+    """Persist completed row results of a verb so that an interrupted run can resume.
+
+    Results are buffered and written to storage as numbered Arrow record batches.
+    Loading reads the batches back in order, so finished rows are restored without
+    running, parsing or validating them again.
+    """
+
+    _storage: PipelineStorage
+    _name: str
+    _batch_size: int
+    _results: dict[str, Any]
+    _pending: list[tuple[str, str]]
+    _num_batches: int
+
+    def __init__(
+        self,
+        storage: PipelineStorage,
+        name: str,
+        batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE,
+    ):
+        """Create a new row checkpoint.
+
+        Args:
+            - storage - The run storage, checkpoints are written to a child storage of it.
+            - name - The name of the checkpoint, usually the verb name.
+            - batch_size - The number of rows per record batch. 0 disables checkpointing.
+        """
+        self._storage = storage.child(CHECKPOINT_STORAGE_NAME)
+        self._name = name
+        self._batch_size = batch_size
+        self._results = {}
+        self._pending = []
+        self._num_batches = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if results are persisted."""
+        return self._batch_size > 0
+
+    @staticmethod
+    def create_key(*parts: Any) -> str:
+        """Create a row key from the inputs that determine the row result."""
+        data = json.dumps(parts, sort_keys=True, default=str)
+        return md5(data.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def _batch_key(self, index: int) -> str:
+        return f"{self._name}-{index:06d}.arrow"
+
+    async def load(self) -> int:
+        """Load the results persisted by a previous run.
+
+        Returns
+        -------
+            - output - The number of restored rows.
+        """
+        if not self.enabled:
+            return 0
+
+        while await self._storage.has(self._batch_key(self._num_batches)):
+            data = await self._storage.get(
+                self._batch_key(self._num_batches), as_bytes=True
+            )
+            with pa.ipc.open_stream(BytesIO(data)) as reader:
+                table = reader.read_all()
+            for key, value in zip(
+                table.column("key").to_pylist(),
+                table.column("value").to_pylist(),
+                strict=True,
+            ):
+                self._results[key] = json.loads(value)
+            self._num_batches += 1
+
+        if len(self._results) > 0:
+            log.info(
+                "restored %d rows from checkpoint %s", len(self._results), self._name
+            )
+        return len(self._results)
+
+    def get(self, key: str) -> Any | None:
+        """Get a restored result, or None if the row has not been completed."""
+        return self._results.get(key)
+
+    async def add(self, key: str, value: Any) -> None:
+        """Record the result of a completed row."""
+        if not self.enabled:
+            return
+
+        self._results[key] = value
+        self._pending.append((key, json.dumps(value, default=str)))
+        if len(self._pending) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the buffered results as a new record batch."""
+        if not self.enabled or len(self._pending) == 0:
+            return
+
+        pending, self._pending = self._pending, []
+        index = self._num_batches
+        self._num_batches += 1
+
+        batch = pa.record_batch(
+            [
+                pa.array([key for key, _ in pending], pa.string()),
+                pa.array([value for _, value in pending], pa.string()),
+            ],
+            schema=_SCHEMA,
+        )
+        sink = BytesIO()
+        with pa.ipc.new_stream(sink, _SCHEMA) as writer:
+            writer.write_batch(batch)
+        await self._storage.set(self._batch_key(index), sink.getvalue())
+
+    async def clear(self) -> None:
+        """Delete the persisted results, once the verb has completed."""
+        for index in range(self._num_batches):
+            if await self._storage.has(self._batch_key(index)):
+                await self._storage.delete(self._batch_key(index))
+        self._results = {}
+        self._pending = []
+        self._num_batches = 0
@@ -5,9 +5,13 @@
 
 import logging
 
-import tiktoken
+from graphrag.utils.tokens import (
+    DEFAULT_ENCODING_NAME,
+    count_tokens,
+    get_encoding,
+    get_encoding_for_model,
+)
 
-DEFAULT_ENCODING_NAME = "cl100k_base"
 log = logging.getLogger(__name__)
 
 
@@ -16,15 +20,10 @@ def num_tokens_from_string(
 ) -> int:
     """Return the number of tokens in a text string."""
     if model is not None:
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            msg = f"Failed to get encoding for {model} when getting num_tokens_from_string. Fall back to default encoding {DEFAULT_ENCODING_NAME}"
-            log.warning(msg)
-            encoding = tiktoken.get_encoding(DEFAULT_ENCODING_NAME)
+        encoding = get_encoding_for_model(model, DEFAULT_ENCODING_NAME)
     else:
-        encoding = tiktoken.get_encoding(encoding_name or DEFAULT_ENCODING_NAME)
-    return len(encoding.encode(string))
+        encoding = get_encoding(encoding_name)
+    return count_tokens(string, encoding)
 
 
 def string_from_tokens(
@@ -32,9 +31,9 @@ def string_from_tokens(
 ) -> str:
     """Return a text string from a list of tokens."""
     if model is not None:
-        encoding = tiktoken.encoding_for_model(model)
+        encoding = get_encoding_for_model(model)
     elif encoding_name is not None:
-        encoding = tiktoken.get_encoding(encoding_name)
+        encoding = get_encoding(encoding_name)
     else:
         msg = "Either model or encoding_name must be specified."
         raise ValueError(msg)
@@ -25,7 +25,8 @@ def validate_config_names(
         parameters.llm.type,
         NoopVerbCallbacks(),
         None,
-        parameters.llm.model_dump(),
+        # a connectivity test should not wait for a batch
+        {**parameters.llm.model_dump(), "batch_mode": False},
     )
     try:
         asyncio.run(llm("This is an LLM connectivity test. Say Hello World"))
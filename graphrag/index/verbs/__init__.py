@@ -19,7 +19,7 @@ from .overrides import aggregate, concat, merge
 from .snapshot import snapshot
 from .snapshot_rows import snapshot_rows
 from .spread_json import spread_json
-from .text import chunk, text_embed, text_split, text_translate
+from .text import chunk, text_dedup, text_embed, text_split, text_translate
 from .unzip import unzip
 from .zip import zip_verb
 
@@ -41,6 +41,7 @@ __all__ = [
     "snapshot_rows",
     "spread_json",
     "summarize_descriptions",
+    "text_dedup",
     "text_embed",
     "text_split",
     "text_translate",
@@ -19,6 +19,7 @@ from datashaper import (
 )
 
 from graphrag.index.cache import PipelineCache
+from graphrag.index.graph.extractors import pop_gleaning_policy
 from graphrag.index.verbs.covariates.typing import Covariate, CovariateExtractStrategy
 
 log = logging.getLogger(__name__)
@@ -47,6 +48,8 @@ async def extract_covariates(
     strategy: dict[str, Any] | None,
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types: list[str] | None = None,
+    id_column: str = "chunk_id",
+    canonical_id_column: str | None = None,
     **kwargs,
 ) -> TableContainer:
     """
@@ -73,19 +76,36 @@ async def extract_covariates(
         result = await strategy_exec(
             text, entity_types, resolved_entities_map, callbacks, cache, strategy_config
         )
-        return [
-            create_row_from_claim_data(row, item, covariate_type)
-            for item in result.covariate_data
-        ]
+        return result.covariate_data
+
+    rows = output
+    if canonical_id_column is not None:
+        # only the canonical rows are extracted, their near-duplicates reuse the claims
+        rows = output[output[canonical_id_column] == output[id_column]]
 
     results = await derive_from_rows(
-        output,
+        rows,
         run_strategy,
         callbacks,
         scheduling_type=async_mode,
         num_threads=kwargs.get("num_threads", 4),
     )
-    output = pd.DataFrame([item for row in results for item in row or []])
+    policy = pop_gleaning_policy("claim_extraction")
+    if policy is not None:
+        message, details = policy.report()
+        callbacks.log(message, details)
+
+    if canonical_id_column is not None:
+        results_by_id = dict(zip(rows[id_column], results, strict=True))
+        results = [
+            results_by_id.get(canonical_id)
+            for canonical_id in output[canonical_id_column]
+        ]
+    output = pd.DataFrame([
+        create_row_from_claim_data(row, item, covariate_type)
+        for (_, row), covariate_data in zip(output.iterrows(), results, strict=True)
+        for item in covariate_data or []
+    ])
     return TableContainer(table=output)
 
 
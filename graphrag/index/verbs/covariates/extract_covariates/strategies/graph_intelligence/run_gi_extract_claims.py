@@ -11,6 +11,7 @@ from datashaper import VerbCallbacks
 import graphrag.config.defaults as defs
 from graphrag.config.enums import LLMType
 from graphrag.index.cache import PipelineCache
+from graphrag.index.graph.extractors import get_gleaning_policy
 from graphrag.index.graph.extractors.claims import ClaimExtractor
 from graphrag.index.llm import load_llm
 from graphrag.index.verbs.covariates.typing import (
@@ -51,6 +52,9 @@ async def _execute(
 ) -> CovariateExtractionResult:
     extraction_prompt = strategy_config.get("extraction_prompt")
     max_gleanings = strategy_config.get("max_gleanings", defs.CLAIM_MAX_GLEANINGS)
+    adaptive_gleaning = strategy_config.get(
+        "adaptive_gleaning", defs.CLAIM_ADAPTIVE_GLEANING
+    )
     tuple_delimiter = strategy_config.get("tuple_delimiter")
     record_delimiter = strategy_config.get("record_delimiter")
     completion_delimiter = strategy_config.get("completion_delimiter")
@@ -60,6 +64,9 @@ async def _execute(
         llm_invoker=llm,
         extraction_prompt=extraction_prompt,
         max_gleanings=max_gleanings,
+        gleaning_policy=(
+            get_gleaning_policy("claim_extraction") if adaptive_gleaning else None
+        ),
         encoding_model=encoding_model,
         on_error=lambda e, s, d: (
             reporter.error("Claim Extraction Error", e, s, d) if reporter else None
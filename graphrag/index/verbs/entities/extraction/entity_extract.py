@@ -7,6 +7,7 @@ import logging
 from enum import Enum
 from typing import Any, cast
 
+import networkx as nx
 import pandas as pd
 from datashaper import (
     AsyncType,
@@ -19,6 +20,12 @@ from datashaper import (
 
 from graphrag.index.bootstrap import bootstrap
 from graphrag.index.cache import PipelineCache
+from graphrag.index.graph.extractors import pop_gleaning_policy
+from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils.row_checkpoint import (
+    DEFAULT_CHECKPOINT_BATCH_SIZE,
+    RowCheckpoint,
+)
 
 from .strategies.typing import Document, EntityExtractStrategy
 
@@ -44,6 +51,7 @@ DEFAULT_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 async def entity_extract(
     input: VerbInput,
     cache: PipelineCache,
+    storage: PipelineStorage,
     callbacks: VerbCallbacks,
     column: str,
     id_column: str,
@@ -52,6 +60,8 @@ async def entity_extract(
     graph_to: str | None = None,
     async_mode: AsyncType = AsyncType.AsyncIO,
     entity_types=DEFAULT_ENTITY_TYPES,
+    checkpoint_batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE,
+    canonical_id_column: str | None = None,
     **kwargs,
 ) -> TableContainer:
     """
@@ -66,10 +76,12 @@ async def entity_extract(
             "column": "the_document_text_column_to_extract_entities_from", /* In general this will be your document text column */
             "id_column": "the_column_with_the_unique_id_for_each_row", /* In general this will be your document id */
             "to": "the_column_to_output_the_entities_to", /* This will be a list[dict[str, Any]] a list of entities, with a name, and additional attributes */
-            "graph_to": "the_column_to_output_the_graphml_to", /* Optional: This will be a graphml graph in string form which represents the entities and their relationships */
+            "graph_to": "the_column_to_output_the_graph_to", /* Optional: This will be a networkx graph which represents the entities and their relationships */
             "strategy": {...} <strategy_config>, see strategies section below
             "entity_types": ["list", "of", "entity", "types", "to", "extract"] /* Optional: This will limit the entity types extracted, default: ["organization", "person", "geo", "event"] */
             "summarize_descriptions" : true | false /* Optional: This will summarize the descriptions of the entities and relationships, default: true */
+            "checkpoint_batch_size": 50 /* Optional: The number of completed rows persisted per checkpoint batch, so an interrupted run can resume. 0 disables checkpointing, default: 50 */
+            "canonical_id_column": "the_column_with_the_id_of_the_canonical_row" /* Optional: Only the canonical rows are extracted, their near-duplicates get a copy of their results, default: None */
         }
     }
     ```
@@ -80,9 +92,11 @@ async def entity_extract(
         column: the_document_text_column_to_extract_entities_from
         id_column: the_column_with_the_unique_id_for_each_row
         to: the_column_to_output_the_entities_to
-        graph_to: the_column_to_output_the_graphml_to
+        graph_to: the_column_to_output_the_graph_to
         strategy: <strategy_config>, see strategies section below
         summarize_descriptions: true | false /* Optional: This will summarize the descriptions of the entities and relationships, default: true */
+        checkpoint_batch_size: 50 /* Optional: The number of completed rows persisted per checkpoint batch, so an interrupted run can resume. 0 disables checkpointing, default: 50 */
+        canonical_id_column: the_column_with_the_id_of_the_canonical_row /* Optional: Only the canonical rows are extracted, their near-duplicates get a copy of their results, default: None */
         entity_types:
             - list
             - of
@@ -141,6 +155,8 @@ async def entity_extract(
         strategy.get("type", ExtractEntityStrategyType.graph_intelligence)
     )
     strategy_config = {**strategy}
+    checkpoint = RowCheckpoint(storage, "entity_extract", checkpoint_batch_size)
+    await checkpoint.load()
 
     num_started = 0
 
@@ -148,6 +164,11 @@ async def entity_extract(
         nonlocal num_started
         text = row[column]
         id = row[id_column]
+        key = RowCheckpoint.create_key(id, text, entity_types, strategy_config)
+        restored = checkpoint.get(key)
+        if restored is not None:
+            return [restored[0], _graph_from_records(restored[1])]
+
         result = await strategy_exec(
             [Document(text=text, id=id)],
             entity_types,
@@ -156,15 +177,37 @@ async def entity_extract(
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.graphml_graph]
-
-    results = await derive_from_rows(
-        output,
-        run_strategy,
-        callbacks,
-        scheduling_type=async_mode,
-        num_threads=kwargs.get("num_threads", 4),
-    )
+        await checkpoint.add(key, [result.entities, _graph_to_records(result.graph)])
+        return [result.entities, result.graph]
+
+    rows = output
+    if canonical_id_column is not None:
+        rows = output[output[canonical_id_column] == output[id_column]]
+
+    try:
+        results = await derive_from_rows(
+            rows,
+            run_strategy,
+            callbacks,
+            scheduling_type=async_mode,
+            num_threads=kwargs.get("num_threads", 4),
+        )
+    finally:
+        await checkpoint.flush()
+    await checkpoint.clear()
+    policy = pop_gleaning_policy("entity_extraction")
+    if policy is not None:
+        message, details = policy.report()
+        callbacks.log(message, details)
+
+    if canonical_id_column is not None:
+        results_by_id = dict(zip(rows[id_column], results, strict=True))
+        results = [
+            _copy_result(results_by_id.get(canonical_id), canonical_id, id)
+            for id, canonical_id in zip(
+                output[id_column], output[canonical_id_column], strict=True
+            )
+        ]
 
     to_result = []
     graph_to_result = []
@@ -183,6 +226,57 @@ async def entity_extract(
     return TableContainer(table=output.reset_index(drop=True))
 
 
+def _copy_result(result: list | None, canonical_id: str, id: str) -> list | None:
+    """Copy the results of a canonical row to a near-duplicate row, with its source id."""
+    if not result or id == canonical_id:
+        return result
+
+    def with_source_id(data: dict) -> dict:
+        if "source_id" not in data:
+            return data
+        source_ids = str(data["source_id"]).split(",")
+        return {
+            **data,
+            "source_id": ",".join(
+                id if source_id == canonical_id else source_id
+                for source_id in source_ids
+            ),
+        }
+
+    entities, graph = result
+    if graph is not None:
+        copy = nx.Graph()
+        copy.add_nodes_from(
+            (node, with_source_id(data)) for node, data in graph.nodes(data=True)
+        )
+        copy.add_edges_from(
+            (source, target, with_source_id(data))
+            for source, target, data in graph.edges(data=True)
+        )
+        graph = copy
+    return [[with_source_id(entity) for entity in entities or []], graph]
+
+
+def _graph_to_records(graph: nx.Graph | None) -> dict[str, list] | None:
+    """Convert a graph to plain node and edge records for checkpointing."""
+    if graph is None:
+        return None
+    return {
+        "nodes": list(graph.nodes(data=True)),
+        "edges": list(graph.edges(data=True)),
+    }
+
+
+def _graph_from_records(records: dict[str, list] | None) -> nx.Graph | None:
+    """Restore a graph from checkpointed node and edge records."""
+    if records is None:
+        return None
+    graph = nx.Graph()
+    graph.add_nodes_from(records["nodes"])
+    graph.add_edges_from(records["edges"])
+    return graph
+
+
 def _load_strategy(strategy_type: ExtractEntityStrategyType) -> EntityExtractStrategy:
     """Load strategy method definition."""
     match strategy_type:
@@ -3,12 +3,12 @@
 
 """A module containing run_gi,  run_extract_entities and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
 from datashaper import VerbCallbacks
 
 import graphrag.config.defaults as defs
 from graphrag.config.enums import LLMType
 from graphrag.index.cache import PipelineCache
+from graphrag.index.graph.extractors import get_gleaning_policy
 from graphrag.index.graph.extractors.graph import GraphExtractor
 from graphrag.index.llm import load_llm
 from graphrag.index.text_splitting import (
@@ -63,6 +63,10 @@ async def run_extract_entities(
     extraction_prompt = args.get("extraction_prompt", None)
     encoding_model = args.get("encoding_name", None)
     max_gleanings = args.get("max_gleanings", defs.ENTITY_EXTRACTION_MAX_GLEANINGS)
+    adaptive_gleaning = args.get(
+        "adaptive_gleaning", defs.ENTITY_EXTRACTION_ADAPTIVE_GLEANING
+    )
+    stream_output = args.get("stream_output", defs.ENTITY_EXTRACTION_STREAM_OUTPUT)
 
     # note: We're not using UnipartiteGraphChain.from_params
     # because we want to pass "timeout" to the llm_kwargs
@@ -75,6 +79,10 @@ async def run_extract_entities(
         prompt=extraction_prompt,
         encoding_model=encoding_model,
         max_gleanings=max_gleanings,
+        stream_output=stream_output,
+        gleaning_policy=(
+            get_gleaning_policy("entity_extraction") if adaptive_gleaning else None
+        ),
         on_error=lambda e, s, d: (
             reporter.error("Entity Extraction Error", e, s, d) if reporter else None
         ),
@@ -115,8 +123,7 @@ async def run_extract_entities(
         if item is not None
     ]
 
-    graph_data = "".join(nx.generate_graphml(graph))
-    return EntityExtractionResult(entities, graph_data)
+    return EntityExtractionResult(entities, graph)
 
 
 def _create_text_splitter(
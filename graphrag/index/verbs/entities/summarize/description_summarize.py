@@ -20,9 +20,14 @@ from datashaper import (
 )
 
 from graphrag.index.cache import PipelineCache
+from graphrag.index.storage import PipelineStorage
 from graphrag.index.utils import load_graph
+from graphrag.index.utils.row_checkpoint import (
+    DEFAULT_CHECKPOINT_BATCH_SIZE,
+    RowCheckpoint,
+)
 
-from .strategies.typing import SummarizationStrategy
+from .strategies.typing import SummarizationStrategy, SummarizedDescriptionResult
 
 log = logging.getLogger(__name__)
 
@@ -47,10 +52,12 @@ class SummarizeStrategyType(str, Enum):
 async def summarize_descriptions(
     input: VerbInput,
     cache: PipelineCache,
+    storage: PipelineStorage,
     callbacks: VerbCallbacks,
     column: str,
     to: str,
     strategy: dict[str, Any] | None = None,
+    checkpoint_batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE,
     **kwargs,
 ) -> TableContainer:
     """
@@ -66,9 +73,10 @@ async def summarize_descriptions(
     {
         "verb": "",
         "args": {
-            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a graphml graph in string form which represents the entities and their relationships */
-            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a graphml graph in string form which represents the entities and their relationships after being summarized */
+            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a networkx graph which represents the entities and their relationships */
+            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a networkx graph which represents the entities and their relationships after being summarized */
             "strategy": {...} <strategy_config>, see strategies section below
+            "checkpoint_batch_size": 50 /* Optional: The number of completed summaries persisted per checkpoint batch, so an interrupted run can resume. 0 disables checkpointing, default: 50 */
         }
     }
     ```
@@ -81,6 +89,7 @@ async def summarize_descriptions(
         column: the_document_text_column_to_extract_descriptions_from
         to: the_column_to_output_the_summarized_descriptions_to
         strategy: <strategy_config>, see strategies section below
+        checkpoint_batch_size: 50 # Optional: The number of completed summaries persisted per checkpoint batch, so an interrupted run can resume. 0 disables checkpointing, default: 50
     ```
 
     ## Strategies
@@ -117,9 +126,15 @@ async def summarize_descriptions(
         strategy.get("type", SummarizeStrategyType.graph_intelligence)
     )
     strategy_config = {**strategy}
+    checkpoint = RowCheckpoint(
+        storage, "summarize_descriptions", checkpoint_batch_size
+    )
+    await checkpoint.load()
 
     async def get_resolved_entities(row, semaphore: asyncio.Semaphore):
-        graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
+        graph: nx.Graph = load_graph(
+            cast(str | nx.Graph, getattr(row, column)), copy=True
+        )
 
         ticker_length = len(graph.nodes) + len(graph.edges)
 
@@ -153,9 +168,7 @@ async def summarize_descriptions(
             elif isinstance(graph_item, tuple) and graph_item in graph.edges():
                 graph.edges[graph_item]["description"] = result.description
 
-        return DescriptionSummarizeRow(
-            graph="\n".join(nx.generate_graphml(graph)),
-        )
+        return DescriptionSummarizeRow(graph=graph)
 
     async def do_summarize_descriptions(
         graph_item: str | tuple[str, str],
@@ -163,6 +176,12 @@ async def summarize_descriptions(
         ticker: ProgressTicker,
         semaphore: asyncio.Semaphore,
     ):
+        key = RowCheckpoint.create_key(graph_item, descriptions, strategy_config)
+        restored = checkpoint.get(key)
+        if restored is not None:
+            ticker(1)
+            return SummarizedDescriptionResult(items=graph_item, description=restored)
+
         async with semaphore:
             results = await strategy_exec(
                 graph_item,
@@ -172,6 +191,7 @@ async def summarize_descriptions(
                 strategy_config,
             )
             ticker(1)
+        await checkpoint.add(key, results.description)
         return results
 
     # Graph is always on row 0, so here a derive from rows does not work
@@ -180,9 +200,13 @@ async def summarize_descriptions(
     # the parallelization of the derive_from_rows
     semaphore = asyncio.Semaphore(kwargs.get("num_threads", 4))
 
-    results = [
-        await get_resolved_entities(row, semaphore) for row in output.itertuples()
-    ]
+    try:
+        results = [
+            await get_resolved_entities(row, semaphore) for row in output.itertuples()
+        ]
+    finally:
+        await checkpoint.flush()
+    await checkpoint.clear()
 
     to_result = []
 
@@ -1,7 +1,7 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing cluster_graph, apply_clustering and run_layout methods definition."""
+"""A module containing cluster_graph, apply_clustering, annotate_graph, get_node_clusters, graph_for_level and run_layout methods definition."""
 
 import logging
 from enum import Enum
@@ -18,6 +18,8 @@ from .typing import Communities
 
 log = logging.getLogger(__name__)
 
+_NODE_ANNOTATIONS = ("degree", "human_readable_id")
+
 
 @verb(name="cluster_graph")
 def cluster_graph(
@@ -30,13 +32,13 @@ def cluster_graph(
     **_kwargs,
 ) -> TableContainer:
     """
-    Apply a hierarchical clustering algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the clustered graph, and a new column containing the level of the graph.
+    Apply a hierarchical clustering algorithm to a graph. The graph is expected to be a networkx graph or a graphml string. The verb outputs a new column containing the clustered graph, and a new column containing the level of the graph.
 
     ## Usage
     ```yaml
     verb: cluster_graph
     args:
-        column: entity_graph # The name of the column containing the graph, should be a graphml graph
+        column: entity_graph # The name of the column containing the graph, should be a networkx graph or a graphml string
         to: clustered_graph # The name of the column to output the clustered graph to
         level_to: level # The name of the column to output the level to
         strategy: <strategy config> # See strategies section below
@@ -72,27 +74,25 @@ def cluster_graph(
     num_total = len(output_df)
 
     # Go through each of the rows
-    graph_level_pairs_column: list[list[tuple[int, str]]] = []
+    graph_level_pairs_column: list[list[tuple[int, nx.Graph]]] = []
     for _, row in progress_iterable(
         output_df.iterrows(), callbacks.progress, num_total
     ):
         levels = row[level_to]
-        graph_level_pairs: list[tuple[int, str]] = []
-
-        # For each of the levels, get the graph and add it to the list
-        for level in levels:
-            graph = "\n".join(
-                nx.generate_graphml(
-                    apply_clustering(
-                        cast(str, row[column]),
-                        cast(Communities, row[community_map_to]),
-                        level,
-                        seed=strategy.get("seed"),
-                    )
-                )
+        communities = cast(Communities, row[community_map_to])
+
+        # The graph is annotated once, and each level adds its clusters and ids
+        base_graph = annotate_graph(cast(str | nx.Graph, row[column]))
+        node_clusters = get_node_clusters(communities)
+        graph_level_pairs_column.append([
+            (
+                level,
+                graph_for_level(
+                    base_graph, node_clusters, level, seed=strategy.get("seed")
+                ),
             )
-            graph_level_pairs.append((level, graph))
-        graph_level_pairs_column.append(graph_level_pairs)
+            for level in levels
+        ])
     output_df[to] = graph_level_pairs_column
 
     # explode the list of (level, graph) pairs into separate rows
@@ -110,36 +110,90 @@ def cluster_graph(
     return TableContainer(table=output_df)
 
 
-# TODO: This should support str | nx.Graph as a graphml param
 def apply_clustering(
-    graphml: str, communities: Communities, level: int = 0, seed: int | None = None
+    graphml_or_graph: str | nx.Graph,
+    communities: Communities,
+    level: int = 0,
+    seed: int | None = None,
 ) -> nx.Graph:
-    """Apply clustering to a graphml string."""
-    random = Random(seed)  # noqa S311
-    graph = nx.parse_graphml(graphml)
-    for community_level, community_id, nodes in communities:
-        if level == community_level:
-            for node in nodes:
-                graph.nodes[node]["cluster"] = community_id
-                graph.nodes[node]["level"] = level
+    """Apply clustering to a copy of a graph."""
+    return graph_for_level(
+        annotate_graph(graphml_or_graph),
+        get_node_clusters(communities),
+        level,
+        seed=seed,
+    )
+
+
+def annotate_graph(graphml_or_graph: str | nx.Graph) -> nx.Graph:
+    """Add the level independent attributes (degree and record ids) to a copy of a graph."""
+    graph = load_graph(graphml_or_graph, copy=True)
 
     # add node degree
-    for node_degree in graph.degree:
-        graph.nodes[str(node_degree[0])]["degree"] = int(node_degree[1])
+    for node, degree in graph.degree:
+        graph.nodes[node]["degree"] = int(degree)
 
-    # add node uuid and incremental record id (a human readable id used as reference in the final report)
+    # add incremental record id (a human readable id used as reference in the final report)
     for index, node in enumerate(graph.nodes()):
         graph.nodes[node]["human_readable_id"] = index
-        graph.nodes[node]["id"] = str(gen_uuid(random))
-
-    # add ids to edges
-    for index, edge in enumerate(graph.edges()):
-        graph.edges[edge]["id"] = str(gen_uuid(random))
-        graph.edges[edge]["human_readable_id"] = index
-        graph.edges[edge]["level"] = level
     return graph
 
 
+def get_node_clusters(communities: Communities) -> dict[Any, dict[int, str]]:
+    """Get the cluster of each node at each level."""
+    node_clusters: dict[Any, dict[int, str]] = {}
+    for level, community_id, nodes in communities:
+        for node in nodes:
+            node_clusters.setdefault(node, {})[level] = community_id
+    return node_clusters
+
+
+def graph_for_level(
+    graph: nx.Graph,
+    node_clusters: dict[Any, dict[int, str]],
+    level: int,
+    seed: int | None = None,
+) -> nx.Graph:
+    """Create the graph of a single level from an annotated graph.
+
+    The attribute values are shared with the annotated graph, only the cluster,
+    level and uuid attributes are set per level. Without a seed, each level gets
+    its own node and edge ids.
+    """
+    random = Random(seed)  # noqa S311
+    level_graph = nx.Graph()
+    for node, data in graph.nodes(data=True):
+        cluster = node_clusters.get(node, {}).get(level)
+        if cluster is None:
+            level_graph.add_node(node, **data, id=str(gen_uuid(random)))
+            continue
+
+        # keep the attribute order of a graph clustered before being annotated
+        attributes = {
+            key: value for key, value in data.items() if key not in _NODE_ANNOTATIONS
+        }
+        attributes["cluster"] = cluster
+        attributes["level"] = level
+        for key in _NODE_ANNOTATIONS:
+            attributes[key] = data[key]
+        attributes["id"] = str(gen_uuid(random))
+        level_graph.add_node(node, **attributes)
+    level_graph.add_edges_from(
+        (
+            source,
+            target,
+            {
+                **data,
+                "id": str(gen_uuid(random)),
+                "human_readable_id": index,
+                "level": level,
+            },
+        )
+        for index, (source, target, data) in enumerate(graph.edges(data=True))
+    )
+    return level_graph
+
+
 class GraphCommunityStrategyType(str, Enum):
     """GraphCommunityStrategyType class definition."""
 
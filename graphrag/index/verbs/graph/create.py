@@ -34,7 +34,7 @@ def create_graph(
     verb: create_graph
     args:
         type: node # The type of graph to create, one of: node, edge
-        to: <column name> # The name of the column to output the graph to, this will be a graphml graph
+        to: <column name> # The name of the column to output the graph to, this will be a networkx graph
         attributes: # The attributes for the nodes / edges
             # If using the node type, the following attributes are required:
             id: <id_column_name>
@@ -81,8 +81,7 @@ def create_graph(
             target = clean_str(row[target_col])
             out_graph.add_edge(source, target, **item_attributes)
 
-    graphml_string = "".join(nx.generate_graphml(out_graph))
-    output_df = pd.DataFrame([{to: graphml_string}])
+    output_df = pd.DataFrame([{to: out_graph}])
     return TableContainer(table=output_df)
 
 
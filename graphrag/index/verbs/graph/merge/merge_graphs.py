@@ -1,8 +1,10 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing merge_graphs, merge_nodes, merge_edges, merge_attributes, apply_merge_operation and _get_detailed_attribute_merge_operation methods definitions."""
+"""A module containing merge_graphs, merge_graph_list and _get_detailed_attribute_merge_operation methods definitions."""
 
+import math
+from collections.abc import Iterable
 from typing import Any, cast
 
 import networkx as nx
@@ -23,6 +25,11 @@ from .typing import (
     StringOperation,
 )
 
+_NODE = "__node__"
+_SOURCE = "__source__"
+_TARGET = "__target__"
+_EDGE = "__edge__"
+
 
 @verb(name="merge_graphs")
 def merge_graphs(
@@ -35,7 +42,7 @@ def merge_graphs(
     **_kwargs,
 ) -> TableContainer:
     """
-    Merge multiple graphs together. The graphs are expected to be in graphml format. The verb outputs a new column containing the merged graph.
+    Merge multiple graphs together. The graphs are expected to be networkx graphs or graphml strings. The verb outputs a new column containing the merged graph.
 
     > Note: This will merge all rows into a single graph.
 
@@ -43,7 +50,7 @@ def merge_graphs(
     ```yaml
     verb: merge_graph
     args:
-        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        column: clustered_graph # The name of the column containing the graph, should be a networkx graph or a graphml string
         to: merged_graph # The name of the column to output the merged graph to
         nodes: <node operations> # See node operations section below
         edges: <edge operations> # See edge operations section below
@@ -79,7 +86,7 @@ def merge_graphs(
     - __max__: This operation takes the max of the attribute with the last value seen.
     max
     - __min__: This operation takes the min of the attribute with the last value seen.
-    - __average__: This operation takes the mean of the attribute with the last value seen.
+    - __average__: This operation takes the mean of all the values seen.
     - __multiply__: This operation multiplies the attribute with the last value seen.
     """
     input_df = input.get_input()
@@ -94,122 +101,142 @@ def merge_graphs(
         for attrib, value in edges.items()
     }
 
-    mega_graph = nx.Graph()
     num_total = len(input_df)
-    for graphml in progress_iterable(input_df[column], callbacks.progress, num_total):
-        graph = load_graph(cast(str | nx.Graph, graphml))
-        merge_nodes(mega_graph, graph, node_ops)
-        merge_edges(mega_graph, graph, edge_ops)
-
-    output[to] = ["\n".join(nx.generate_graphml(mega_graph))]
+    graphs = (
+        load_graph(cast(str | nx.Graph, graphml))
+        for graphml in progress_iterable(
+            input_df[column], callbacks.progress, num_total
+        )
+    )
+    output[to] = [merge_graph_list(graphs, node_ops, edge_ops)]
 
     return TableContainer(table=output)
 
 
-def merge_nodes(
-    target: nx.Graph,
-    subgraph: nx.Graph,
+def merge_graph_list(
+    graphs: Iterable[nx.Graph],
     node_ops: dict[str, DetailedAttributeMergeOperation],
-):
-    """Merge nodes from subgraph into target using the operations defined in node_ops."""
-    for node in subgraph.nodes:
-        if node not in target.nodes:
-            target.add_node(node, **(subgraph.nodes[node] or {}))
-        else:
-            merge_attributes(target.nodes[node], subgraph.nodes[node], node_ops)
+    edge_ops: dict[str, DetailedAttributeMergeOperation],
+) -> nx.Graph:
+    """Merge a list of graphs into a single graph.
 
+    The node and edge records of all graphs are collected into tables, and the
+    attributes of nodes and edges that occur more than once are combined with
+    grouped aggregations. Nodes and edges keep the order in which they were first
+    seen, and edges keep the orientation in which they were first seen.
+    """
+    node_records: list[dict[str, Any]] = []
+    edge_records: list[dict[str, Any]] = []
+    for graph in graphs:
+        node_records.extend(
+            {**(data or {}), _NODE: node} for node, data in graph.nodes(data=True)
+        )
+        edge_records.extend(
+            {
+                **(data or {}),
+                _SOURCE: source,
+                _TARGET: target,
+                _EDGE: (source, target)
+                if str(source) <= str(target)
+                else (target, source),
+            }
+            for source, target, data in graph.edges(data=True)
+        )
 
-def merge_edges(
-    target_graph: nx.Graph,
-    subgraph: nx.Graph,
-    edge_ops: dict[str, DetailedAttributeMergeOperation],
-):
-    """Merge edges from subgraph into target using the operations defined in edge_ops."""
-    for source, target, edge_data in subgraph.edges(data=True):  # type: ignore
-        if not target_graph.has_edge(source, target):
-            target_graph.add_edge(source, target, **(edge_data or {}))
-        else:
-            merge_attributes(
-                target_graph.edges[(source, target)],  # noqa
-                edge_data,
-                edge_ops,
-            )
+    nodes = _merge_records(pd.DataFrame(node_records, dtype=object), _NODE, node_ops)
+    edges = _merge_records(pd.DataFrame(edge_records, dtype=object), _EDGE, edge_ops)
+
+    merged_graph = nx.Graph()
+    merged_graph.add_nodes_from(
+        (record.pop(_NODE), _present_attributes(record))
+        for record in nodes.to_dict("records")
+    )
+    merged_graph.add_edges_from(
+        (record.pop(_SOURCE), record.pop(_TARGET), _present_attributes(record))
+        for record in edges.drop(columns=[_EDGE], errors="ignore").to_dict("records")
+    )
+    return merged_graph
 
 
-def merge_attributes(
-    target_item: dict[str, Any] | None,
-    source_item: dict[str, Any] | None,
+def _merge_records(
+    records: pd.DataFrame,
+    key: str,
     ops: dict[str, DetailedAttributeMergeOperation],
-):
-    """Merge attributes from source_item into target_item using the operations defined in ops."""
-    source_item = source_item or {}
-    target_item = target_item or {}
-    for op_attrib, op in ops.items():
-        if op_attrib == "*":
-            for attrib in source_item:
-                # If there is a specific handler for this attribute, use it
-                # i.e. * provides a default, but you can override it
-                if attrib not in ops:
-                    apply_merge_operation(target_item, source_item, attrib, op)
+) -> pd.DataFrame:
+    """Combine the records sharing a key, using the operations defined in ops."""
+    if len(records) == 0:
+        return records
+
+    # Records that occur once are kept as they are, only repeated keys are merged
+    is_repeated = records[key].duplicated(keep=False)
+    repeated = records[is_repeated]
+    if len(repeated) == 0:
+        return records
+
+    keys = repeated[key]
+    grouped = repeated.groupby(keys, sort=False)
+    merged = pd.DataFrame(index=grouped.size().index)
+    for column in records.columns:
+        if column.startswith("__"):
+            merged[column] = grouped[column].first()
         else:
-            if op_attrib in source_item or op_attrib in target_item:
-                apply_merge_operation(target_item, source_item, op_attrib, op)
-
-
-def apply_merge_operation(
-    target_item: dict[str, Any] | None,
-    source_item: dict[str, Any] | None,
-    attrib: str,
-    op: DetailedAttributeMergeOperation,
-):
-    """Apply the merge operation to the attribute."""
-    source_item = source_item or {}
-    target_item = target_item or {}
-
-    if (
-        op.operation == BasicMergeOperation.Replace
-        or op.operation == StringOperation.Replace
-    ):
-        target_item[attrib] = source_item.get(attrib, None) or ""
-    elif (
-        op.operation == BasicMergeOperation.Skip or op.operation == StringOperation.Skip
-    ):
-        target_item[attrib] = target_item.get(attrib, None) or ""
-    elif op.operation == StringOperation.Concat:
-        separator = op.separator or DEFAULT_CONCAT_SEPARATOR
-        target_attrib = target_item.get(attrib, "") or ""
-        source_attrib = source_item.get(attrib, "") or ""
-        target_item[attrib] = f"{target_attrib}{separator}{source_attrib}"
-        if op.distinct:
-            # TODO: Slow
-            target_item[attrib] = separator.join(
-                sorted(set(target_item[attrib].split(separator)))
+            merged[column] = _aggregate(
+                repeated[column], keys, ops.get(column, ops.get("*"))
             )
 
-    # We're assuming that the attribute is numeric
-    elif op.operation == NumericOperation.Sum:
-        target_item[attrib] = (target_item.get(attrib, 0) or 0) + (
-            source_item.get(attrib, 0) or 0
-        )
-    elif op.operation == NumericOperation.Average:
-        target_item[attrib] = (
-            (target_item.get(attrib, 0) or 0) + (source_item.get(attrib, 0) or 0)
-        ) / 2
-    elif op.operation == NumericOperation.Max:
-        target_item[attrib] = max(
-            (target_item.get(attrib, 0) or 0), (source_item.get(attrib, 0) or 0)
-        )
-    elif op.operation == NumericOperation.Min:
-        target_item[attrib] = min(
-            (target_item.get(attrib, 0) or 0), (source_item.get(attrib, 0) or 0)
+    merged.index = repeated.index.to_series().groupby(keys, sort=False).first()
+    return pd.concat([records[~is_repeated], merged]).sort_index()
+
+
+def _aggregate(
+    values: pd.Series, keys: pd.Series, op: DetailedAttributeMergeOperation | None
+) -> pd.Series:
+    """Apply the merge operation to the values of each key."""
+    if op is None or op.operation in (BasicMergeOperation.Skip, StringOperation.Skip):
+        return values.groupby(keys, sort=False).first()
+    if op.operation in (BasicMergeOperation.Replace, StringOperation.Replace):
+        return values.groupby(keys, sort=False).last()
+    if op.operation == StringOperation.Concat:
+        separator = op.separator or DEFAULT_CONCAT_SEPARATOR
+        distinct = op.distinct
+        return values.groupby(keys, sort=False).agg(
+            lambda group: _concat(group, separator, distinct)
         )
-    elif op.operation == NumericOperation.Multiply:
-        target_item[attrib] = (target_item.get(attrib, 1) or 1) * (
-            source_item.get(attrib, 1) or 1
+
+    # We're assuming that the attribute is numeric
+    grouped = pd.to_numeric(values).groupby(keys, sort=False)
+    if op.operation == NumericOperation.Sum:
+        return grouped.sum()
+    if op.operation == NumericOperation.Average:
+        return grouped.mean()
+    if op.operation == NumericOperation.Max:
+        return grouped.max()
+    if op.operation == NumericOperation.Min:
+        return grouped.min()
+    if op.operation == NumericOperation.Multiply:
+        return grouped.prod()
+
+    msg = f"Invalid operation {op.operation}"
+    raise ValueError(msg)
+
+
+def _concat(values: pd.Series, separator: str, distinct: bool) -> str:
+    strings = [str(value) for value in values if not _is_missing(value)]
+    if distinct:
+        return separator.join(
+            sorted({part for value in strings for part in value.split(separator)})
         )
-    else:
-        msg = f"Invalid operation {op.operation}"
-        raise ValueError(msg)
+    return separator.join(strings)
+
+
+def _present_attributes(record: dict[str, Any]) -> dict[str, Any]:
+    return {
+        attrib: value for attrib, value in record.items() if not _is_missing(value)
+    }
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
 
 
 def _get_detailed_attribute_merge_operation(
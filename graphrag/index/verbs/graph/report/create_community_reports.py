@@ -26,7 +26,16 @@ from graphrag.index.graph.extractors.community_reports import (
     get_levels,
     prep_community_report_context,
 )
+from graphrag.index.storage import PipelineStorage
+from graphrag.index.update.community_reports import (
+    load_previous_reports,
+    reuse_previous_reports,
+)
 from graphrag.index.utils.ds_util import get_required_input_table
+from graphrag.index.utils.row_checkpoint import (
+    DEFAULT_CHECKPOINT_BATCH_SIZE,
+    RowCheckpoint,
+)
 
 from .strategies.typing import CommunityReport, CommunityReportsStrategy
 
@@ -48,12 +57,21 @@ async def create_community_reports(
     input: VerbInput,
     callbacks: VerbCallbacks,
     cache: PipelineCache,
+    storage: PipelineStorage,
     strategy: dict,
     async_mode: AsyncType = AsyncType.AsyncIO,
     num_threads: int = 4,
+    reuse_reports_from: str | None = None,
+    checkpoint_batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE,
     **_kwargs,
 ) -> TableContainer:
-    """Generate entities for each row, and optionally a graph of those entities."""
+    """Generate entities for each row, and optionally a graph of those entities.
+
+    When `reuse_reports_from` names a child storage holding a previous index, the
+    previous reports of communities whose membership is unchanged are reused instead
+    of being generated again. Generated reports are checkpointed every
+    `checkpoint_batch_size` reports, so that an interrupted run can resume.
+    """
     log.debug("create_community_reports strategy=%s", strategy)
     local_contexts = cast(pd.DataFrame, input.get_input())
     nodes_ctr = get_required_input_table(input, "nodes")
@@ -65,6 +83,15 @@ async def create_community_reports(
     reports: list[CommunityReport | None] = []
     tick = progress_ticker(callbacks.progress, len(local_contexts))
     runner = load_strategy(strategy["type"])
+    previous_reports = (
+        await load_previous_reports(storage.child(reuse_reports_from))
+        if reuse_reports_from
+        else {}
+    )
+    checkpoint = RowCheckpoint(
+        storage, "create_community_reports", checkpoint_batch_size
+    )
+    await checkpoint.load()
 
     for level in levels:
         level_contexts = prep_community_report_context(
@@ -76,29 +103,55 @@ async def create_community_reports(
                 "max_input_tokens", defaults.COMMUNITY_REPORT_MAX_INPUT_LENGTH
             ),
         )
+        level_contexts, reused_reports = reuse_previous_reports(
+            level_contexts, nodes, previous_reports
+        )
+        reports.extend(reused_reports)
+        tick(len(reused_reports))
 
         async def run_generate(record):
-            result = await _generate_report(
-                runner,
-                community_id=record[schemas.NODE_COMMUNITY],
-                community_level=record[schemas.COMMUNITY_LEVEL],
-                community_context=record[schemas.CONTEXT_STRING],
-                cache=cache,
-                callbacks=callbacks,
-                strategy=strategy,
+            key = RowCheckpoint.create_key(
+                record[schemas.NODE_COMMUNITY],
+                record[schemas.COMMUNITY_LEVEL],
+                record[schemas.CONTEXT_STRING],
+                strategy,
             )
+            result = checkpoint.get(key)
+            if result is not None:
+                # restore the original id types, which JSON does not preserve
+                result = {
+                    **result,
+                    "community": record[schemas.NODE_COMMUNITY],
+                    "level": record[schemas.COMMUNITY_LEVEL],
+                }
+            else:
+                result = await _generate_report(
+                    runner,
+                    community_id=record[schemas.NODE_COMMUNITY],
+                    community_level=record[schemas.COMMUNITY_LEVEL],
+                    community_context=record[schemas.CONTEXT_STRING],
+                    cache=cache,
+                    callbacks=callbacks,
+                    strategy=strategy,
+                )
+                if result is not None:
+                    await checkpoint.add(key, result)
             tick()
             return result
 
-        local_reports = await derive_from_rows(
-            level_contexts,
-            run_generate,
-            callbacks=NoopVerbCallbacks(),
-            num_threads=num_threads,
-            scheduling_type=async_mode,
-        )
+        try:
+            local_reports = await derive_from_rows(
+                level_contexts,
+                run_generate,
+                callbacks=NoopVerbCallbacks(),
+                num_threads=num_threads,
+                scheduling_type=async_mode,
+            )
+        finally:
+            await checkpoint.flush()
         reports.extend([lr for lr in local_reports if lr is not None])
 
+    await checkpoint.clear()
     return TableContainer(table=pd.DataFrame(reports))
 
 
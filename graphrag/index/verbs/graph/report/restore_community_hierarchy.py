@@ -4,7 +4,7 @@
 """A module containing create_graph, _get_node_attributes, _get_edge_attributes and _get_attribute_column_mapping methods definition."""
 
 import logging
-from typing import cast
+from typing import Any, cast
 
 import pandas as pd
 from datashaper import TableContainer, VerbInput, verb
@@ -29,15 +29,18 @@ def restore_community_hierarchy(
         .agg({name_column: list})
         .reset_index()
     )
-    community_levels = {}
-    for _, row in community_df.iterrows():
-        level = row[level_column]
-        name = row[name_column]
-        community = row[community_column]
-
-        if community_levels.get(level) is None:
-            community_levels[level] = {}
-        community_levels[level][community] = name
+    community_levels: dict[Any, dict[Any, list[str]]] = {}
+    node_communities: dict[Any, dict[str, Any]] = {}
+    for community, level, names in zip(
+        community_df[community_column],
+        community_df[level_column],
+        community_df[name_column],
+        strict=True,
+    ):
+        community_levels.setdefault(level, {})[community] = names
+        level_node_communities = node_communities.setdefault(level, {})
+        for name in names:
+            level_node_communities[name] = community
 
     # get unique levels, sorted in ascending order
     levels = sorted(community_levels.keys())
@@ -56,23 +59,30 @@ def restore_community_hierarchy(
             len(current_level_communities),
         )
 
-        for current_community in current_level_communities:
-            current_entities = current_level_communities[current_community]
-
-            # loop through next level's communities to find all the subcommunities
-            entities_found = 0
-            for next_level_community in next_level_communities:
-                next_entities = next_level_communities[next_level_community]
-                if set(next_entities).issubset(set(current_entities)):
-                    community_hierarchy.append({
-                        community_column: current_community,
-                        schemas.COMMUNITY_LEVEL: level,
-                        schemas.SUB_COMMUNITY: next_level_community,
-                        schemas.SUB_COMMUNITY_SIZE: len(next_entities),
-                    })
+        # a community is a subcommunity of the community that all of its entities
+        # belong to at the current level
+        parents = node_communities[level]
+        sub_communities: dict[Any, list[tuple[Any, int]]] = {}
+        for next_level_community, next_entities in next_level_communities.items():
+            parent_communities = {parents.get(name) for name in next_entities}
+            if len(parent_communities) != 1:
+                continue
+            parent_community = parent_communities.pop()
+            if parent_community is not None:
+                sub_communities.setdefault(parent_community, []).append((
+                    next_level_community,
+                    len(next_entities),
+                ))
 
-                    entities_found += len(next_entities)
-                    if entities_found == len(current_entities):
-                        break
+        for current_community in current_level_communities:
+            for next_level_community, size in sub_communities.get(
+                current_community, []
+            ):
+                community_hierarchy.append({
+                    community_column: current_community,
+                    schemas.COMMUNITY_LEVEL: level,
+                    schemas.SUB_COMMUNITY: next_level_community,
+                    schemas.SUB_COMMUNITY_SIZE: size,
+                })
 
     return TableContainer(table=pd.DataFrame(community_hierarchy))
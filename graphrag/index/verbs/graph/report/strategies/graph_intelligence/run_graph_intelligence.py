@@ -15,7 +15,6 @@ from graphrag.index.graph.extractors.community_reports import (
     CommunityReportsExtractor,
 )
 from graphrag.index.llm import load_llm
-from graphrag.index.utils.rate_limiter import RateLimiter
 from graphrag.index.verbs.graph.report.strategies.typing import (
     CommunityReport,
     StrategyConfig,
@@ -54,8 +53,6 @@ async def _run_extractor(
     args: StrategyConfig,
     reporter: VerbCallbacks,
 ) -> CommunityReport | None:
-    # RateLimiter
-    rate_limiter = RateLimiter(rate=1, per=60)
     extractor = CommunityReportsExtractor(
         llm,
         extraction_prompt=args.get("extraction_prompt", None),
@@ -66,7 +63,6 @@ async def _run_extractor(
     )
 
     try:
-        await rate_limiter.acquire()
         results = await extractor({"input_text": input})
         report = results.structured_output
         if report is None or len(report.keys()) == 0:
@@ -25,7 +25,7 @@ def unpack_graph(
     **kwargs,
 ) -> TableContainer:
     """
-    Unpack nodes or edges from a graphml graph, into a list of nodes or edges.
+    Unpack nodes or edges from a graph, into a list of nodes or edges.
 
     This verb will create columns for each attribute in a node or edge.
 
@@ -34,7 +34,7 @@ def unpack_graph(
     verb: unpack_graph
     args:
         type: node # The type of data to unpack, one of: node, edge. node will create a node list, edge will create an edge list
-        column: <column name> # The name of the column containing the graph, should be a graphml graph
+        column: <column name> # The name of the column containing the graph, should be a networkx graph or a graphml string
     ```
     """
     input_df = input.get_input()
@@ -59,7 +59,7 @@ def unpack_graph_df(
     embeddings_column: str = "embeddings",
     **kwargs,
 ) -> pd.DataFrame:
-    """Unpack nodes or edges from a graphml graph, into a list of nodes or edges."""
+    """Unpack nodes or edges from a graph, into a list of nodes or edges."""
     if copy is None:
         copy = default_copy
 
@@ -4,6 +4,7 @@
 """The Indexing Engine text package root."""
 
 from .chunk.text_chunk import chunk
+from .dedup import text_dedup
 from .embed import text_embed
 from .replace import replace
 from .split import text_split
@@ -12,6 +13,7 @@ from .translate import text_translate
 __all__ = [
     "chunk",
     "replace",
+    "text_dedup",
     "text_embed",
     "text_split",
     "text_translate",
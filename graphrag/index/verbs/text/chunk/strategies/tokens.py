@@ -6,12 +6,13 @@
 from collections.abc import Iterable
 from typing import Any
 
-import tiktoken
+import numpy as np
 from datashaper import ProgressTicker
 
 import graphrag.config.defaults as defs
 from graphrag.index.text_splitting import Tokenizer
 from graphrag.index.verbs.text.chunk.typing import TextChunk
+from graphrag.utils.tokens import get_encoding
 
 
 def run(
@@ -21,7 +22,7 @@ def run(
     tokens_per_chunk = args.get("chunk_size", defs.CHUNK_SIZE)
     chunk_overlap = args.get("chunk_overlap", defs.CHUNK_OVERLAP)
     encoding_name = args.get("encoding_name", defs.ENCODING_MODEL)
-    enc = tiktoken.get_encoding(encoding_name)
+    enc = get_encoding(encoding_name)
 
     def encode(text: str) -> list[int]:
         if not isinstance(text, str):
@@ -49,33 +50,32 @@ def split_text_on_tokens(
     texts: list[str], enc: Tokenizer, tick: ProgressTicker
 ) -> list[TextChunk]:
     """Split incoming text and return chunks."""
-    result = []
-    mapped_ids = []
-
-    for source_doc_idx, text in enumerate(texts):
-        encoded = enc.encode(text)
+    # the tokens of all the documents, and the end offsets of the non-empty documents
+    encoded = []
+    for text in texts:
+        encoded.append(np.asarray(enc.encode(text), dtype=np.int64))
         tick(1)
-        mapped_ids.append((source_doc_idx, encoded))
+    lengths = np.array([len(ids) for ids in encoded], dtype=np.int64)
+    input_ids = np.concatenate(encoded) if encoded else np.empty(0, dtype=np.int64)
+    del encoded
+    doc_indices = np.flatnonzero(lengths)
+    doc_ends = np.cumsum(lengths[doc_indices])
 
-    input_ids: list[tuple[int, int]] = [
-        (source_doc_idx, id) for source_doc_idx, ids in mapped_ids for id in ids
-    ]
+    # the token windows, and the first and last documents of each
+    starts = np.arange(0, len(input_ids), enc.tokens_per_chunk - enc.chunk_overlap)
+    ends = np.minimum(starts + enc.tokens_per_chunk, len(input_ids))
+    first_docs = np.searchsorted(doc_ends, starts, side="right")
+    last_docs = np.searchsorted(doc_ends, ends - 1, side="right")
 
-    start_idx = 0
-    cur_idx = min(start_idx + enc.tokens_per_chunk, len(input_ids))
-    chunk_ids = input_ids[start_idx:cur_idx]
-    while start_idx < len(input_ids):
-        chunk_text = enc.decode([id for _, id in chunk_ids])
-        doc_indices = list({doc_idx for doc_idx, _ in chunk_ids})
-        result.append(
-            TextChunk(
-                text_chunk=chunk_text,
-                source_doc_indices=doc_indices,
-                n_tokens=len(chunk_ids),
-            )
+    return [
+        TextChunk(
+            text_chunk=enc.decode(input_ids[start:end].tolist()),
+            source_doc_indices=list({
+                int(doc_idx) for doc_idx in doc_indices[first_doc : last_doc + 1]
+            }),
+            n_tokens=int(end - start),
         )
-        start_idx += enc.tokens_per_chunk - enc.chunk_overlap
-        cur_idx = min(start_idx + enc.tokens_per_chunk, len(input_ids))
-        chunk_ids = input_ids[start_idx:cur_idx]
-
-    return result
+        for start, end, first_doc, last_doc in zip(
+            starts, ends, first_docs, last_docs, strict=True
+        )
+    ]
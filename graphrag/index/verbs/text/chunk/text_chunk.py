@@ -3,16 +3,19 @@
 
 """A module containing _get_num_total, chunk, run_strategy and load_strategy methods definitions."""
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Any, cast
 
 import pandas as pd
 from datashaper import (
+    ProgressHandler,
     ProgressTicker,
     TableContainer,
     VerbCallbacks,
     VerbInput,
-    progress_ticker,
     verb,
 )
 
@@ -30,6 +33,21 @@ def _get_num_total(output: pd.DataFrame, column: str) -> int:
     return num_total
 
 
+class _SynchronizedProgressTicker(ProgressTicker):
+    """A progress ticker shared by the threads chunking the documents."""
+
+    _lock: threading.Lock
+
+    def __init__(self, callback: ProgressHandler | None, num_total: int):
+        super().__init__(callback, num_total)
+        self._lock = threading.Lock()
+
+    def __call__(self, num_ticks: int = 1) -> None:
+        """Emit progress."""
+        with self._lock:
+            super().__call__(num_ticks)
+
+
 class ChunkStrategyType(str, Enum):
     """ChunkStrategy class definition."""
 
@@ -48,6 +66,7 @@ def chunk(
     to: str,
     callbacks: VerbCallbacks,
     strategy: dict[str, Any] | None = None,
+    num_threads: int | None = None,
     **_kwargs,
 ) -> TableContainer:
     """
@@ -59,6 +78,7 @@ def chunk(
     args:
         column: <column name> # The name of the column containing the text to chunk, this can either be a column with text, or a column with a list[tuple[doc_id, str]]
         to: <column name> # The name of the column to output the chunks to
+        num_threads: <int> # Optional, The number of threads chunking the rows, default: the number of CPUs
         strategy: <strategy config> # The strategy to use to chunk the text, see below for more details
     ```
 
@@ -93,15 +113,18 @@ def chunk(
     strategy_exec = load_strategy(strategy_name)
 
     num_total = _get_num_total(output, column)
-    tick = progress_ticker(callbacks.progress, num_total)
-
-    output[to] = output.apply(
-        cast(
-            Any,
-            lambda x: run_strategy(strategy_exec, x[column], strategy_config, tick),
-        ),
-        axis=1,
-    )
+    tick = _SynchronizedProgressTicker(callbacks.progress, num_total)
+
+    def run(input: ChunkInput) -> list[str | tuple[list[str] | None, str, int]]:
+        return run_strategy(strategy_exec, input, strategy_config, tick)
+
+    # the rows are chunked in parallel, tiktoken releases the GIL while it encodes
+    num_threads = num_threads or os.cpu_count() or 1
+    if num_threads > 1 and len(output) > 1:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            output[to] = list(executor.map(run, output[column]))
+    else:
+        output[to] = [run(input) for input in output[column]]
     return TableContainer(table=output)
 
 
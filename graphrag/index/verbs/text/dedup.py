@@ -0,0 +1,55 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the text_dedup method definition."""
+
+from typing import cast
+
+import pandas as pd
+from datashaper import TableContainer, VerbInput, verb
+
+from graphrag.index.utils.near_duplicates import (
+    DEFAULT_NUM_PERM,
+    DEFAULT_SHINGLE_SIZE,
+    DEFAULT_THRESHOLD,
+    find_near_duplicates,
+)
+
+
+@verb(name="text_dedup")
+def text_dedup(
+    input: VerbInput,
+    column: str,
+    id_column: str,
+    to: str,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    **_kwargs: dict,
+) -> TableContainer:
+    """
+    Find the near-duplicate texts of a table. The verb outputs a new column containing the id of the canonical row of each row, which is the row's own id for canonical rows.
+
+    ## Usage
+
+    ```yaml
+    verb: text_dedup
+    args:
+        column: text # The name of the column containing the text to compare
+        id_column: id # The name of the column containing the id of each row
+        to: canonical_id # The name of the column to output the id of the canonical row to
+        threshold: 0.9 # Optional, The Jaccard similarity above which two texts are near-duplicates, default: 0.9
+        num_perm: 128 # Optional, The number of hash functions of the MinHash signatures, default: 128
+        shingle_size: 5 # Optional, The number of words of a shingle, default: 5
+    ```
+    """
+    output = cast(pd.DataFrame, input.get_input())
+    ids = output[id_column].tolist()
+    canonical = find_near_duplicates(
+        [str(text) for text in output[column]],
+        threshold=threshold,
+        num_perm=num_perm,
+        shingle_size=shingle_size,
+    )
+    output[to] = [ids[index] for index in canonical]
+    return TableContainer(table=output)
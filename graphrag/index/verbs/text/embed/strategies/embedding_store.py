@@ -0,0 +1,117 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A module containing the 'EmbeddingStore' model."""
+
+import asyncio
+import hashlib
+import re
+import unicodedata
+import weakref
+from collections import defaultdict
+from typing import Any
+
+import numpy as np
+
+from graphrag.index.cache import PipelineCache
+
+EMBEDDING_STORE_NAME = "text_embedding_vectors"
+DEFAULT_MAX_CONCURRENT_READS = 8
+
+_index_locks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+
+def normalize_text(text: str) -> str:
+    """Normalize the unicode form and the whitespace of a text."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+class EmbeddingStore:
+    """A content-addressed store of text embeddings, kept in the pipeline cache.
+
+    Vectors are keyed by the hash of their normalized text and of the settings they
+    were embedded with, so the same text is embedded once by all the workflows of a
+    run and by the later runs sharing the cache. The vectors stored together are kept
+    in one segment entry, and an index entry per settings maps the keys to their
+    segments.
+    """
+
+    _cache: PipelineCache
+    _namespace: str
+    _index_key: str
+    _max_concurrent_reads: int
+
+    def __init__(
+        self,
+        cache: PipelineCache,
+        max_concurrent_reads: int = DEFAULT_MAX_CONCURRENT_READS,
+        **settings: Any,
+    ):
+        """Create a store.
+
+        Args:
+            - cache - The pipeline cache the vectors are kept in.
+            - max_concurrent_reads - The maximum number of segments read at once.
+            - settings - The settings the vectors are embedded with, e.g. the model.
+        """
+        self._cache = cache.child(EMBEDDING_STORE_NAME)
+        self._namespace = "\n".join(
+            f"{name}={value}" for name, value in sorted(settings.items())
+        )
+        self._index_key = f"index-{_hash(self._namespace)}"
+        self._max_concurrent_reads = max_concurrent_reads
+
+    def key(self, text: str) -> str:
+        """Return the content address of a normalized text."""
+        return _hash(f"{self._namespace}\n\n{text}")
+
+    async def get(self, keys: list[str]) -> dict[str, list[float]]:
+        """Return the stored vectors of the keys that have one."""
+        index = await self._cache.get(self._index_key) or {}
+        segments: dict[str, list[str]] = defaultdict(list)
+        for key in keys:
+            if key in index:
+                segments[index[key]].append(key)
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_reads)
+
+        async def read(segment: str, segment_keys: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                vectors = await self._cache.get(segment) or {}
+            return {key: vectors[key] for key in segment_keys if key in vectors}
+
+        result: dict[str, list[float]] = {}
+        for vectors in await asyncio.gather(*[
+            read(segment, segment_keys) for segment, segment_keys in segments.items()
+        ]):
+            result.update(vectors)
+        return result
+
+    async def set(self, vectors: dict[str, Any]) -> None:
+        """Store vectors by key, as one segment."""
+        segment_vectors = {
+            key: np.asarray(vector).tolist()
+            for key, vector in vectors.items()
+            if vector is not None
+        }
+        if not segment_vectors:
+            return
+        segment = f"segment-{_hash(self._namespace, *sorted(segment_vectors))}"
+        await self._cache.set(segment, segment_vectors)
+
+        # the index is read and written back, don't lose the keys of a concurrent set
+        async with _index_lock(self._index_key):
+            index = dict(await self._cache.get(self._index_key) or {})
+            index.update(dict.fromkeys(segment_vectors, segment))
+            await self._cache.set(self._index_key, index)
+
+
+def _hash(*parts: str) -> str:
+    return hashlib.sha256("\n\n".join(parts).encode()).hexdigest()
+
+
+def _index_lock(index_key: str) -> asyncio.Lock:
+    locks = _index_locks.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(index_key, asyncio.Lock())
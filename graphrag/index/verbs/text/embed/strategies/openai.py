@@ -17,6 +17,7 @@ from graphrag.index.text_splitting import TokenTextSplitter
 from graphrag.index.utils import is_null
 from graphrag.llm import EmbeddingLLM, OpenAIConfiguration
 
+from .embedding_store import EmbeddingStore, normalize_text
 from .typing import TextEmbeddingResult
 
 log = logging.getLogger(__name__)
@@ -40,6 +41,70 @@ async def run(
     llm = _get_llm(oai_config, callbacks, cache)
     semaphore: asyncio.Semaphore = asyncio.Semaphore(args.get("num_threads", 4))
 
+    # Embed each distinct text once, reusing the vectors of earlier workflows and runs
+    store = (
+        EmbeddingStore(
+            cache,
+            model=oai_config.deployment_name or oai_config.model,
+            encoding_model=oai_config.encoding_model or defs.ENCODING_MODEL,
+            batch_max_tokens=batch_max_tokens,
+        )
+        if cache is not None
+        else None
+    )
+    keys: list[str | None] = []
+    # texts differing in their whitespace only share a key, the first one is embedded
+    distinct: dict[str, str] = {}
+    for text in input:
+        if isinstance(text, str):
+            normalized = normalize_text(text)
+            key = store.key(normalized) if store is not None else normalized
+            distinct.setdefault(key, text)
+            keys.append(key)
+        else:
+            keys.append(None)
+    vectors = await store.get(list(distinct)) if store is not None else {}
+    missing = [key for key in distinct if key not in vectors]
+    others = [text for key, text in zip(keys, input, strict=True) if key is None]
+    log.info(
+        "embedding %d inputs: %d distinct texts, %d already embedded",
+        len(input),
+        len(distinct),
+        len(vectors),
+    )
+
+    embeddings = await _embed(
+        [distinct[key] for key in missing] + others,
+        llm,
+        callbacks,
+        semaphore,
+        batch_size,
+        batch_max_tokens,
+        splitter,
+    )
+    embedded = dict(zip(missing, embeddings, strict=False))
+    if store is not None:
+        await store.set(embedded)
+    vectors.update(embedded)
+    other_embeddings = iter(embeddings[len(missing) :])
+
+    return TextEmbeddingResult(
+        embeddings=[
+            vectors.get(key) if key is not None else next(other_embeddings)
+            for key in keys
+        ]
+    )
+
+
+async def _embed(
+    input: list[str],
+    llm: EmbeddingLLM,
+    callbacks: VerbCallbacks,
+    semaphore: asyncio.Semaphore,
+    batch_size: int,
+    batch_max_tokens: int,
+    splitter: TokenTextSplitter,
+) -> list[list[float] | None]:
     # Break up the input texts. The sizes here indicate how many snippets are in each input text
     texts, input_sizes = _prepare_embed_texts(input, splitter)
     text_batches = _create_text_batches(
@@ -60,9 +125,7 @@ async def run(
 
     # Embed each chunk of snippets
     embeddings = await _execute(llm, text_batches, ticker, semaphore)
-    embeddings = _reconstitute_embeddings(embeddings, input_sizes)
-
-    return TextEmbeddingResult(embeddings=embeddings)
+    return _reconstitute_embeddings(embeddings, input_sizes)
 
 
 def _get_splitter(
@@ -3,6 +3,7 @@
 
 """A module containing text_embed, load_strategy and create_row_from_embedding_data methods definition."""
 
+import asyncio
 import logging
 from enum import Enum
 from typing import Any, cast
@@ -18,7 +19,7 @@ from graphrag.vector_stores import (
     VectorStoreFactory,
 )
 
-from .strategies.typing import TextEmbeddingStrategy
+from .strategies.typing import TextEmbeddingResult, TextEmbeddingStrategy
 
 log = logging.getLogger(__name__)
 
@@ -26,6 +27,9 @@ log = logging.getLogger(__name__)
 # https://learn.microsoft.com/en-us/azure/ai-services/openai/reference
 DEFAULT_EMBEDDING_BATCH_SIZE = 500
 
+# one batch is embedded while the previous one is written, more only splits the threads
+MAX_CONCURRENT_EMBEDDING_BATCHES = 2
+
 
 class TextEmbedStrategyType(str, Enum):
     """TextEmbedStrategyType class definition."""
@@ -167,53 +171,82 @@ async def _text_embed_with_vector_store(
         msg = f"Column {id_column} not found in input dataframe with columns {output_df.columns}"
         raise ValueError(msg)
 
-    total_rows = 0
-    for row in output_df[column]:
-        if isinstance(row, list):
-            total_rows += len(row)
-        else:
-            total_rows += 1
+    # The batches are embedded concurrently, while a writer loads the embedded
+    # batches into the vector store in order. The queue bounds the batches in flight.
+    # The threads are split between the concurrent batches, so that no more than
+    # num_threads requests are in flight.
+    num_threads: int = strategy_args.get("num_threads", 4)
+    concurrent_batches = min(num_threads, MAX_CONCURRENT_EMBEDDING_BATCHES)
+    strategy_args["num_threads"] = max(num_threads // concurrent_batches, 1)
+    semaphore = asyncio.Semaphore(concurrent_batches)
+    queue: asyncio.Queue[tuple[pd.DataFrame, asyncio.Task[TextEmbeddingResult]] | None]
+    queue = asyncio.Queue(maxsize=concurrent_batches)
+
+    async def embed(batch: pd.DataFrame) -> TextEmbeddingResult:
+        async with semaphore:
+            return await strategy_exec(
+                batch[column].to_numpy().tolist(),
+                callbacks,
+                cache,
+                strategy_args,
+            )
+
+    tasks: list[asyncio.Task] = []
 
-    i = 0
-    starting_index = 0
+    async def produce() -> None:
+        for start in range(0, output_df.shape[0], insert_batch_size):
+            batch = output_df.iloc[start : start + insert_batch_size]
+            tasks.append(asyncio.create_task(embed(batch)))
+            await queue.put((batch, tasks[-1]))
+        await queue.put(None)
 
     all_results = []
 
-    while insert_batch_size * i < input.get_input().shape[0]:
-        batch = input.get_input().iloc[
-            insert_batch_size * i : insert_batch_size * (i + 1)
-        ]
-        texts: list[str] = batch[column].to_numpy().tolist()
-        titles: list[str] = batch[title_column].to_numpy().tolist()
-        ids: list[str] = batch[id_column].to_numpy().tolist()
-        result = await strategy_exec(
-            texts,
-            callbacks,
-            cache,
-            strategy_args,
-        )
-        if store_in_table and result.embeddings:
-            embeddings = [
-                embedding for embedding in result.embeddings if embedding is not None
-            ]
-            all_results.extend(embeddings)
-
-        vectors = result.embeddings or []
-        documents: list[VectorStoreDocument] = []
-        for id, text, title, vector in zip(ids, texts, titles, vectors, strict=True):
-            if type(vector) is np.ndarray:
-                vector = vector.tolist()
-            document = VectorStoreDocument(
-                id=id,
-                text=text,
-                vector=vector,
-                attributes={"title": title},
+    async def consume() -> None:
+        i = 0
+        while (item := await queue.get()) is not None:
+            batch, task = item
+            result = await task
+            if store_in_table and result.embeddings:
+                embeddings = [
+                    embedding
+                    for embedding in result.embeddings
+                    if embedding is not None
+                ]
+                all_results.extend(embeddings)
+
+            texts: list[str] = batch[column].to_numpy().tolist()
+            titles: list[str] = batch[title_column].to_numpy().tolist()
+            ids: list[str] = batch[id_column].to_numpy().tolist()
+            vectors = result.embeddings or []
+            documents: list[VectorStoreDocument] = []
+            for id, text, title, vector in zip(
+                ids, texts, titles, vectors, strict=True
+            ):
+                if type(vector) is np.ndarray:
+                    vector = vector.tolist()
+                document = VectorStoreDocument(
+                    id=id,
+                    text=text,
+                    vector=vector,
+                    attributes={"title": title},
+                )
+                documents.append(document)
+
+            # the writes are blocking, keep embedding the next batches meanwhile
+            await asyncio.to_thread(
+                vector_store.load_documents, documents, overwrite and i == 0
             )
-            documents.append(document)
-
-        vector_store.load_documents(documents, overwrite and i == 0)
-        starting_index += len(documents)
-        i += 1
+            i += 1
+
+    producer = asyncio.create_task(produce())
+    try:
+        await consume()
+        await producer
+    finally:
+        producer.cancel()
+        for task in tasks:
+            task.cancel()
 
     if store_in_table:
         output_df[to] = all_results
@@ -22,6 +22,7 @@ def build_steps(
     chunk_column_name = config.get("chunk_column", "chunk")
     chunk_by_columns = config.get("chunk_by", []) or []
     n_tokens_column_name = config.get("n_tokens_column", "n_tokens")
+    text_dedup_config = config.get("text_dedup")
     return [
         {
             "verb": "orderby",
@@ -109,4 +110,15 @@ def build_steps(
                 ],
             },
         },
+        {
+            # MAP NEAR-DUPLICATE CHUNKS TO A CANONICAL CHUNK
+            "verb": "text_dedup",
+            "enabled": text_dedup_config is not None,
+            "args": {
+                "column": chunk_column_name,
+                "id_column": "chunk_id",
+                "to": "canonical_chunk_id",
+                **(text_dedup_config or {}),
+            },
+        },
     ]
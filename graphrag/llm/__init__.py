@@ -6,14 +6,19 @@
 from .base import BaseLLM, CachingLLM, RateLimitingLLM
 from .errors import RetriesExhaustedError
 from .limiting import (
+    AdaptiveConcurrencyLimiter,
     CompositeLLMLimiter,
     LLMLimiter,
     NoopLLMLimiter,
+    SharedTokenBucketLLMLimiter,
+    TokenBucketLLMLimiter,
     TpmRpmLLMLimiter,
     create_tpm_rpm_limiters,
 )
 from .mock import MockChatLLM, MockCompletionLLM
 from .openai import (
+    OpenAIBatchChatLLM,
+    OpenAIBatcher,
     OpenAIChatLLM,
     OpenAIClientTypes,
     OpenAICompletionLLM,
@@ -41,11 +46,13 @@ from .types import (
     LLMInvocationResult,
     LLMOutput,
     OnCacheActionFn,
+    OnOutputChunkFn,
 )
 
 __all__ = [
     # LLM Types
     "LLM",
+    "AdaptiveConcurrencyLimiter",
     "BaseLLM",
     "CachingLLM",
     "CompletionInput",
@@ -72,6 +79,9 @@ __all__ = [
     "MockCompletionLLM",
     "NoopLLMLimiter",
     "OnCacheActionFn",
+    "OnOutputChunkFn",
+    "OpenAIBatchChatLLM",
+    "OpenAIBatcher",
     "OpenAIChatLLM",
     "OpenAIClientTypes",
     "OpenAICompletionLLM",
@@ -81,6 +91,8 @@ __all__ = [
     "RateLimitingLLM",
     # Errors
     "RetriesExhaustedError",
+    "SharedTokenBucketLLMLimiter",
+    "TokenBucketLLMLimiter",
     "TpmRpmLLMLimiter",
     "create_openai_chat_llm",
     "create_openai_client",
@@ -3,8 +3,9 @@
 
 """A class to interact with the cache."""
 
+import asyncio
 import json
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from typing_extensions import Unpack
 
@@ -18,6 +19,11 @@ _cache_strategy_version = 2
 TIn = TypeVar("TIn")
 TOut = TypeVar("TOut")
 
+# The calls in flight by event loop, cache namespace and cache key. The verbs create
+# an LLM per row, so identical calls of different rows are only seen here, and verbs
+# running in threads have an event loop per thread.
+_in_flight: dict[tuple[asyncio.AbstractEventLoop, str, str], asyncio.Future[Any]] = {}
+
 
 def _noop_cache_fn(_k: str, _v: str | None):
     pass
@@ -32,6 +38,8 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
     _llm_parameters: dict
     _on_cache_hit: OnCacheActionFn
     _on_cache_miss: OnCacheActionFn
+    _on_cache_coalesced: OnCacheActionFn
+    _namespace: str
 
     def __init__(
         self,
@@ -39,6 +47,7 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         llm_parameters: dict,
         operation: str,
         cache: LLMCache,
+        namespace: str = "",
     ):
         self._delegate = delegate
         self._llm_parameters = llm_parameters
@@ -46,6 +55,9 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         self._operation = operation
         self._on_cache_hit = _noop_cache_fn
         self._on_cache_miss = _noop_cache_fn
+        self._on_cache_coalesced = _noop_cache_fn
+        # calls only coalesce with the calls of LLMs writing to the same cache
+        self._namespace = namespace
 
     def set_delegate(self, delegate: LLM[TIn, TOut]) -> None:
         """Set the delegate LLM. (for testing)."""
@@ -59,6 +71,10 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         """Set the function to call when a cache miss occurs."""
         self._on_cache_miss = fn or _noop_cache_fn
 
+    def on_cache_coalesced(self, fn: OnCacheActionFn | None) -> None:
+        """Set the function to call when a call joins an identical in-flight call."""
+        self._on_cache_coalesced = fn or _noop_cache_fn
+
     def _cache_key(
         self, input: TIn, name: str | None, args: dict, history: list[dict] | None
     ) -> str:
@@ -81,6 +97,41 @@ class CachingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         history_in = kwargs.get("history") or None
         llm_args = {**self._llm_parameters, **(kwargs.get("model_parameters") or {})}
         cache_key = self._cache_key(input, name, llm_args, history_in)
+
+        # Identical concurrent calls share the result of the first one
+        loop = asyncio.get_running_loop()
+        in_flight_key = (loop, self._namespace, cache_key)
+        while (in_flight := _in_flight.get(in_flight_key)) is not None:
+            shared_result = await asyncio.shield(in_flight)
+            if shared_result is not None:
+                self._on_cache_coalesced(cache_key, name)
+                return shared_result
+
+        future: asyncio.Future[LLMOutput[TOut] | None] = loop.create_future()
+        _in_flight[in_flight_key] = future
+        try:
+            result = await self._cached_call(
+                input, cache_key, llm_args, history_in, **kwargs
+            )
+        except BaseException:
+            # If the call failed, the waiting calls make their own attempt
+            future.set_result(None)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del _in_flight[in_flight_key]
+
+    async def _cached_call(
+        self,
+        input: TIn,
+        cache_key: str,
+        llm_args: dict,
+        history_in: list[dict] | None,
+        **kwargs: Unpack[LLMInput],
+    ) -> LLMOutput[TOut]:
+        name = kwargs.get("name")
         cached_result = await self._cache.get(cache_key)
 
         if cached_result:
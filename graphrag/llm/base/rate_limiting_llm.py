@@ -16,8 +16,9 @@ from tenacity import (
 )
 from typing_extensions import Unpack
 
+import graphrag.config.defaults as defs
 from graphrag.llm.errors import RetriesExhaustedError
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter, LLMLimiter
 from graphrag.llm.types import (
     LLM,
     LLMConfig,
@@ -42,12 +43,13 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
 
     _delegate: LLM[TIn, TOut]
     _rate_limiter: LLMLimiter | None
-    _semaphore: asyncio.Semaphore | None
+    _semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None
     _count_tokens: Callable[[str], int]
     _config: LLMConfig
     _operation: str
     _retryable_errors: list[type[Exception]]
     _rate_limit_errors: list[type[Exception]]
+    _overload_errors: tuple[type[BaseException], ...]
     _on_invoke: LLMInvocationFn
     _extract_sleep_recommendation: Callable[[Any], float]
 
@@ -59,9 +61,10 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         retryable_errors: list[type[Exception]],
         rate_limit_errors: list[type[Exception]],
         rate_limiter: LLMLimiter | None = None,
-        semaphore: asyncio.Semaphore | None = None,
+        semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None = None,
         count_tokens: Callable[[str], int] | None = None,
         get_sleep_time: Callable[[BaseException], float] | None = None,
+        overload_errors: list[type[Exception]] | None = None,
     ):
         self._delegate = delegate
         self._rate_limiter = rate_limiter
@@ -70,6 +73,11 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         self._operation = operation
         self._retryable_errors = retryable_errors
         self._rate_limit_errors = rate_limit_errors
+        # errors that tell an adaptive concurrency limiter to back off
+        self._overload_errors = (
+            *(overload_errors or rate_limit_errors),
+            asyncio.TimeoutError,
+        )
         self._count_tokens = count_tokens or (lambda _s: -1)
         self._extract_sleep_recommendation = get_sleep_time or (lambda _e: 0.0)
         self._on_invoke = lambda _v: None
@@ -107,6 +115,18 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             return 0
         raise TypeError(_CANNOT_MEASURE_OUTPUT_TOKENS_MSG)
 
+    def _max_output_tokens(self, kwargs: LLMInput) -> int:
+        """Return the maximum number of output tokens of a request."""
+        if self._operation == "embedding":
+            return 0
+        model_parameters = kwargs.get("model_parameters") or {}
+        return (
+            model_parameters.get("max_tokens")
+            or self._config.max_tokens
+            # reserved for a request without max_tokens, the unused part is refunded
+            or defs.LLM_MAX_TOKENS
+        )
+
     async def __call__(
         self,
         input: TIn,
@@ -117,6 +137,13 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
         attempt_number = 0
         call_times: list[float] = []
         input_tokens = self.count_request_tokens(input)
+        refund_tokens = self._rate_limiter is not None and (
+            self._rate_limiter.supports_refunds
+        )
+        # reserve the output tokens up front, the unused ones are refunded
+        reserved_output_tokens = (
+            self._max_output_tokens(kwargs) if refund_tokens and input_tokens > 0 else 0
+        )
         max_retries = self._config.max_retries or 10
         max_retry_wait = self._config.max_retry_wait or 10
         follow_recommendation = self._config.sleep_on_rate_limit_recommendation
@@ -140,12 +167,27 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
                 await asyncio.sleep(time)
             raise
 
+        adaptive_limiter = (
+            self._semaphore
+            if isinstance(self._semaphore, AdaptiveConcurrencyLimiter)
+            else None
+        )
+
         async def do_attempt() -> LLMOutput[TOut]:
             nonlocal call_times
             call_start = asyncio.get_event_loop().time()
             try:
-                return await self._delegate(input, **kwargs)
+                result = await self._delegate(input, **kwargs)
+                if adaptive_limiter is not None:
+                    adaptive_limiter.on_success(
+                        asyncio.get_event_loop().time() - call_start
+                    )
+                return result
             except BaseException as e:
+                if adaptive_limiter is not None and isinstance(
+                    e, self._overload_errors
+                ):
+                    adaptive_limiter.on_overload()
                 if isinstance(e, tuple(self._rate_limit_errors)):
                     sleep_time = self._extract_sleep_recommendation(e)
                     await sleep_for(sleep_time)
@@ -159,10 +201,18 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             async for attempt in retryer:
                 with attempt:
                     if self._rate_limiter and input_tokens > 0:
-                        await self._rate_limiter.acquire(input_tokens)
+                        await self._rate_limiter.acquire(
+                            input_tokens + reserved_output_tokens
+                        )
                     start = asyncio.get_event_loop().time()
                     attempt_number += 1
-                    return await do_attempt(), start
+                    try:
+                        return await do_attempt(), start
+                    except BaseException:
+                        # a failed attempt produces no output tokens
+                        if self._rate_limiter and reserved_output_tokens > 0:
+                            await self._rate_limiter.refund(reserved_output_tokens)
+                        raise
 
             log.error("Retries exhausted for %s", name)
             raise RetriesExhaustedError(name, max_retries)
@@ -178,7 +228,11 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
 
         end = asyncio.get_event_loop().time()
         output_tokens = self.count_response_tokens(result.output)
-        if self._rate_limiter and output_tokens > 0:
+        if self._rate_limiter and refund_tokens:
+            await self._rate_limiter.refund(
+                reserved_output_tokens - max(output_tokens, 0)
+            )
+        elif self._rate_limiter and output_tokens > 0:
             await self._rate_limiter.acquire(output_tokens)
 
         invocation_result = LLMInvocationResult(
@@ -189,6 +243,9 @@ class RateLimitingLLM(LLM[TIn, TOut], Generic[TIn, TOut]):
             call_times=call_times,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            concurrency_limit=adaptive_limiter.limit
+            if adaptive_limiter is not None
+            else None,
         )
         self._handle_invoke_result(invocation_result)
         return result
@@ -3,16 +3,22 @@
 
 """LLM limiters module."""
 
+from .adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
 from .composite_limiter import CompositeLLMLimiter
 from .create_limiters import create_tpm_rpm_limiters
 from .llm_limiter import LLMLimiter
 from .noop_llm_limiter import NoopLLMLimiter
+from .shared_token_bucket_limiter import SharedTokenBucketLLMLimiter
+from .token_bucket_limiter import TokenBucketLLMLimiter
 from .tpm_rpm_limiter import TpmRpmLLMLimiter
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
     "CompositeLLMLimiter",
     "LLMLimiter",
     "NoopLLMLimiter",
+    "SharedTokenBucketLLMLimiter",
+    "TokenBucketLLMLimiter",
     "TpmRpmLLMLimiter",
     "create_tpm_rpm_limiters",
 ]
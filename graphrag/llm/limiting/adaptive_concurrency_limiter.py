@@ -0,0 +1,151 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Adaptive concurrency limiter module."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Self
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_LATENCY_SMOOTHING = 0.2
+DEFAULT_BASELINE_DRIFT = 0.01
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limit the number of in-flight requests with additive-increase/multiplicative-decrease.
+
+    The limit grows by one request for every `limit` successful requests made while
+    the limiter is saturated and the latency stays within a tolerance of its
+    baseline. It is cut by a constant factor, at most once per request latency, when
+    a request is rate limited or times out. The limiter can be used in place of an
+    asyncio.Semaphore, with `async with limiter:`.
+    """
+
+    _limit: float
+    _min_limit: int
+    _max_limit: int
+    _decrease_factor: float
+    _latency_tolerance: float
+    _in_flight: int
+    _waiters: deque[asyncio.Future[None]]
+    _latency: float | None
+    _baseline_latency: float | None
+    _last_decrease: float
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    ):
+        """Create an adaptive concurrency limiter.
+
+        Args:
+            - initial_limit - The number of concurrent requests to start with.
+            - max_limit - The maximum number of concurrent requests.
+            - min_limit - The minimum number of concurrent requests.
+            - decrease_factor - The factor the limit is multiplied by on overload.
+            - latency_tolerance - The latency, relative to the baseline, above which the limit stops growing.
+        """
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._in_flight = 0
+        self._waiters = deque()
+        self._latency = None
+        self._baseline_latency = None
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Return the current number of allowed concurrent requests."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests holding the limiter."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait until a request may start."""
+        if self._in_flight < self.limit and len(self._waiters) == 0:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted before the cancellation arrived
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Release the slot of a finished request."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    async def __aenter__(self) -> Self:
+        """Acquire a slot."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        """Release the slot."""
+        self.release()
+
+    def on_success(self, latency: float) -> None:
+        """Record a successful request and its latency."""
+        if self._latency is None or self._baseline_latency is None:
+            self._latency = latency
+            self._baseline_latency = latency
+        else:
+            self._latency += DEFAULT_LATENCY_SMOOTHING * (latency - self._latency)
+            # the baseline follows slower requests slowly, e.g. when prompts grow
+            self._baseline_latency = min(
+                self._latency,
+                self._baseline_latency
+                + DEFAULT_BASELINE_DRIFT * (self._latency - self._baseline_latency),
+            )
+
+        is_saturated = self._in_flight >= self.limit
+        is_healthy = self._latency <= self._latency_tolerance * self._baseline_latency
+        if is_saturated and is_healthy and self._limit < self._max_limit:
+            previous_limit = self.limit
+            self._limit = min(self._limit + 1 / self._limit, self._max_limit)
+            if self.limit > previous_limit:
+                log.debug("increased concurrency limit to %d", self.limit)
+                self._wake_waiters()
+
+    def on_overload(self) -> None:
+        """Record a rate limited or timed out request."""
+        now = time.monotonic()
+        # overloads reported by requests that were started before the last decrease
+        # belong to the same congestion event
+        if now - self._last_decrease < (self._latency or 1.0):
+            return
+
+        self._last_decrease = now
+        self._limit = max(self._limit * self._decrease_factor, self._min_limit)
+        log.info("decreased concurrency limit to %d", self.limit)
+
+    def _wake_waiters(self) -> None:
+        while len(self._waiters) > 0 and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
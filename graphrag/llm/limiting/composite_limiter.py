@@ -20,7 +20,17 @@ class CompositeLLMLimiter(LLMLimiter):
         """Whether this limiter needs the token count to be passed in."""
         return any(limiter.needs_token_count for limiter in self._limiters)
 
+    @property
+    def supports_refunds(self) -> bool:
+        """Whether unused tokens can be returned to this limiter."""
+        return all(limiter.supports_refunds for limiter in self._limiters)
+
     async def acquire(self, num_tokens: int = 1) -> None:
         """Call method definition."""
         for limiter in self._limiters:
             await limiter.acquire(num_tokens)
+
+    async def refund(self, num_tokens: int) -> None:
+        """Return unused acquired tokens, or charge extra tokens if negative."""
+        for limiter in self._limiters:
+            await limiter.refund(num_tokens)
@@ -4,13 +4,13 @@
 """Create limiters for OpenAI API requests."""
 
 import logging
-
-from aiolimiter import AsyncLimiter
+import sys
 
 from graphrag.llm.types import LLMConfig
 
 from .llm_limiter import LLMLimiter
-from .tpm_rpm_limiter import TpmRpmLLMLimiter
+from .shared_token_bucket_limiter import SharedTokenBucketLLMLimiter
+from .token_bucket_limiter import TokenBucketLLMLimiter
 
 log = logging.getLogger(__name__)
 
@@ -19,11 +19,26 @@ log = logging.getLogger(__name__)
 
 def create_tpm_rpm_limiters(
     configuration: LLMConfig,
+    name: str = "default",
 ) -> LLMLimiter:
-    """Get the limiters for a given model name."""
+    """Get the limiters for a given model name.
+
+    Shared limiters with the same name coordinate the limits of all the processes
+    on the host.
+    """
     tpm = configuration.tokens_per_minute
     rpm = configuration.requests_per_minute
-    return TpmRpmLLMLimiter(
-        None if tpm == 0 else AsyncLimiter(tpm or 50_000),
-        None if rpm == 0 else AsyncLimiter(rpm or 10_000),
+    tokens_per_minute = None if tpm == 0 else tpm or 50_000
+    requests_per_minute = None if rpm == 0 else rpm or 10_000
+    aligned = bool(configuration.minute_aligned_rate_limits)
+
+    if configuration.rate_limiter_type == "shared":
+        if sys.platform != "win32":
+            return SharedTokenBucketLLMLimiter(
+                name, tokens_per_minute, requests_per_minute, aligned=aligned
+            )
+        log.warning("shared rate limiters are not supported on Windows, using local")
+
+    return TokenBucketLLMLimiter(
+        tokens_per_minute, requests_per_minute, aligned=aligned
     )
@@ -17,3 +17,11 @@ class LLMLimiter(ABC):
     @abstractmethod
     async def acquire(self, num_tokens: int = 1) -> None:
         """Acquire a pass through the limiter."""
+
+    @property
+    def supports_refunds(self) -> bool:
+        """Whether unused tokens can be returned to this limiter."""
+        return False
+
+    async def refund(self, num_tokens: int) -> None:
+        """Return unused acquired tokens, or charge extra tokens if negative."""
@@ -0,0 +1,216 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Token bucket TPM RPM Limiter shared by the processes of a host."""
+
+import asyncio
+import contextlib
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import weakref
+from collections.abc import Iterator
+from pathlib import Path
+
+from .token_bucket_limiter import RATE_LIMIT_PERIOD, TokenBucket, TokenBucketLLMLimiter
+
+if sys.platform != "win32":
+    import fcntl
+
+DEFAULT_STATE_DIR = Path(tempfile.gettempdir()) / "graphrag-rate-limits"
+DEFAULT_POLL_INTERVAL = 1.0
+
+# the bucket level, and the time of the last refill (or the window when aligned)
+_STATE = struct.Struct("<dd")
+
+
+class SharedTokenBucket(TokenBucket):
+    """A token bucket whose level lives in a memory-mapped file.
+
+    Every process that opens the same file draws from the same bucket. Updates are
+    made under an exclusive file lock, and are only a few memory accesses long, so
+    the lock is taken without leaving the event loop. Processes sharing a bucket
+    should agree on its rate and alignment. Tokens returned by another process are
+    noticed by polling. Each process holds a shared lock on a companion file while
+    the bucket is open, and the last one to close it removes both files.
+    """
+
+    _path: Path
+    _fd: int
+    _users_fd: int
+    _state: mmap.mmap
+    _finalizer: weakref.finalize
+
+    def __init__(
+        self,
+        path: str | Path,
+        rate: float,
+        period: float = RATE_LIMIT_PERIOD,
+        aligned: bool = False,
+    ):
+        """Open or create a shared token bucket, a new bucket starts full.
+
+        Args:
+            - path - The path of the file holding the bucket.
+            - rate - The number of tokens per period, which is also the bucket size.
+            - period - The period in seconds.
+            - aligned - Whether the budget resets at the start of each wall-clock period.
+        """
+        super().__init__(rate, period, aligned)
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd, self._users_fd = _open_state(self._path)
+        with self._locked():
+            if os.fstat(self._fd).st_size < _STATE.size:
+                os.ftruncate(self._fd, _STATE.size)
+                os.pwrite(self._fd, _STATE.pack(rate, self._stamp()), 0)
+        self._state = mmap.mmap(self._fd, _STATE.size)
+        self._finalizer = weakref.finalize(
+            self, _close_state, self._path, self._fd, self._users_fd, self._state
+        )
+
+    def close(self) -> None:
+        """Close the bucket, and remove its files if no other process uses it."""
+        self._finalizer()
+
+    @property
+    def level(self) -> float:
+        """Return the number of available tokens, negative when in debt."""
+        with self._locked():
+            return self._refill()[0]
+
+    async def acquire(self, amount: float) -> None:
+        """Wait until the tokens are available and take them."""
+        needed = min(amount, self._rate)
+        async with self._lock:
+            while (wait := self._take(amount, needed)) > 0:
+                self._refunded.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._refunded.wait(), min(wait, DEFAULT_POLL_INTERVAL)
+                    )
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens, or take more tokens without waiting if negative."""
+        with self._locked():
+            level, stamp = self._refill()
+            _STATE.pack_into(self._state, 0, min(level + amount, self._rate), stamp)
+        if amount > 0:
+            self._refunded.set()
+
+    def _take(self, amount: float, needed: float) -> float:
+        """Take the tokens if available, otherwise return the seconds to wait."""
+        with self._locked():
+            level, stamp = self._refill()
+            if level < needed:
+                _STATE.pack_into(self._state, 0, level, stamp)
+                if self._aligned:
+                    return self._period - time.time() % self._period
+                return (needed - level) * self._period / self._rate
+            _STATE.pack_into(self._state, 0, level - amount, stamp)
+            return 0
+
+    def _stamp(self) -> float:
+        now = time.time()
+        return float(now // self._period) if self._aligned else now
+
+    def _refill(self) -> tuple[float, float]:
+        level, stamp = _STATE.unpack_from(self._state, 0)
+        now = self._stamp()
+        if self._aligned:
+            if now != stamp:
+                level = min(level + self._rate, self._rate)
+        else:
+            elapsed = max(now - stamp, 0.0)
+            level = min(level + elapsed * self._rate / self._period, self._rate)
+        return level, now
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+def _users_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.users")
+
+
+def _open_state(path: Path) -> tuple[int, int]:
+    """Open the file of a bucket, and register as one of its users.
+
+    A file removed by its last user while it was being opened is opened again.
+    """
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            with contextlib.suppress(FileNotFoundError):
+                if os.path.samestat(os.fstat(fd), os.stat(path)):
+                    users_fd = os.open(_users_path(path), os.O_RDWR | os.O_CREAT, 0o600)
+                    fcntl.flock(users_fd, fcntl.LOCK_SH)
+                    return fd, users_fd
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _close_state(path: Path, fd: int, users_fd: int, state: mmap.mmap) -> None:
+    """Close the file of a bucket, the last user removes it."""
+    state.close()
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        fcntl.flock(users_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        pass
+    else:
+        path.unlink(missing_ok=True)
+        _users_path(path).unlink(missing_ok=True)
+    finally:
+        os.close(users_fd)
+        os.close(fd)
+
+
+class SharedTokenBucketLLMLimiter(TokenBucketLLMLimiter):
+    """TPM RPM Limiter shared by the processes of a host.
+
+    The limiters created with the same name, in any process, draw from the same
+    buckets, so that together they stay within the limits of an API key or a
+    deployment.
+    """
+
+    _name: str
+    _state_dir: Path
+
+    def __init__(
+        self,
+        name: str,
+        tokens_per_minute: int | None,
+        requests_per_minute: int | None,
+        aligned: bool = False,
+        state_dir: str | Path = DEFAULT_STATE_DIR,
+    ):
+        """Create a limiter, a limit of 0 or None is not enforced.
+
+        Args:
+            - name - The name of the shared limits, e.g. the API base and the model.
+            - tokens_per_minute - The number of tokens per minute.
+            - requests_per_minute - The number of requests per minute.
+            - aligned - Whether the budgets reset at the start of each wall-clock minute.
+            - state_dir - The directory of the files holding the buckets.
+        """
+        self._name = name
+        self._state_dir = Path(state_dir)
+        super().__init__(tokens_per_minute, requests_per_minute, aligned)
+
+    def _create_bucket(self, kind: str, rate: int, aligned: bool) -> TokenBucket:
+        digest = hashlib.sha256(self._name.encode("utf-8")).hexdigest()[:16]
+        return SharedTokenBucket(
+            self._state_dir / f"{digest}.{kind}", rate, aligned=aligned
+        )
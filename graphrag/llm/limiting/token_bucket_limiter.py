@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""Token bucket TPM RPM Limiter module."""
+
+import asyncio
+import contextlib
+import time
+
+from .llm_limiter import LLMLimiter
+
+RATE_LIMIT_PERIOD = 60.0
+
+
+class TokenBucket:
+    """A bucket of tokens refilled at a fixed rate per period.
+
+    The bucket refills continuously, or when aligned, starts every wall-clock period
+    (e.g. every minute) with a full budget. Requests larger than the bucket are let
+    through once it is full and leave the bucket in debt. Acquirers are served in
+    order, and tokens that are returned wake the next one up.
+    """
+
+    _rate: float
+    _period: float
+    _aligned: bool
+    _level: float
+    _updated: float
+    _window: int
+    _lock: asyncio.Lock
+    _refunded: asyncio.Event
+
+    def __init__(
+        self, rate: float, period: float = RATE_LIMIT_PERIOD, aligned: bool = False
+    ):
+        """Create a full token bucket.
+
+        Args:
+            - rate - The number of tokens per period, which is also the bucket size.
+            - period - The period in seconds.
+            - aligned - Whether the budget resets at the start of each wall-clock period.
+        """
+        self._rate = rate
+        self._period = period
+        self._aligned = aligned
+        self._level = rate
+        self._updated = time.monotonic()
+        self._window = self._current_window()
+        self._lock = asyncio.Lock()
+        self._refunded = asyncio.Event()
+
+    @property
+    def level(self) -> float:
+        """Return the number of available tokens, negative when in debt."""
+        self._refill()
+        return self._level
+
+    async def acquire(self, amount: float) -> None:
+        """Wait until the tokens are available and take them."""
+        needed = min(amount, self._rate)
+        async with self._lock:
+            while self.level < needed:
+                self._refunded.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._refunded.wait(), self._time_until(needed)
+                    )
+            self._level -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens, or take more tokens without waiting if negative."""
+        self._refill()
+        self._level = min(self._level + amount, self._rate)
+        if amount > 0:
+            self._refunded.set()
+
+    def _current_window(self) -> int:
+        return int(time.time() // self._period)
+
+    def _refill(self) -> None:
+        if self._aligned:
+            window = self._current_window()
+            if window != self._window:
+                self._window = window
+                self._level = min(self._level + self._rate, self._rate)
+            return
+
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._level = min(self._level + elapsed * self._rate / self._period, self._rate)
+
+    def _time_until(self, amount: float) -> float:
+        if self._aligned:
+            return self._period - time.time() % self._period
+        return (amount - self._level) * self._period / self._rate
+
+
+class TokenBucketLLMLimiter(LLMLimiter):
+    """TPM RPM Limiter that reserves tokens up front and refunds the unused ones.
+
+    Callers acquire the input tokens plus the maximum number of output tokens of a
+    request, and refund the difference once the response tokens are counted, so
+    that concurrent requests cannot overshoot the TPM limit together.
+    """
+
+    _tpm_bucket: TokenBucket | None
+    _rpm_bucket: TokenBucket | None
+
+    def __init__(
+        self,
+        tokens_per_minute: int | None,
+        requests_per_minute: int | None,
+        aligned: bool = False,
+    ):
+        """Create a limiter, a limit of 0 or None is not enforced.
+
+        Args:
+            - tokens_per_minute - The number of tokens per minute.
+            - requests_per_minute - The number of requests per minute.
+            - aligned - Whether the budgets reset at the start of each wall-clock minute.
+        """
+        self._tpm_bucket = (
+            self._create_bucket("tpm", tokens_per_minute, aligned)
+            if tokens_per_minute
+            else None
+        )
+        self._rpm_bucket = (
+            self._create_bucket("rpm", requests_per_minute, aligned)
+            if requests_per_minute
+            else None
+        )
+
+    def _create_bucket(self, kind: str, rate: int, aligned: bool) -> TokenBucket:
+        return TokenBucket(rate, aligned=aligned)
+
+    @property
+    def needs_token_count(self) -> bool:
+        """Whether this limiter needs the token count to be passed in."""
+        return self._tpm_bucket is not None
+
+    @property
+    def supports_refunds(self) -> bool:
+        """Whether unused tokens can be returned to this limiter."""
+        return True
+
+    async def acquire(self, num_tokens: int = 1) -> None:
+        """Reserve the tokens of a request, and count the request."""
+        if self._tpm_bucket is not None:
+            await self._tpm_bucket.acquire(num_tokens)
+        if self._rpm_bucket is not None:
+            await self._rpm_bucket.acquire(1)
+
+    async def refund(self, num_tokens: int) -> None:
+        """Return unused reserved tokens, or charge extra tokens if negative."""
+        if self._tpm_bucket is not None and num_tokens != 0:
+            self._tpm_bucket.refund(num_tokens)
@@ -9,6 +9,7 @@ from .factories import (
     create_openai_completion_llm,
     create_openai_embedding_llm,
 )
+from .openai_batch_chat_llm import OpenAIBatchChatLLM, OpenAIBatcher
 from .openai_chat_llm import OpenAIChatLLM
 from .openai_completion_llm import OpenAICompletionLLM
 from .openai_configuration import OpenAIConfiguration
@@ -16,6 +17,8 @@ from .openai_embeddings_llm import OpenAIEmbeddingsLLM
 from .types import OpenAIClientTypes
 
 __all__ = [
+    "OpenAIBatchChatLLM",
+    "OpenAIBatcher",
     "OpenAIChatLLM",
     "OpenAIClientTypes",
     "OpenAICompletionLLM",
@@ -9,6 +9,7 @@ from functools import cache
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 from openai import AsyncAzureOpenAI, AsyncOpenAI
 
+from .http_client_pool import DEFAULT_MAX_CONNECTIONS, get_async_http_client
 from .openai_configuration import OpenAIConfiguration
 from .types import OpenAIClientTypes
 
@@ -21,7 +22,16 @@ API_BASE_REQUIRED_FOR_AZURE = "api_base is required for Azure OpenAI client"
 def create_openai_client(
     configuration: OpenAIConfiguration, azure: bool
 ) -> OpenAIClientTypes:
-    """Create a new OpenAI client instance."""
+    """Create a new OpenAI client instance.
+
+    The clients share the pooled connections of their endpoint.
+    """
+    http_client = get_async_http_client(
+        configuration.api_base,
+        configuration.proxy,
+        http2=bool(configuration.http2),
+        max_connections=configuration.max_connections or DEFAULT_MAX_CONNECTIONS,
+    )
     if azure:
         api_base = configuration.api_base
         if api_base is None:
@@ -52,6 +62,7 @@ def create_openai_client(
             # Timeout/Retry Configuration - Use Tenacity for Retries, so disable them here
             timeout=configuration.request_timeout or 180.0,
             max_retries=0,
+            http_client=http_client,
         )
 
     log.info("Creating OpenAI client base_url=%s", configuration.api_base)
@@ -62,4 +73,5 @@ def create_openai_client(
         # Timeout/Retry Configuration - Use Tenacity for Retries, so disable them here
         timeout=configuration.request_timeout or 180.0,
         max_retries=0,
+        http_client=http_client,
     )
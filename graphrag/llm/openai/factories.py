@@ -6,7 +6,7 @@
 import asyncio
 
 from graphrag.llm.base import CachingLLM, RateLimitingLLM
-from graphrag.llm.limiting import LLMLimiter
+from graphrag.llm.limiting import AdaptiveConcurrencyLimiter, LLMLimiter
 from graphrag.llm.types import (
     LLM,
     CompletionLLM,
@@ -18,6 +18,7 @@ from graphrag.llm.types import (
 )
 
 from .json_parsing_llm import JsonParsingLLM
+from .openai_batch_chat_llm import OpenAIBatchChatLLM, OpenAIBatcher
 from .openai_chat_llm import OpenAIChatLLM
 from .openai_completion_llm import OpenAICompletionLLM
 from .openai_configuration import OpenAIConfiguration
@@ -26,6 +27,7 @@ from .openai_history_tracking_llm import OpenAIHistoryTrackingLLM
 from .openai_token_replacing_llm import OpenAITokenReplacingLLM
 from .types import OpenAIClientTypes
 from .utils import (
+    OVERLOAD_ERRORS,
     RATE_LIMIT_ERRORS,
     RETRYABLE_ERRORS,
     get_completion_cache_args,
@@ -39,20 +41,39 @@ def create_openai_chat_llm(
     config: OpenAIConfiguration,
     cache: LLMCache | None = None,
     limiter: LLMLimiter | None = None,
-    semaphore: asyncio.Semaphore | None = None,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None = None,
     on_invoke: LLMInvocationFn | None = None,
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    on_cache_coalesced: OnCacheActionFn | None = None,
+    cache_namespace: str = "",
+    batcher: OpenAIBatcher | None = None,
 ) -> CompletionLLM:
-    """Create an OpenAI chat LLM."""
+    """Create an OpenAI chat LLM.
+
+    With a batcher, requests are submitted to the batch API, and the rate limited
+    LLM only handles the requests that fail in a batch.
+    """
     operation = "chat"
     result = OpenAIChatLLM(client, config)
     result.on_error(on_error)
     if limiter is not None or semaphore is not None:
         result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
+    if batcher is not None:
+        result = OpenAIBatchChatLLM(client, config, batcher, result)
+        result.on_error(on_error)
     if cache is not None:
-        result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
+        result = _cached(
+            result,
+            config,
+            operation,
+            cache,
+            on_cache_hit,
+            on_cache_miss,
+            on_cache_coalesced,
+            cache_namespace,
+        )
     result = OpenAIHistoryTrackingLLM(result)
     result = OpenAITokenReplacingLLM(result)
     return JsonParsingLLM(result)
@@ -63,11 +84,13 @@ def create_openai_completion_llm(
     config: OpenAIConfiguration,
     cache: LLMCache | None = None,
     limiter: LLMLimiter | None = None,
-    semaphore: asyncio.Semaphore | None = None,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None = None,
     on_invoke: LLMInvocationFn | None = None,
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    on_cache_coalesced: OnCacheActionFn | None = None,
+    cache_namespace: str = "",
 ) -> CompletionLLM:
     """Create an OpenAI completion LLM."""
     operation = "completion"
@@ -76,7 +99,16 @@ def create_openai_completion_llm(
     if limiter is not None or semaphore is not None:
         result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
     if cache is not None:
-        result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
+        result = _cached(
+            result,
+            config,
+            operation,
+            cache,
+            on_cache_hit,
+            on_cache_miss,
+            on_cache_coalesced,
+            cache_namespace,
+        )
     return OpenAITokenReplacingLLM(result)
 
 
@@ -85,11 +117,13 @@ def create_openai_embedding_llm(
     config: OpenAIConfiguration,
     cache: LLMCache | None = None,
     limiter: LLMLimiter | None = None,
-    semaphore: asyncio.Semaphore | None = None,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None = None,
     on_invoke: LLMInvocationFn | None = None,
     on_error: ErrorHandlerFn | None = None,
     on_cache_hit: OnCacheActionFn | None = None,
     on_cache_miss: OnCacheActionFn | None = None,
+    on_cache_coalesced: OnCacheActionFn | None = None,
+    cache_namespace: str = "",
 ) -> EmbeddingLLM:
     """Create an OpenAI embeddings LLM."""
     operation = "embedding"
@@ -98,7 +132,16 @@ def create_openai_embedding_llm(
     if limiter is not None or semaphore is not None:
         result = _rate_limited(result, config, operation, limiter, semaphore, on_invoke)
     if cache is not None:
-        result = _cached(result, config, operation, cache, on_cache_hit, on_cache_miss)
+        result = _cached(
+            result,
+            config,
+            operation,
+            cache,
+            on_cache_hit,
+            on_cache_miss,
+            on_cache_coalesced,
+            cache_namespace,
+        )
     return result
 
 
@@ -107,7 +150,7 @@ def _rate_limited(
     config: OpenAIConfiguration,
     operation: str,
     limiter: LLMLimiter | None,
-    semaphore: asyncio.Semaphore | None,
+    semaphore: asyncio.Semaphore | AdaptiveConcurrencyLimiter | None,
     on_invoke: LLMInvocationFn | None,
 ):
     result = RateLimitingLLM(
@@ -120,6 +163,7 @@ def _rate_limited(
         semaphore,
         get_token_counter(config),
         get_sleep_time_from_error,
+        OVERLOAD_ERRORS,
     )
     result.on_invoke(on_invoke)
     return result
@@ -132,9 +176,12 @@ def _cached(
     cache: LLMCache,
     on_cache_hit: OnCacheActionFn | None,
     on_cache_miss: OnCacheActionFn | None,
+    on_cache_coalesced: OnCacheActionFn | None,
+    cache_namespace: str,
 ):
     cache_args = get_completion_cache_args(config)
-    result = CachingLLM(delegate, cache_args, operation, cache)
+    result = CachingLLM(delegate, cache_args, operation, cache, cache_namespace)
     result.on_cache_hit(on_cache_hit)
     result.on_cache_miss(on_cache_miss)
+    result.on_cache_coalesced(on_cache_coalesced)
     return result
@@ -0,0 +1,124 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A process-wide pool of the HTTP clients used by the OpenAI clients."""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from functools import cache
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+_HttpClientKey = tuple[str | None, str | None, bool, int]
+
+_lock = threading.Lock()
+_async_clients: dict[_HttpClientKey, httpx.AsyncClient] = {}
+_sync_clients: dict[_HttpClientKey, httpx.Client] = {}
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Keep one connection pool per event loop.
+
+    Connections cannot be used outside the event loop they were opened in, and the
+    CLIs run several event loops one after the other.
+    """
+
+    _options: dict
+    _transports: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+    ]
+
+    def __init__(self, **options):
+        self._options = options
+        self._transports = weakref.WeakKeyDictionary()
+
+    def _transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(**self._options)
+            self._transports[loop] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+def _key(
+    api_base: str | None, proxy: str | None, http2: bool, max_connections: int
+) -> _HttpClientKey:
+    return (api_base, proxy, http2 and _supports_http2(), max_connections)
+
+
+def _transport_options(key: _HttpClientKey) -> dict:
+    _, proxy, http2, max_connections = key
+    return {
+        "proxy": httpx.Proxy(proxy) if proxy else None,
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        ),
+    }
+
+
+@cache
+def _supports_http2() -> bool:
+    if importlib.util.find_spec("h2") is None:
+        log.warning("HTTP/2 requires the graphrag[http2] extra, using HTTP/1.1")
+        return False
+    return True
+
+
+def get_async_http_client(
+    api_base: str | None = None,
+    proxy: str | None = None,
+    http2: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> httpx.AsyncClient:
+    """Get the async HTTP client of an endpoint, shared by all the OpenAI clients.
+
+    The API key is sent with each request, so clients with different keys share the
+    connections to an endpoint.
+    """
+    key = _key(api_base, proxy, http2, max_connections)
+    with _lock:
+        if key not in _async_clients:
+            log.info("creating async HTTP client for %s", api_base or "openai")
+            _async_clients[key] = httpx.AsyncClient(
+                transport=_LoopLocalTransport(**_transport_options(key)),
+                follow_redirects=True,
+            )
+        return _async_clients[key]
+
+
+def get_sync_http_client(
+    api_base: str | None = None,
+    proxy: str | None = None,
+    http2: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> httpx.Client:
+    """Get the sync HTTP client of an endpoint, shared by all the OpenAI clients."""
+    key = _key(api_base, proxy, http2, max_connections)
+    with _lock:
+        if key not in _sync_clients:
+            log.info("creating HTTP client for %s", api_base or "openai")
+            _sync_clients[key] = httpx.Client(
+                transport=httpx.HTTPTransport(**_transport_options(key)),
+                follow_redirects=True,
+            )
+        return _sync_clients[key]
@@ -0,0 +1,229 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""The Chat-based language model, submitting its requests to the batch API."""
+
+import asyncio
+import itertools
+import json
+import logging
+
+from openai import AsyncAzureOpenAI
+from typing_extensions import Unpack
+
+from graphrag.llm.types import (
+    CompletionInput,
+    CompletionLLM,
+    CompletionOutput,
+    LLMInput,
+)
+
+from .openai_chat_llm import OpenAIChatLLM
+from .openai_configuration import OpenAIConfiguration
+from .types import OpenAIClientTypes
+from .utils import get_completion_llm_args
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_REQUESTS = 10_000
+DEFAULT_POLL_INTERVAL = 30.0
+DEFAULT_COLLECT_WINDOW = 1.0
+COMPLETION_WINDOW = "24h"
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchRequestError(RuntimeError):
+    """A request of a batch failed, or the batch did not complete."""
+
+
+class OpenAIBatcher:
+    """Collect chat completion requests and submit them as batch jobs.
+
+    Requests are collected until none has arrived for a short window, or the batch
+    is full, then written to a JSONL file, uploaded, and submitted to the batch API.
+    The batch is polled until it ends, and each request is answered with its result.
+    """
+
+    _client: OpenAIClientTypes
+    _endpoint: str
+    _max_requests: int
+    _poll_interval: float
+    _collect_window: float
+    _ids: itertools.count
+    _pending: list[tuple[str, dict, asyncio.Future[dict]]]
+    _timer: asyncio.TimerHandle | None
+    _tasks: set[asyncio.Task]
+
+    def __init__(
+        self,
+        client: OpenAIClientTypes,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        collect_window: float = DEFAULT_COLLECT_WINDOW,
+    ):
+        """Create a batcher.
+
+        Args:
+            - client - The OpenAI client.
+            - max_requests - The maximum number of requests in a batch.
+            - poll_interval - The number of seconds between two status checks of a batch.
+            - collect_window - The number of seconds without a new request after which a batch is submitted.
+        """
+        self._client = client
+        self._endpoint = (
+            "/chat/completions"
+            if isinstance(client, AsyncAzureOpenAI)
+            else "/v1/chat/completions"
+        )
+        self._max_requests = max_requests
+        self._poll_interval = poll_interval
+        self._collect_window = collect_window
+        self._ids = itertools.count()
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def submit(self, body: dict) -> dict:
+        """Add a request to the next batch, and wait for its response body."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((f"request-{next(self._ids)}", body, future))
+        if self._timer is not None:
+            self._timer.cancel()
+        if len(self._pending) >= self._max_requests:
+            self._start_batch()
+        else:
+            self._timer = loop.call_later(self._collect_window, self._start_batch)
+        return await future
+
+    def _start_batch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if len(pending) == 0:
+            return
+
+        task = asyncio.create_task(self._run_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, pending: list[tuple[str, dict, asyncio.Future[dict]]]
+    ) -> None:
+        try:
+            results = await self._execute_batch([
+                (custom_id, body) for custom_id, body, _ in pending
+            ])
+        except Exception as e:
+            log.exception("batch of %d requests failed", len(pending))
+            results = {}
+            error = e
+        else:
+            error = BatchRequestError("the batch ended without a result")
+
+        for custom_id, _, future in pending:
+            if future.done():
+                continue
+            result = results.get(custom_id, error)
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _execute_batch(
+        self, requests: list[tuple[str, dict]]
+    ) -> dict[str, dict | Exception]:
+        data = "".join(
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": self._endpoint,
+                "body": body,
+            })
+            + "\n"
+            for custom_id, body in requests
+        )
+        input_file = await self._client.files.create(
+            file=("batch.jsonl", data.encode("utf-8")), purpose="batch"
+        )
+        batch = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self._endpoint,  # type: ignore
+            completion_window=COMPLETION_WINDOW,
+        )
+        log.info("submitted batch %s with %d requests", batch.id, len(requests))
+
+        while batch.status not in _TERMINAL_STATUSES:
+            await asyncio.sleep(self._poll_interval)
+            batch = await self._client.batches.retrieve(batch.id)
+            log.debug(
+                "batch %s is %s: %s", batch.id, batch.status, batch.request_counts
+            )
+        log.info("batch %s is %s: %s", batch.id, batch.status, batch.request_counts)
+
+        results: dict[str, dict | Exception] = {}
+        for file_id in [batch.output_file_id, batch.error_file_id]:
+            if file_id is None:
+                continue
+            content = await self._client.files.content(file_id)
+            for line in content.text.splitlines():
+                if line.strip():
+                    custom_id, result = _parse_result(json.loads(line))
+                    results[custom_id] = result
+        return results
+
+
+def _parse_result(line: dict) -> tuple[str, dict | Exception]:
+    custom_id = line["custom_id"]
+    response = line.get("response") or {}
+    if line.get("error") is not None or response.get("status_code") != 200:
+        error = line.get("error") or response.get("body")
+        return custom_id, BatchRequestError(f"batch request failed: {error}")
+    return custom_id, response["body"]
+
+
+class OpenAIBatchChatLLM(OpenAIChatLLM):
+    """A Chat-based LLM that submits its requests to the batch API.
+
+    Requests that fail in a batch, or whose batch expires, are sent to the fallback
+    LLM, usually the rate limited interactive LLM.
+    """
+
+    _batcher: OpenAIBatcher
+    _fallback: CompletionLLM
+
+    def __init__(
+        self,
+        client: OpenAIClientTypes,
+        configuration: OpenAIConfiguration,
+        batcher: OpenAIBatcher,
+        fallback: CompletionLLM,
+    ):
+        """Init method definition."""
+        super().__init__(client, configuration)
+        self._batcher = batcher
+        self._fallback = fallback
+
+    async def _execute_llm(
+        self, input: CompletionInput, **kwargs: Unpack[LLMInput]
+    ) -> CompletionOutput | None:
+        args = get_completion_llm_args(
+            kwargs.get("model_parameters"), self.configuration
+        )
+        if isinstance(self.client, AsyncAzureOpenAI):
+            # the batch API routes requests by deployment name
+            args["model"] = self.configuration.deployment_name or args.get("model")
+        history = kwargs.get("history") or []
+        messages = [
+            *history,
+            {"role": "user", "content": input},
+        ]
+        try:
+            completion = await self._batcher.submit({"messages": messages, **args})
+        except Exception as e:  # noqa: BLE001
+            log.warning("batch request failed, retrying interactively: %s", e)
+            result = await self._fallback(input, **{**kwargs, "json": False})
+            return result.output
+        return completion["choices"][0]["message"]["content"]
@@ -13,6 +13,7 @@ from graphrag.llm.types import (
     CompletionOutput,
     LLMInput,
     LLMOutput,
+    OnOutputChunkFn,
 )
 
 from ._prompts import JSON_CHECK_PROMPT
@@ -50,11 +51,36 @@ class OpenAIChatLLM(BaseLLM[CompletionInput, CompletionOutput]):
             *history,
             {"role": "user", "content": input},
         ]
+        on_output_chunk = kwargs.get("on_output_chunk")
+        if on_output_chunk is not None:
+            return await self._stream_llm(messages, args, on_output_chunk)
+
         completion = await self.client.chat.completions.create(
             messages=messages, **args
         )
         return completion.choices[0].message.content
 
+    async def _stream_llm(
+        self, messages: list[dict], args: dict, on_output_chunk: OnOutputChunkFn
+    ) -> CompletionOutput:
+        stream = await self.client.chat.completions.create(
+            messages=messages,  # type: ignore
+            stream=True,
+            **args,
+        )
+        chunks: list[str] = []
+        try:
+            async for chunk in stream:
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content:
+                    chunks.append(content)
+                    if on_output_chunk(content):
+                        break
+        finally:
+            # stop the generation if the handler has seen enough
+            await stream.close()
+        return "".join(chunks)
+
     async def _invoke_json(
         self,
         input: CompletionInput,
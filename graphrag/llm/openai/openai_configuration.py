@@ -56,7 +56,16 @@ class OpenAIConfiguration(Hashable, LLMConfig):
     # Custom Configuration
     _tokens_per_minute: int | None
     _requests_per_minute: int | None
+    _minute_aligned_rate_limits: bool | None
+    _rate_limiter_type: str | None
+    _http2: bool | None
+    _max_connections: int | None
+    _batch_mode: bool | None
+    _batch_max_requests: int | None
+    _batch_poll_interval: float | None
     _concurrent_requests: int | None
+    _adaptive_concurrency: bool | None
+    _max_concurrent_requests: int | None
     _encoding_model: str | None
     _sleep_on_rate_limit_recommendation: bool | None
 
@@ -120,7 +129,16 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         self._model_supports_json = lookup_bool("model_supports_json")
         self._tokens_per_minute = lookup_int("tokens_per_minute")
         self._requests_per_minute = lookup_int("requests_per_minute")
+        self._minute_aligned_rate_limits = lookup_bool("minute_aligned_rate_limits")
+        self._rate_limiter_type = lookup_str("rate_limiter_type")
+        self._http2 = lookup_bool("http2")
+        self._max_connections = lookup_int("max_connections")
+        self._batch_mode = lookup_bool("batch_mode")
+        self._batch_max_requests = lookup_int("batch_max_requests")
+        self._batch_poll_interval = lookup_float("batch_poll_interval")
         self._concurrent_requests = lookup_int("concurrent_requests")
+        self._adaptive_concurrency = lookup_bool("adaptive_concurrency")
+        self._max_concurrent_requests = lookup_int("max_concurrent_requests")
         self._encoding_model = lookup_str("encoding_model")
         self._max_retry_wait = lookup_float("max_retry_wait")
         self._sleep_on_rate_limit_recommendation = lookup_bool(
@@ -245,11 +263,56 @@ class OpenAIConfiguration(Hashable, LLMConfig):
         """Requests per minute property definition."""
         return self._requests_per_minute
 
+    @property
+    def minute_aligned_rate_limits(self) -> bool | None:
+        """Whether the rate limits reset at the start of each minute."""
+        return self._minute_aligned_rate_limits
+
+    @property
+    def rate_limiter_type(self) -> str | None:
+        """Rate limiter type property definition."""
+        return self._rate_limiter_type
+
+    @property
+    def http2(self) -> bool | None:
+        """Whether to use HTTP/2."""
+        return self._http2
+
+    @property
+    def max_connections(self) -> int | None:
+        """Maximum number of pooled connections property definition."""
+        return self._max_connections
+
+    @property
+    def batch_mode(self) -> bool | None:
+        """Whether to submit the requests to the batch API."""
+        return self._batch_mode
+
+    @property
+    def batch_max_requests(self) -> int | None:
+        """Maximum number of requests in a batch property definition."""
+        return self._batch_max_requests
+
+    @property
+    def batch_poll_interval(self) -> float | None:
+        """Batch poll interval property definition."""
+        return self._batch_poll_interval
+
     @property
     def concurrent_requests(self) -> int | None:
         """Concurrent requests property definition."""
         return self._concurrent_requests
 
+    @property
+    def adaptive_concurrency(self) -> bool | None:
+        """Whether the number of concurrent requests adapts to the service."""
+        return self._adaptive_concurrency
+
+    @property
+    def max_concurrent_requests(self) -> int | None:
+        """Maximum number of concurrent requests when the concurrency is adaptive."""
+        return self._max_concurrent_requests
+
     @property
     def encoding_model(self) -> str | None:
         """Encoding model property definition."""
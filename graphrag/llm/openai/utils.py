@@ -9,39 +9,35 @@ import re
 from collections.abc import Callable
 from typing import Any
 
-import tiktoken
 from json_repair import repair_json
 from openai import (
     APIConnectionError,
+    APITimeoutError,
     InternalServerError,
     RateLimitError,
 )
 
+from graphrag.utils.tokens import count_tokens, get_encoding
+
 from .openai_configuration import OpenAIConfiguration
 
 DEFAULT_ENCODING = "cl100k_base"
 
-_encoders: dict[str, tiktoken.Encoding] = {}
-
 RETRYABLE_ERRORS: list[type[Exception]] = [
     RateLimitError,
     APIConnectionError,
     InternalServerError,
 ]
 RATE_LIMIT_ERRORS: list[type[Exception]] = [RateLimitError]
+OVERLOAD_ERRORS: list[type[Exception]] = [RateLimitError, APITimeoutError]
 
 log = logging.getLogger(__name__)
 
 
 def get_token_counter(config: OpenAIConfiguration) -> Callable[[str], int]:
     """Get a function that counts the number of tokens in a string."""
-    model = config.encoding_model or "cl100k_base"
-    enc = _encoders.get(model)
-    if enc is None:
-        enc = tiktoken.get_encoding(model)
-        _encoders[model] = enc
-
-    return lambda s: len(enc.encode(s))
+    enc = get_encoding(config.encoding_model or DEFAULT_ENCODING)
+    return lambda s: count_tokens(s, enc)
 
 
 def perform_variable_replacements(
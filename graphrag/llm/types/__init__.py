@@ -10,6 +10,7 @@ from .llm_callbacks import (
     IsResponseValidFn,
     LLMInvocationFn,
     OnCacheActionFn,
+    OnOutputChunkFn,
 )
 from .llm_config import LLMConfig
 from .llm_invocation_result import LLMInvocationResult
@@ -43,4 +44,5 @@ __all__ = [
     "LLMInvocationResult",
     "LLMOutput",
     "OnCacheActionFn",
+    "OnOutputChunkFn",
 ]
@@ -18,3 +18,6 @@ OnCacheActionFn = Callable[[str, str | None], None]
 
 IsResponseValidFn = Callable[[dict], bool]
 """A function that checks if an LLM response is valid."""
+
+OnOutputChunkFn = Callable[[str], bool]
+"""Handler for streamed output chunks, returns True to stop reading the stream."""
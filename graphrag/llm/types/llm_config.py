@@ -33,3 +33,18 @@ class LLMConfig(Protocol):
     def requests_per_minute(self) -> int | None:
         """Get the number of requests per minute."""
         ...
+
+    @property
+    def minute_aligned_rate_limits(self) -> bool | None:
+        """Get whether the rate limits reset at the start of each minute."""
+        ...
+
+    @property
+    def rate_limiter_type(self) -> str | None:
+        """Get the rate limiter type, 'local' or 'shared'."""
+        ...
+
+    @property
+    def max_tokens(self) -> int | None:
+        """Get the maximum number of output tokens."""
+        ...
@@ -33,3 +33,6 @@ class LLMInvocationResult(Generic[T]):
 
     output_tokens: int
     """The number of output tokens."""
+
+    concurrency_limit: int | None = None
+    """The concurrency limit after the invocation, when it is adaptive."""
@@ -8,7 +8,7 @@ from typing import Generic, TypeVar
 
 from typing_extensions import NotRequired, TypedDict
 
-from .llm_callbacks import IsResponseValidFn
+from .llm_callbacks import IsResponseValidFn, OnOutputChunkFn
 
 
 class LLMInput(TypedDict):
@@ -32,6 +32,9 @@ class LLMInput(TypedDict):
     model_parameters: NotRequired[dict]
     """Additional model parameters to use in the LLM invocation."""
 
+    on_output_chunk: NotRequired[OnOutputChunkFn]
+    """If set, the output is streamed and each chunk is passed to this handler. LLMs that cannot stream, and cached outputs, skip it."""
+
 
 T = TypeVar("T")
 
@@ -3,7 +3,6 @@
 
 """Query Factory methods to support CLI."""
 
-import tiktoken
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
 from graphrag.config import (
@@ -30,6 +29,7 @@ from graphrag.query.structured_search.local_search.mixed_context import (
     LocalSearchMixedContext,
 )
 from graphrag.query.structured_search.local_search.search import LocalSearch
+from graphrag.utils.tokens import get_encoding
 from graphrag.vector_stores import BaseVectorStore
 
 
@@ -66,6 +66,9 @@ def get_llm(config: GraphRagConfig) -> ChatOpenAI:
         api_version=config.llm.api_version,
         max_retries=config.llm.max_retries,
         request_timeout=config.llm.request_timeout,
+        proxy=config.llm.proxy,
+        http2=config.llm.http2,
+        max_connections=config.llm.max_connections,
     )
 
 
@@ -98,6 +101,9 @@ def get_text_embedder(config: GraphRagConfig) -> OpenAIEmbedding:
         deployment_name=config.embeddings.llm.deployment_name,
         api_version=config.embeddings.llm.api_version,
         max_retries=config.embeddings.llm.max_retries,
+        proxy=config.embeddings.llm.proxy,
+        http2=config.embeddings.llm.http2,
+        max_connections=config.embeddings.llm.max_connections,
     )
 
 
@@ -114,7 +120,7 @@ def get_local_search_engine(
     """Create a local search engine based on data + configuration."""
     llm = get_llm(config)
     text_embedder = get_text_embedder(config)
-    token_encoder = tiktoken.get_encoding(config.encoding_model)
+    token_encoder = get_encoding(config.encoding_model)
 
     ls_config = config.local_search
 
@@ -163,7 +169,7 @@ def get_global_search_engine(
     response_type: str,
 ) -> BaseSearch:
     """Create a global search engine based on data + configuration."""
-    token_encoder = tiktoken.get_encoding(config.encoding_model)
+    token_encoder = get_encoding(config.encoding_model)
     gs_config = config.global_search
 
     return GlobalSearch(
@@ -8,6 +8,11 @@ from collections.abc import Callable
 
 from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
 
+from graphrag.llm.openai.http_client_pool import (
+    DEFAULT_MAX_CONNECTIONS,
+    get_async_http_client,
+    get_sync_http_client,
+)
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.typing import OpenaiApiType
 from graphrag.query.progress import ConsoleStatusReporter, StatusReporter
@@ -101,6 +106,9 @@ class OpenAILLMImpl(BaseOpenAILLM):
         max_retries: int = 10,
         request_timeout: float = 180.0,
         reporter: StatusReporter | None = None,
+        proxy: str | None = None,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         self.api_key = api_key
         self.azure_ad_token_provider = azure_ad_token_provider
@@ -111,6 +119,9 @@ class OpenAILLMImpl(BaseOpenAILLM):
         self.organization = organization
         self.max_retries = max_retries
         self.request_timeout = request_timeout
+        self.proxy = proxy
+        self.http2 = http2
+        self.max_connections = max_connections
         self.reporter = reporter or ConsoleStatusReporter()
 
         try:
@@ -125,6 +136,15 @@ class OpenAILLMImpl(BaseOpenAILLM):
 
     def _create_openai_client(self):
         """Create a new OpenAI client instance."""
+        # the clients share the pooled connections of their endpoint
+        http_client_options = {
+            "api_base": self.api_base,
+            "proxy": self.proxy,
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+        }
+        sync_http_client = get_sync_http_client(**http_client_options)
+        async_http_client = get_async_http_client(**http_client_options)
         if self.api_type == OpenaiApiType.AzureOpenAI:
             if self.api_base is None:
                 msg = "api_base is required for Azure OpenAI"
@@ -141,6 +161,7 @@ class OpenAILLMImpl(BaseOpenAILLM):
                 # Retry Configuration
                 timeout=self.request_timeout,
                 max_retries=self.max_retries,
+                http_client=sync_http_client,
             )
 
             async_client = AsyncAzureOpenAI(
@@ -154,6 +175,7 @@ class OpenAILLMImpl(BaseOpenAILLM):
                 # Retry Configuration
                 timeout=self.request_timeout,
                 max_retries=self.max_retries,
+                http_client=async_http_client,
             )
             self.set_clients(sync_client=sync_client, async_client=async_client)
 
@@ -165,6 +187,7 @@ class OpenAILLMImpl(BaseOpenAILLM):
                 # Retry Configuration
                 timeout=self.request_timeout,
                 max_retries=self.max_retries,
+                http_client=sync_http_client,
             )
 
             async_client = AsyncOpenAI(
@@ -174,6 +197,7 @@ class OpenAILLMImpl(BaseOpenAILLM):
                 # Retry Configuration
                 timeout=self.request_timeout,
                 max_retries=self.max_retries,
+                http_client=async_http_client,
             )
             self.set_clients(sync_client=sync_client, async_client=async_client)
 
@@ -15,6 +15,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from graphrag.llm.openai.http_client_pool import DEFAULT_MAX_CONNECTIONS
 from graphrag.query.llm.base import BaseLLM, BaseLLMCallback
 from graphrag.query.llm.oai.base import OpenAILLMImpl
 from graphrag.query.llm.oai.typing import (
@@ -43,6 +44,9 @@ class ChatOpenAI(BaseLLM, OpenAILLMImpl):
         request_timeout: float = 180.0,
         retry_error_types: tuple[type[BaseException]] = OPENAI_RETRY_ERROR_TYPES,  # type: ignore
         reporter: StatusReporter | None = None,
+        proxy: str | None = None,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         OpenAILLMImpl.__init__(
             self=self,
@@ -56,6 +60,9 @@ class ChatOpenAI(BaseLLM, OpenAILLMImpl):
             max_retries=max_retries,
             request_timeout=request_timeout,
             reporter=reporter,
+            proxy=proxy,
+            http2=http2,
+            max_connections=max_connections,
         )
         self.model = model
         self.retry_error_types = retry_error_types
@@ -8,7 +8,6 @@ from collections.abc import Callable
 from typing import Any
 
 import numpy as np
-import tiktoken
 from tenacity import (
     AsyncRetrying,
     RetryError,
@@ -18,6 +17,7 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from graphrag.llm.openai.http_client_pool import DEFAULT_MAX_CONNECTIONS
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.query.llm.oai.base import OpenAILLMImpl
 from graphrag.query.llm.oai.typing import (
@@ -26,6 +26,7 @@ from graphrag.query.llm.oai.typing import (
 )
 from graphrag.query.llm.text_utils import chunk_text
 from graphrag.query.progress import StatusReporter
+from graphrag.utils.tokens import get_encoding
 
 
 class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
@@ -47,6 +48,9 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
         request_timeout: float = 180.0,
         retry_error_types: tuple[type[BaseException]] = OPENAI_RETRY_ERROR_TYPES,  # type: ignore
         reporter: StatusReporter | None = None,
+        proxy: str | None = None,
+        http2: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
     ):
         OpenAILLMImpl.__init__(
             self=self,
@@ -60,12 +64,15 @@ class OpenAIEmbedding(BaseTextEmbedding, OpenAILLMImpl):
             max_retries=max_retries,
             request_timeout=request_timeout,
             reporter=reporter,
+            proxy=proxy,
+            http2=http2,
+            max_connections=max_connections,
         )
 
         self.model = model
         self.encoding_name = encoding_name
         self.max_tokens = max_tokens
-        self.token_encoder = tiktoken.get_encoding(self.encoding_name)
+        self.token_encoder = get_encoding(self.encoding_name)
         self.retry_error_types = retry_error_types
 
     def embed(self, text: str, **kwargs: Any) -> list[float]:
@@ -8,12 +8,12 @@ from itertools import islice
 
 import tiktoken
 
+from graphrag.utils.tokens import count_tokens, get_encoding
+
 
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
     """Return the number of tokens in the given text."""
-    if token_encoder is None:
-        token_encoder = tiktoken.get_encoding("cl100k_base")
-    return len(token_encoder.encode(text))  # type: ignore
+    return count_tokens(text, token_encoder)
 
 
 def batched(iterable: Iterator, n: int):
@@ -36,7 +36,7 @@ def chunk_text(
 ):
     """Chunk text by token length."""
     if token_encoder is None:
-        token_encoder = tiktoken.get_encoding("cl100k_base")
+        token_encoder = get_encoding()
     tokens = token_encoder.encode(text)  # type: ignore
     chunk_iterator = batched(iter(tokens), max_tokens)
     yield from (token_encoder.decode(list(chunk)) for chunk in chunk_iterator)
@@ -0,0 +1,148 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""A shared registry of tiktoken encodings, with memoized token counts."""
+
+import logging
+import threading
+from collections import OrderedDict
+from functools import cache
+
+import tiktoken
+
+DEFAULT_ENCODING_NAME = "cl100k_base"
+DEFAULT_TOKEN_COUNT_CACHE_SIZE = 10_000
+DEFAULT_NUM_THREADS = 8
+# below this many characters, starting a thread pool costs more than it saves
+MIN_BATCH_ENCODE_CHARS = 16_384
+
+log = logging.getLogger(__name__)
+
+
+@cache
+def get_encoding(encoding_name: str | None = None) -> tiktoken.Encoding:
+    """Get an encoding by name, each encoding is built once per process."""
+    return tiktoken.get_encoding(encoding_name or DEFAULT_ENCODING_NAME)
+
+
+@cache
+def get_encoding_for_model(
+    model: str, fallback_encoding_name: str | None = None
+) -> tiktoken.Encoding:
+    """Get the encoding of a model.
+
+    If the model is unknown, the fallback encoding is used when given, otherwise a
+    KeyError is raised.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        if fallback_encoding_name is None:
+            raise
+        log.warning(
+            "Failed to get encoding for %s, falling back to encoding %s",
+            model,
+            fallback_encoding_name,
+        )
+        return get_encoding(fallback_encoding_name)
+
+
+class _TokenCountCache:
+    """A thread-safe, bounded LRU of token counts keyed by the hash of a string."""
+
+    _max_size: int
+    _counts: OrderedDict[tuple[str, int, int], int]
+    _lock: threading.Lock
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._counts = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def get(self, key: tuple[str, int, int]) -> int | None:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+            return count
+
+    def set(self, key: tuple[str, int, int], count: int) -> None:
+        with self._lock:
+            self._counts[key] = count
+            self._counts.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._counts) > self._max_size:
+            self._counts.popitem(last=False)
+
+
+_token_counts = _TokenCountCache(DEFAULT_TOKEN_COUNT_CACHE_SIZE)
+
+
+def set_token_count_cache_size(max_size: int) -> None:
+    """Set the number of memoized token counts. 0 disables memoization."""
+    _token_counts.resize(max_size)
+
+
+def _count_key(text: str, encoding: tiktoken.Encoding) -> tuple[str, int, int]:
+    return (encoding.name, len(text), hash(text))
+
+
+def count_tokens(text: str, encoding: tiktoken.Encoding | None = None) -> int:
+    """Return the number of tokens in a text string."""
+    encoding = encoding or get_encoding()
+    if not _token_counts.enabled:
+        return len(encoding.encode(text))
+
+    key = _count_key(text, encoding)
+    count = _token_counts.get(key)
+    if count is None:
+        count = len(encoding.encode(text))
+        _token_counts.set(key, count)
+    return count
+
+
+def count_tokens_batch(
+    texts: list[str],
+    encoding: tiktoken.Encoding | None = None,
+    num_threads: int = DEFAULT_NUM_THREADS,
+) -> list[int]:
+    """Return the number of tokens of each text string.
+
+    Strings without a memoized count are encoded together on a thread pool, unless
+    they are too short to be worth it.
+    """
+    encoding = encoding or get_encoding()
+    counts: list[int | None] = [None] * len(texts)
+    keys = [_count_key(text, encoding) for text in texts]
+    if _token_counts.enabled:
+        counts = [_token_counts.get(key) for key in keys]
+
+    missing = [index for index, count in enumerate(counts) if count is None]
+    if (
+        len(missing) == 1
+        or sum(len(texts[index]) for index in missing) < MIN_BATCH_ENCODE_CHARS
+    ):
+        for index in missing:
+            counts[index] = len(encoding.encode(texts[index]))
+    else:
+        encoded = encoding.encode_batch(
+            [texts[index] for index in missing], num_threads=num_threads
+        )
+        for index, tokens in zip(missing, encoded, strict=True):
+            counts[index] = len(tokens)
+
+    if _token_counts.enabled:
+        for index in missing:
+            _token_counts.set(keys[index], counts[index])  # type: ignore
+    return counts  # type: ignore
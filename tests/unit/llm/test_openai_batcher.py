@@ -0,0 +1,97 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from graphrag.llm.openai.openai_batch_chat_llm import BatchRequestError, OpenAIBatcher
+
+
+class FakeClient:
+    """An OpenAI client answering the batch API from memory."""
+
+    def __init__(self, statuses: list[str]):
+        self.input = ""
+        self.statuses = statuses
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(
+            create=self._create_batch, retrieve=self._retrieve_batch
+        )
+
+    async def _create_file(self, file, purpose):
+        self.input = file[1].decode("utf-8")
+        return SimpleNamespace(id="input-file")
+
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        return self._batch()
+
+    async def _retrieve_batch(self, batch_id):
+        return self._batch()
+
+    def _batch(self):
+        return SimpleNamespace(
+            id="batch",
+            status=self.statuses.pop(0),
+            request_counts=None,
+            output_file_id="output-file",
+            error_file_id="error-file",
+        )
+
+    async def _content(self, file_id):
+        requests = [json.loads(line) for line in self.input.splitlines()]
+        if file_id == "output-file":
+            lines = [
+                {
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {"echo": request["body"]["messages"]},
+                    },
+                }
+                for request in requests[:-1]
+            ]
+        else:
+            lines = [
+                {
+                    "custom_id": requests[-1]["custom_id"],
+                    "response": {"status_code": 400, "body": {"error": "bad"}},
+                }
+            ]
+        return SimpleNamespace(text="\n".join(json.dumps(line) for line in lines))
+
+
+def test_execute_batch_answers_each_request():
+    client = FakeClient(["validating", "in_progress", "completed"])
+    batcher = OpenAIBatcher(client, poll_interval=0)  # type: ignore
+
+    results = asyncio.run(
+        batcher._execute_batch([
+            ("request-0", {"messages": ["a"]}),
+            ("request-1", {"messages": ["b"]}),
+            ("request-2", {"messages": ["c"]}),
+        ])
+    )
+
+    submitted = [json.loads(line) for line in client.input.splitlines()]
+    assert [request["url"] for request in submitted] == ["/v1/chat/completions"] * 3
+    assert results["request-0"] == {"echo": ["a"]}
+    assert results["request-1"] == {"echo": ["b"]}
+    assert isinstance(results["request-2"], BatchRequestError)
+    assert client.statuses == []
+
+
+def test_submit_resolves_the_futures_of_a_batch():
+    client = FakeClient(["completed"])
+    batcher = OpenAIBatcher(client, collect_window=0)  # type: ignore
+
+    async def submit_all():
+        return await asyncio.gather(
+            batcher.submit({"messages": ["a"]}),
+            batcher.submit({"messages": ["b"]}),
+            return_exceptions=True,
+        )
+
+    first, second = asyncio.run(submit_all())
+    assert first == {"echo": ["a"]}
+    assert isinstance(second, BatchRequestError)